@@ -0,0 +1,122 @@
+# ARQUIVO: benchmarks/common.py
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Coleta metadados da máquina/revisão, grava resultados em JSON e compara
+duas execuções (mesma máquina, revisões diferentes).
+"""
+
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+THEMES = ["Animais", "Espaço", "Matemática", "Química", "Bandeiras"]
+DIFFICULTIES = ["Fácil", "Médio", "Difícil"]
+
+
+def collect_metadata() -> Dict:
+    """
+    Reúne informações para identificar a execução.
+
+    Returns:
+        Dicionário com revisão git, versão do Python, plataforma e data
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = "desconhecida"
+
+    return {
+        "revision": revision,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "timestamp": int(time.time()),
+    }
+
+
+def synthetic_scores(entries: int, seed: int) -> List[Dict]:
+    """
+    Gera registros de score determinísticos (mesma semente → mesmos dados).
+
+    Args:
+        entries: Quantidade de registros
+        seed: Semente do gerador
+
+    Returns:
+        Lista no formato gravado pelo ScoreRepository
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Jogador{rng.randint(1, 200)}",
+            "score": rng.randint(0, 5000),
+            "theme": rng.choice(THEMES),
+            "difficulty": rng.choice(DIFFICULTIES),
+            "date": f"{rng.randint(1, 28):02}/{rng.randint(1, 12):02} 10:00",
+        }
+        for _ in range(entries)
+    ]
+
+
+def save_results(path: str, results: Dict) -> None:
+    """
+    Grava os resultados em JSON.
+
+    Args:
+        path: Caminho do arquivo de saída
+        results: Dicionário {"meta": ..., "scenarios": ...}
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict:
+    """Lê um arquivo de resultados gravado por ``save_results``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict, current: Dict, metric: str, threshold: float
+) -> list[str]:
+    """
+    Compara duas execuções cenário a cenário.
+
+    Args:
+        baseline: Resultados de referência
+        current: Resultados da revisão atual
+        metric: Chave numérica de cada cenário (quanto maior, mais lento)
+        threshold: Razão atual/referência a partir da qual há regressão
+
+    Returns:
+        Lista com os nomes dos cenários que regrediram
+    """
+    if baseline["meta"].get("machine") != current["meta"].get("machine"):
+        print("⚠️ Resultados de máquinas diferentes; a comparação é apenas indicativa.")
+
+    regressions = []
+    for name, scenario in current["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if not reference or not reference.get(metric):
+            continue
+
+        ratio = scenario[metric] / reference[metric]
+        flag = "❌" if ratio > threshold else "✅"
+        print(
+            f"{flag} {name:<28} {reference[metric]:>10.4f} → "
+            f"{scenario[metric]:>10.4f}  ({ratio:.2f}x)"
+        )
+        if ratio > threshold:
+            regressions.append(name)
+
+    return regressions
@@ -0,0 +1,265 @@
+# ARQUIVO: benchmarks/domain_bench.py
+"""
+Microbenchmarks da camada de domínio e do repositório de scores.
+
+Mede (com ``time.perf_counter``, no estilo do ``timeit``) Board.reset,
+cada GameStrategy.generate_cards, sequências de GameService.pick_card,
+Board.all_matched, as operações do ScoreRepository com 100, 10k e 1M
+scores armazenados e o histórico em colunas (montagem a partir dos
+registros e agregações de 10M linhas, estas só com NumPy). Os arquivos
+de score são gerados de forma determinística e reaproveitados entre
+execuções (``--data-dir``).
+
+Uso:
+    python -m benchmarks.domain_bench --out bench_domain.json
+    python -m benchmarks.domain_bench --compare bench_domain.json --threshold 1.3
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.common import (
+    collect_metadata,
+    compare_results,
+    load_results,
+    save_results,
+    synthetic_scores,
+)
+from src.domain.board import Board
+from src.domain.strategies import ChemistryStrategy, EmojiStrategy, MathStrategy
+from src.infrastructure import score_columns
+from src.infrastructure.repository import ScoreRepository
+from src.infrastructure.score_columns import CATEGORIES, ScoreColumns
+from src.services.game_service import GameService
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+# Linhas do cenário de agregações em colunas
+COLUMN_ROWS = 10_000_000
+
+
+def measure(
+    fn: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    min_time: float = 0.2,
+    max_runs: int = 10_000,
+) -> dict:
+    """
+    Executa ``fn`` repetidamente até acumular ``min_time`` segundos.
+
+    Operações lentas (ex: 1M scores) rodam ao menos uma vez.
+
+    Args:
+        fn: Operação medida
+        setup: Preparação executada antes de cada chamada (fora da medição)
+        min_time: Tempo total mínimo de medição em segundos
+        max_runs: Limite de execuções
+
+    Returns:
+        Dicionário com runs, best_ms, median_ms e mean_ms
+    """
+    samples = []
+    total = 0.0
+    while total < min_time and len(samples) < max_runs:
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed * 1000)
+        total += elapsed
+
+    return {
+        "runs": len(samples),
+        "best_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+    }
+
+
+def _pick_sequence(board: Board) -> list:
+    """Sequência que resolve o tabuleiro errando uma vez a cada par."""
+    pairs: dict[str, list] = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            pairs.setdefault(board.grid[r][c].match_id, []).append((r, c))
+
+    groups = list(pairs.values())
+    picks = []
+    for i, (first, second) in enumerate(groups):
+        if i + 1 < len(groups):
+            picks.append((first, groups[i + 1][0]))
+        picks.append((first, second))
+    return picks
+
+
+def bench_domain(seed: int) -> dict:
+    """Mede tabuleiro, estratégias e regras de jogo."""
+    random.seed(seed)
+    results = {}
+
+    strategies = {
+        "emoji": EmojiStrategy("Animais"),
+        "math": MathStrategy(),
+        "chemistry": ChemistryStrategy(),
+    }
+    for name, strategy in strategies.items():
+        results[f"generate_cards_{name}_18"] = measure(
+            lambda s=strategy: s.generate_cards(18)
+        )
+
+    for rows, cols in [(4, 4), (6, 4), (6, 6)]:
+        board = Board(rows, cols, strategy=ChemistryStrategy())
+        results[f"board_reset_{rows}x{cols}"] = measure(board.reset)
+        results[f"all_matched_{rows}x{cols}"] = measure(lambda b=board: b.all_matched)
+
+        state = {}
+
+        def new_game(b=board):
+            b.reset()
+            state["service"] = GameService(b)
+            state["picks"] = _pick_sequence(b)
+
+        def play():
+            service = state["service"]
+            for pos1, pos2 in state["picks"]:
+                service.pick_card(*pos1)
+                if service.pick_card(*pos2) == "NO_MATCH":
+                    service.hide_cards(pos1, pos2)
+
+        results[f"pick_card_game_{rows}x{cols}"] = measure(play, setup=new_game)
+
+    return results
+
+
+def _prepare_scores(data_dir: str, entries: int, seed: int) -> str:
+    """Gera (uma única vez) o arquivo de scores sintético de um tamanho."""
+    path = os.path.join(data_dir, f"scores_{entries}_{seed}.json")
+    if not os.path.exists(path):
+        repository = ScoreRepository()
+        repository.FILE_PATH = path
+        data = synthetic_scores(entries, seed)
+        data.sort(key=lambda x: x["score"], reverse=True)
+        repository._save_file(data)
+    return path
+
+
+def bench_repository(sizes: tuple, seed: int, data_dir: str) -> dict:
+    """Mede save_score, get_top_scores e get_statistics por tamanho."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for entries in sizes:
+            source = _prepare_scores(data_dir, entries, seed)
+            work = os.path.join(tmp, f"scores_{entries}.json")
+            shutil.copyfile(source, work)
+
+            repository = ScoreRepository()
+            repository.FILE_PATH = work
+
+            results[f"get_top_scores_{entries}"] = measure(
+                lambda: repository.get_top_scores(10)
+            )
+            results[f"get_top_scores_filtered_{entries}"] = measure(
+                lambda: repository.get_top_scores(
+                    10, difficulty_filter="Médio", theme_filter="Química"
+                )
+            )
+            results[f"get_statistics_{entries}"] = measure(repository.get_statistics)
+            loaded = repository._load_file()
+            results[f"columns_from_entries_{entries}"] = measure(
+                lambda: ScoreColumns.from_entries(loaded)
+            )
+            results[f"save_score_{entries}"] = measure(
+                lambda: repository.save_score("Bench", 1234, "Química", "Médio"),
+                setup=lambda: shutil.copyfile(source, work),
+            )
+    return results
+
+
+def bench_columns(seed: int, rows: int = COLUMN_ROWS) -> dict:
+    """Mede as agregações do Dashboard sobre ``rows`` partidas (NumPy)."""
+    np = score_columns.np
+    if np is None:
+        return {}
+    labels = {k: [f"{k}{i}" for i in range(7)] for k in CATEGORIES}
+    rng = np.random.default_rng(seed)
+    codes = {k: rng.integers(0, 7, rows, dtype=np.int32) for k in CATEGORIES}
+    columns = ScoreColumns(rng.integers(0, 2000, rows), np.zeros(rows), codes, labels)
+
+    def aggregate():
+        columns.statistics()
+        columns.player_averages()
+
+    return {f"columns_aggregate_{rows}": measure(aggregate)}
+
+
+def run(sizes: tuple, seed: int, data_dir: str) -> dict:
+    """
+    Executa todos os microbenchmarks.
+
+    Returns:
+        Dicionário {"meta": ..., "scenarios": ...}
+    """
+    scenarios = bench_domain(seed)
+    scenarios.update(bench_repository(sizes, seed, data_dir))
+    scenarios.update(bench_columns(seed))
+
+    meta = collect_metadata()
+    meta.update({"seed": seed, "sizes": list(sizes)})
+    return {"meta": meta, "scenarios": scenarios}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks do domínio")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Quantidades de scores armazenados (separadas por vírgula)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "memory_game_bench"),
+        help="Onde guardar os arquivos de score sintéticos",
+    )
+    parser.add_argument("--out", help="Arquivo JSON de saída")
+    parser.add_argument("--compare", help="JSON de referência para comparar")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.3,
+        help="Razão de mediana acima da qual o benchmark falha",
+    )
+    args = parser.parse_args()
+
+    sizes = tuple(int(s) for s in args.sizes.split(",") if s)
+    os.makedirs(args.data_dir, exist_ok=True)
+    results = run(sizes, args.seed, args.data_dir)
+
+    for name, scenario in results["scenarios"].items():
+        print(
+            f"{name:<36} {scenario['median_ms']:>12.4f} ms "
+            f"(melhor {scenario['best_ms']:.4f}, {scenario['runs']} execuções)"
+        )
+
+    if args.out:
+        save_results(args.out, results)
+
+    if args.compare:
+        regressions = compare_results(
+            load_results(args.compare), results, "median_ms", args.threshold
+        )
+        if regressions:
+            print(f"❌ {len(regressions)} regressão(ões) acima de {args.threshold}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
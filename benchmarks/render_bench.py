@@ -0,0 +1,332 @@
+# ARQUIVO: benchmarks/render_bench.py
+"""
+Benchmark de renderização headless (driver de vídeo "dummy" do SDL).
+
+Executa as telas do jogo fora da tela, reproduzindo sequências de
+cliques roteirizadas em tabuleiros 4x4, 6x4 e 6x6, e mede FPS e o tempo
+de cada fase do frame com o FrameProfiler.
+
+Uso:
+    python -m benchmarks.render_bench --out bench_render.json
+    python -m benchmarks.render_bench --compare bench_render.json
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+import pygame
+
+from benchmarks.common import (
+    collect_metadata,
+    compare_results,
+    load_results,
+    save_results,
+    synthetic_scores,
+)
+from src.domain.board import Board
+from src.domain.strategies import ChemistryStrategy, EmojiStrategy
+from src.infrastructure.repository import ScoreRepository
+from src.infrastructure.telemetry import FrameProfiler
+from src.services.game_service import GameService
+from src.ui.components import AdvancedParticleSystem
+from src.ui.gui import GraphicUI
+from src.ui.menu import MenuUI
+from src.ui.ranking import RankingUI
+from src.ui.statistics import StatisticsUI
+from src.ui.styles import DIMENSIONS
+
+MENU_SIZE = (900, 750)
+BOARDS = [(4, 4), (6, 4), (6, 6)]
+
+
+def _allow_cursor_changes() -> None:
+    """O driver dummy não cria cursores de sistema; ignora essas chamadas."""
+    set_cursor = pygame.mouse.set_cursor
+
+    def safe_set_cursor(*args):
+        try:
+            set_cursor(*args)
+        except pygame.error:
+            pass
+
+    pygame.mouse.set_cursor = safe_set_cursor
+
+
+def _click(pos: tuple) -> pygame.event.Event:
+    """Cria um evento de clique com o botão esquerdo."""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+
+def _window_size(rows: int, cols: int, card_size: int) -> tuple:
+    """Replica o cálculo de janela de GameManager.start_game."""
+    req_width = (cols * (card_size + DIMENSIONS["gap"])) + 100
+    req_height = (
+        DIMENSIONS["header_height"] + (rows * (card_size + DIMENSIONS["gap"])) + 120
+    )
+    return max(MENU_SIZE[0], req_width), max(MENU_SIZE[1], req_height)
+
+
+def _scripted_picks(board: Board, rng: random.Random, error_rate: float) -> list:
+    """
+    Gera a sequência de cliques de um jogador que às vezes erra.
+
+    Args:
+        board: Tabuleiro já embaralhado
+        rng: Gerador determinístico
+        error_rate: Probabilidade de errar antes de acertar cada par
+
+    Returns:
+        Lista de posições (row, col) na ordem dos cliques
+    """
+    pairs: dict[str, list] = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            pairs.setdefault(board.grid[r][c].match_id, []).append((r, c))
+
+    remaining = list(pairs.values())
+    rng.shuffle(remaining)
+    picks = []
+    while remaining:
+        first, second = remaining.pop()
+        if remaining and rng.random() < error_rate:
+            wrong = rng.choice(remaining)[0]
+            picks += [first, wrong]
+        picks += [first, second]
+    return picks
+
+
+def _summarize(profiler: FrameProfiler, elapsed: float) -> dict:
+    """Converte a janela do profiler no formato gravado em JSON."""
+    phases = {
+        name: {"p50": p50, "p95": p95, "p99": p99}
+        for name, (p50, p95, p99) in profiler.summary().items()
+    }
+    return {
+        "frames": len(profiler.frames),
+        "fps": len(profiler.frames) / elapsed if elapsed else 0.0,
+        "frame_p50_ms": phases["total"]["p50"],
+        "frame_p95_ms": phases["total"]["p95"],
+        "phases": phases,
+    }
+
+
+def bench_game(rows: int, cols: int, frames: int, seed: int) -> dict:
+    """
+    Joga uma partida completa no GraphicUI e continua no Game Over.
+
+    Um clique é enviado a cada 3 frames; erros são escondidos logo no
+    frame seguinte (sem esperar o atraso de 1s do jogo).
+    """
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    card_size = 85 if rows >= 6 else DIMENSIONS["card_size"]
+    screen = pygame.display.set_mode(_window_size(rows, cols, card_size))
+
+    strategy = ChemistryStrategy() if rows * cols > 16 else EmojiStrategy("Animais")
+    theme = "Química" if isinstance(strategy, ChemistryStrategy) else "Animais"
+    service = GameService(Board(rows, cols, strategy=strategy))
+
+    profiler = FrameProfiler(window=frames)
+    ui = GraphicUI(service, card_size=card_size, profiler=profiler)
+    ui.screen = screen
+    ui.set_theme(theme)
+
+    picks = _scripted_picks(service.board, rng, error_rate=0.3)
+    start = time.perf_counter()
+    for frame in range(frames):
+        profiler.begin_frame()
+
+        profiler.start("events")
+        if ui.waiting_to_hide:
+            ui.hide_timestamp -= 1000
+        elif picks and frame % 3 == 0:
+            r, c = picks.pop(0)
+            ui.handle_click(_click(ui._get_card_rect(r, c).center))
+        profiler.stop("events")
+
+        with profiler.phase("update"):
+            ui.update()
+        ui.draw()
+
+        with profiler.phase("flip"):
+            pygame.display.flip()
+        profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    result = _summarize(profiler, elapsed)
+    result["completed"] = service.board.all_matched
+    return result
+
+
+def _bench_screen(draw, frames: int, clicks: dict | None = None) -> dict:
+    """Mede uma tela simples (desenho completo por frame)."""
+    screen = pygame.display.set_mode(MENU_SIZE)
+    profiler = FrameProfiler(window=frames)
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        profiler.begin_frame()
+        if clicks and frame in clicks:
+            with profiler.phase("events"):
+                clicks[frame]()
+        with profiler.phase("screen"):
+            draw(screen)
+        with profiler.phase("flip"):
+            pygame.display.flip()
+        profiler.end_frame()
+    return _summarize(profiler, time.perf_counter() - start)
+
+
+def bench_menu(frames: int) -> dict:
+    """Alterna entre seleção de tema e dificuldade."""
+    menu = MenuUI()
+    clicks = {
+        f: (menu.switch_to_difficulty if (f // 50) % 2 == 0 else menu.reset)
+        for f in range(0, frames, 50)
+    }
+    return _bench_screen(menu.draw, frames, clicks)
+
+
+def _synthetic_repository(path: str, entries: int, seed: int) -> ScoreRepository:
+    """Cria um repositório num arquivo temporário com scores sintéticos."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = path
+    repository._save_file(synthetic_scores(entries, seed))
+    return repository
+
+
+def bench_ranking(frames: int, repository: ScoreRepository) -> dict:
+    """Desenha o ranking trocando de filtro periodicamente."""
+    ranking = RankingUI(repository)
+    filters = [f["value"] for f in ranking.diff_filters]
+
+    def next_filter(i=[0]):
+        i[0] += 1
+        ranking.difficulty_filter = filters[i[0] % len(filters)]
+
+    clicks = {f: next_filter for f in range(0, frames, 40)}
+    return _bench_screen(ranking.draw, frames, clicks)
+
+
+def bench_ranking_scroll(frames: int, repository: ScoreRepository) -> dict:
+    """Rola o ranking completo com a roda do mouse (3 linhas por frame)."""
+    ranking = RankingUI(repository)
+    wheel = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)
+    end = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_END)
+
+    def draw(screen):
+        ranking.handle_scroll(wheel)
+        ranking.draw(screen)
+
+    # Metade do caminho, salta para o fim do ranking
+    clicks = {frames // 2: lambda: ranking.handle_scroll(end)}
+    return _bench_screen(draw, frames, clicks)
+
+
+def bench_statistics(frames: int, repository: ScoreRepository) -> dict:
+    """Desenha o dashboard de estatísticas."""
+    return _bench_screen(StatisticsUI(repository).draw, frames)
+
+
+def bench_particles(frames: int, seed: int) -> dict:
+    """Dispara todos os efeitos de partícula em sequência."""
+    random.seed(seed)
+    particles = AdvancedParticleSystem()
+    effects = [
+        particles.sparkle,
+        particles.firework,
+        particles.rainbow_burst,
+        particles.confetti,
+    ]
+    clicks = {
+        f: (lambda e=effects[(f // 20) % len(effects)]: e(450, 375))
+        for f in range(0, frames, 20)
+    }
+
+    def draw(screen):
+        screen.fill((0, 0, 0))
+        particles.update_and_draw(screen)
+
+    return _bench_screen(draw, frames, clicks)
+
+
+def run(frames: int, seed: int, score_entries: int) -> dict:
+    """
+    Executa todos os cenários.
+
+    Returns:
+        Dicionário {"meta": ..., "scenarios": ...}
+    """
+    pygame.init()
+    _allow_cursor_changes()
+    pygame.display.set_mode(MENU_SIZE)
+
+    scenarios = {}
+    for rows, cols in BOARDS:
+        scenarios[f"game_{rows}x{cols}"] = bench_game(rows, cols, frames, seed)
+    scenarios["menu"] = bench_menu(frames)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repository = _synthetic_repository(
+            os.path.join(tmp, "scores.json"), score_entries, seed
+        )
+        scenarios["ranking"] = bench_ranking(frames, repository)
+        scenarios["ranking_scroll"] = bench_ranking_scroll(frames, repository)
+        scenarios["statistics"] = bench_statistics(frames, repository)
+
+    scenarios["particles"] = bench_particles(frames, seed)
+    pygame.quit()
+
+    meta = collect_metadata()
+    meta.update({"frames": frames, "seed": seed, "score_entries": score_entries})
+    return {"meta": meta, "scenarios": scenarios}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de renderização headless")
+    parser.add_argument("--frames", type=int, default=300, help="Frames por cenário")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--scores", type=int, default=1000, help="Scores sintéticos no ranking"
+    )
+    parser.add_argument("--out", help="Arquivo JSON de saída")
+    parser.add_argument("--compare", help="JSON de referência para comparar")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Razão de frame p50 acima da qual há regressão",
+    )
+    args = parser.parse_args()
+
+    results = run(args.frames, args.seed, args.scores)
+
+    for name, scenario in results["scenarios"].items():
+        print(
+            f"{name:<12} {scenario['fps']:>8.1f} FPS  "
+            f"p50 {scenario['frame_p50_ms']:.2f} ms  "
+            f"p95 {scenario['frame_p95_ms']:.2f} ms"
+        )
+
+    if args.out:
+        save_results(args.out, results)
+
+    if args.compare:
+        regressions = compare_results(
+            load_results(args.compare), results, "frame_p50_ms", args.threshold
+        )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,14 @@
+import argparse
+
 from src.manager import GameManager
 
 if __name__ == "__main__":
-    game = GameManager()
+    parser = argparse.ArgumentParser(description="Memória Pythônica")
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Arquiva as partidas antigas do ranking ao abrir o jogo",
+    )
+    args = parser.parse_args()
+    game = GameManager(compact_on_start=args.compact)
     game.run()
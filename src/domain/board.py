@@ -1,31 +1,61 @@
 # src/domain/board.py
-from typing import List, Optional
+import random
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
 from src.domain.card import Card
 from src.domain.strategies import EmojiStrategy, GameStrategy
 
 
+@contextmanager
+def _seeded_random(seed: int) -> Iterator[None]:
+    """Semeia o gerador global durante o bloco e restaura o estado depois."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
 class Board:
-    def __init__(self, rows: int, cols: int, strategy: GameStrategy = None):
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        strategy: GameStrategy = None,
+        seed: Optional[int] = None,
+    ):
         if (rows * cols) % 2 != 0:
             raise ValueError("O número total de cartas deve ser par!")
 
         self.rows = rows
         self.cols = cols
         self.grid: List[List[Card]] = []
+        self.seed: Optional[int] = None
 
         # Se nenhuma estratégia for passada, usa o padrão (Emojis de Animais)
         self.strategy = strategy if strategy else EmojiStrategy(theme="Animais")
 
-        self.reset()
+        self.reset(seed=seed)
 
-    def reset(self, new_strategy: GameStrategy = None) -> None:
-        """Reinicia o jogo, opcionalmente trocando a estratégia/tema."""
+    def reset(
+        self, new_strategy: GameStrategy = None, seed: Optional[int] = None
+    ) -> None:
+        """
+        Reinicia o jogo, opcionalmente trocando a estratégia/tema.
+
+        A distribuição é gerada a partir de ``seed`` (sorteada se None),
+        guardada em ``self.seed`` para que a partida possa ser reproduzida.
+        """
         if new_strategy:
             self.strategy = new_strategy
 
+        self.seed = seed if seed is not None else random.randrange(2**32)
+
         num_pairs = (self.rows * self.cols) // 2
-        cards = self.strategy.generate_cards(num_pairs)
+        with _seeded_random(self.seed):
+            cards = self.strategy.generate_cards(num_pairs)
 
         # Preenche a grid (transforma lista linear em matriz)
         self.grid = []
@@ -0,0 +1,256 @@
+# ARQUIVO: src/domain/solver.py
+"""
+Solver de jogada ótima e estimador de dificuldade.
+
+Calcula, por programação dinâmica sobre o estado (cartas conhecidas sem
+par, cartas nunca vistas), o número esperado de jogadas, de erros e a
+pontuação esperada de um jogador que joga de forma ótima:
+
+- com memória perfeita (lembra de toda carta já vista); ou
+- com memória limitada (lembra no máximo ``memory`` cartas sem par; ao
+  exceder, esquece as mais antigas, que voltam a ser desconhecidas).
+
+Como o jogador não conhece a distribuição, o resultado depende apenas do
+número de pares (e do estado atual), não de onde cada carta caiu. As
+tabelas são universais e ficam em cache por modelo de memória: com memória
+limitada (o modelo do multiplicador), um 20x20 é resolvido em poucos
+milissegundos; com memória perfeita a tabela cresce com o quadrado do
+número de cartas e a primeira de 20x20 leva cerca de 0,1 s. Depois é só
+consulta.
+
+As dificuldades do menu mantêm os multiplicadores de antes do solver
+(``LEGACY_MULTIPLIERS``): o ranking compara pontuações de uma mesma
+dificuldade, e trocar o multiplicador tornaria o histórico incomparável.
+O multiplicador do solver vale só para tamanhos sem histórico.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.board import Board
+
+# Pontuação (espelha GameService.pick_card)
+MATCH_POINTS = 100
+MISMATCH_PENALTY = 20
+
+# Capacidade de memória do jogador humano modelo (cartas sem par)
+HUMAN_MEMORY = 7
+
+# Multiplicadores das dificuldades do menu (rows, cols), fixos desde o
+# início do ranking
+LEGACY_MULTIPLIERS: Dict[Tuple[int, int], float] = {
+    (4, 4): 1.0,
+    (6, 4): 1.5,
+    (6, 6): 2.0,
+}
+
+# Valores por estado: (jogadas, erros, A, B), onde a soma esperada dos
+# combos futuros com combo atual c é A + c * B (B = acertos até o 1º erro)
+_Values = Tuple[float, float, float, float]
+
+# Cache de tabelas por modelo de memória (None = memória perfeita)
+_TABLES: Dict[Optional[int], List[Dict[int, _Values]]] = {}
+
+
+@dataclass(frozen=True)
+class BoardRating:
+    """Resultado da avaliação de um tabuleiro."""
+
+    pairs: int
+    memory: Optional[int]
+    expected_moves: float
+    expected_mismatches: float
+    expected_score: float
+
+    @property
+    def efficiency(self) -> float:
+        """Jogadas esperadas por par (1.0 seria acertar tudo de primeira)."""
+        return self.expected_moves / self.pairs if self.pairs else 0.0
+
+
+def _cap(known: int, unknown: int, memory: Optional[int]) -> Tuple[int, int]:
+    """Aplica o limite de memória: o excedente volta a ser desconhecido."""
+    if memory is not None and known > memory:
+        return memory, unknown + (known - memory)
+    return known, unknown
+
+
+def _state_values(
+    k: int, u: int, memory: Optional[int], table: List[Dict[int, _Values]]
+) -> _Values:
+    """
+    Calcula os valores do estado (k, u) a partir dos estados já resolvidos.
+
+    A primeira carta virada é sempre desconhecida; a segunda pode ser
+    desconhecida ou (opção defensiva) uma carta já conhecida. Fica com a
+    opção de menos jogadas esperadas. As transições estão escritas por
+    extenso (sem listas de opções) porque este é o laço quente da tabela.
+    """
+    p_known = k / u
+    p_new = 1 - p_known
+
+    # 1ª carta completa um par conhecido: acerto
+    moves = mismatches = a = b = 0.0
+    if k:
+        n_moves, n_mismatches, n_a, n_b = table[u - 1][k - 1]
+        moves = p_known * (1 + n_moves)
+        mismatches = p_known * n_mismatches
+        a = p_known * (1 + n_a + n_b)
+        b = p_known * (1 + n_b)
+    if not p_new:
+        return moves, mismatches, a, b
+
+    # Segunda carta desconhecida: acerto por sorte, erro que revela um par
+    # (acertado na jogada seguinte) ou erro com duas cartas novas
+    r = u - 1
+    p_match = p_new / r
+    p_reveal = p_new * k / r
+    p_miss = p_new * (r - 1 - k) / r
+    n_moves, n_mismatches, n_a, n_b = table[u - 2][k]
+    u_moves = moves + p_match * (1 + n_moves) + p_reveal * (2 + n_moves)
+    u_mismatches = mismatches + p_match * n_mismatches
+    u_mismatches += p_reveal * (1 + n_mismatches)
+    u_a = a + p_match * (1 + n_a + n_b) + p_reveal * (1 + n_a + n_b)
+    u_b = b + p_match * (1 + n_b)
+    loop = 0.0
+    if p_miss > 0:
+        nk, nu = _cap(k + 2, u - 2, memory)
+        if (nk, nu) == (k, u):
+            # Memória cheia: o erro leva de volta ao mesmo estado
+            loop = p_miss
+            u_mismatches += p_miss
+        else:
+            n_moves, n_mismatches, n_a, _ = table[nu][nk]
+            u_moves += p_miss * (1 + n_moves)
+            u_mismatches += p_miss * (1 + n_mismatches)
+            u_a += p_miss * n_a
+    stay = 1 - loop
+    best = ((u_moves + loop) / stay, u_mismatches / stay, u_a / stay, u_b)
+
+    # Segunda carta conhecida: erro garantido, mas não revela informação nova
+    if k and (memory is None or k < memory):
+        n_moves, n_mismatches, n_a, _ = table[u - 1][k + 1]
+        k_moves = moves + p_new * (1 + n_moves)
+        if k_moves < best[0]:
+            best = (
+                k_moves,
+                mismatches + p_new * (1 + n_mismatches),
+                a + p_new * n_a,
+                b,
+            )
+    return best
+
+
+def _table(memory: Optional[int], unknown: int) -> List[Dict[int, _Values]]:
+    """
+    Retorna a tabela de valores até ``unknown`` cartas desconhecidas.
+
+    A tabela é construída de baixo para cima (menos cartas primeiro) e
+    estendida sob demanda; ``table[u][k]`` é o valor do estado (k, u).
+    """
+    table = _TABLES.setdefault(memory, [{0: (0.0, 0.0, 0.0, 0.0)}])
+    for u in range(len(table), unknown + 1):
+        row: Dict[int, _Values] = {}
+        table.append(row)
+        max_known = u if memory is None else min(u, memory)
+        for k in range(u % 2, max_known + 1, 2):
+            row[k] = _state_values(k, u, memory, table)
+    return table
+
+
+def solve(
+    pairs: int,
+    known: int = 0,
+    memory: Optional[int] = None,
+    difficulty_multiplier: float = 1.0,
+) -> BoardRating:
+    """
+    Avalia uma partida com ``pairs`` pares restantes.
+
+    Args:
+        pairs: Pares ainda não encontrados
+        known: Cartas sem par que o jogador já viu
+        memory: Capacidade de memória (None = perfeita)
+        difficulty_multiplier: Multiplicador de pontuação da partida
+
+    Returns:
+        BoardRating com jogadas, erros e pontuação esperados. A pontuação
+        ignora o piso de 0 aplicado pelo GameService.
+    """
+    if memory is not None and memory < 1:
+        raise ValueError("A memória do jogador deve ser de pelo menos 1 carta.")
+
+    known, unknown = _cap(known, 2 * pairs - known, memory)
+    moves, mismatches, combos, _ = _table(memory, unknown)[unknown][known]
+    score = MATCH_POINTS * difficulty_multiplier * combos - (
+        MISMATCH_PENALTY * mismatches
+    )
+    return BoardRating(pairs, memory, moves, mismatches, score)
+
+
+def rate_board(
+    board: Board,
+    memory: Optional[int] = None,
+    difficulty_multiplier: float = 1.0,
+) -> BoardRating:
+    """
+    Avalia um tabuleiro a partir do seu estado atual.
+
+    Cartas reveladas e ainda sem par contam como conhecidas.
+
+    Args:
+        board: Tabuleiro
+        memory: Capacidade de memória do jogador (None = perfeita)
+        difficulty_multiplier: Multiplicador de pontuação
+
+    Returns:
+        BoardRating
+    """
+    cards = [card for row in board.grid for card in row if not card.is_matched]
+    known = sum(1 for card in cards if card.is_revealed)
+    return solve(len(cards) // 2, known, memory, difficulty_multiplier)
+
+
+def fair_difficulty_multiplier(
+    rows: int,
+    cols: int,
+    reference: Tuple[int, int] = (4, 4),
+    memory: Optional[int] = HUMAN_MEMORY,
+) -> float:
+    """
+    Multiplicador proporcional ao esforço esperado em relação à referência.
+
+    Usa o modelo de memória limitada (mais próximo de um jogador humano):
+    um tabuleiro que exige o dobro de jogadas vale o dobro de pontos.
+
+    Args:
+        rows, cols: Dimensões do tabuleiro
+        reference: Tabuleiro com multiplicador 1.0
+        memory: Capacidade de memória do jogador modelo
+
+    Returns:
+        Multiplicador arredondado a 0.05
+    """
+    moves = solve((rows * cols) // 2, memory=memory).expected_moves
+    reference_moves = solve((reference[0] * reference[1]) // 2, memory=memory)
+    ratio = moves / reference_moves.expected_moves
+    return round(ratio * 20) / 20
+
+
+def score_multiplier(rows: int, cols: int) -> float:
+    """
+    Multiplicador de pontuação de uma partida nova.
+
+    Usa o valor histórico das dificuldades do menu (mantém o ranking
+    comparável) e o multiplicador justo do solver para os demais tamanhos.
+
+    Args:
+        rows, cols: Dimensões do tabuleiro
+
+    Returns:
+        Multiplicador
+    """
+    legacy = LEGACY_MULTIPLIERS.get((rows, cols))
+    if legacy is not None:
+        return legacy
+    return fair_difficulty_multiplier(rows, cols)
@@ -262,3 +262,20 @@ class ChemistryStrategy(GameStrategy):
 
         random.shuffle(cards)
         return cards
+
+
+def strategy_for_theme(theme: str) -> GameStrategy:
+    """
+    Retorna a estratégia correspondente a um tema do menu.
+
+    Args:
+        theme: Nome do tema (ex: "Matemática", "Animais")
+
+    Returns:
+        Estratégia de geração de cartas
+    """
+    if theme == "Matemática":
+        return MathStrategy()
+    if theme == "Química":
+        return ChemistryStrategy()
+    return EmojiStrategy(theme=theme)
@@ -0,0 +1,170 @@
+# ARQUIVO: src/infrastructure/autosave.py
+"""
+Salvamento automático da partida em andamento.
+
+O AutosaveWriter grava em segundo plano (write-behind): ``submit`` só
+guarda os bytes mais recentes e acorda a thread de escrita, então nunca
+bloqueia o frame. Se várias jogadas chegarem antes de a gravação anterior
+terminar, apenas a última é escrita (coalescência). A escrita usa arquivo
+temporário + ``os.replace`` para nunca deixar um salvamento pela metade.
+
+Formato do arquivo::
+
+    b"MGV1" | varint(tamanho do cabeçalho) | cabeçalho JSON | retrato
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from src.infrastructure.replay_store import decode_varint, encode_varint
+from src.infrastructure.snapshot import decode_snapshot, encode_snapshot
+from src.services.game_service import GameService
+
+MAGIC = b"MGV1"
+
+# Valor especial da fila: apagar o salvamento
+_DELETE = object()
+
+
+def encode_save(service: GameService, header: Dict) -> bytes:
+    """
+    Codifica um salvamento.
+
+    Args:
+        service: Partida em andamento
+        header: Informações livres (jogador, tema, par a esconder...)
+
+    Returns:
+        Bytes do arquivo
+    """
+    data = json.dumps(header, ensure_ascii=False, separators=(",", ":"))
+    data = data.encode("utf-8")
+    return MAGIC + encode_varint(len(data)) + data + encode_snapshot(service)
+
+
+def decode_save(data: bytes) -> Tuple[Dict, GameService]:
+    """
+    Decodifica um salvamento de ``encode_save``.
+
+    Returns:
+        Tupla (cabeçalho, partida)
+
+    Raises:
+        ValueError: Se os dados forem inválidos
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Salvamento inválido (assinatura incorreta).")
+    try:
+        size, offset = decode_varint(data, len(MAGIC))
+        header = json.loads(data[offset : offset + size].decode("utf-8"))
+        return header, decode_snapshot(data[offset + size :])
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Salvamento corrompido: {e}") from e
+
+
+def load_save(path: str) -> Optional[Tuple[Dict, GameService]]:
+    """
+    Lê o salvamento de ``path``.
+
+    Returns:
+        Tupla (cabeçalho, partida) ou None se não existir ou estiver corrompido
+    """
+    try:
+        with open(path, "rb") as f:
+            return decode_save(f.read())
+    except (OSError, ValueError) as e:
+        if os.path.exists(path):
+            print(f"Erro ao carregar salvamento: {e}")
+        return None
+
+
+class AutosaveWriter:
+    """Grava salvamentos numa thread própria, sempre o mais recente."""
+
+    def __init__(self, path: str):
+        """
+        Inicia a thread de escrita.
+
+        Args:
+            path: Arquivo do salvamento
+        """
+        self.path = path
+        self.writes = 0  # Gravações efetivamente feitas (para diagnóstico)
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="autosave", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def has_save(self) -> bool:
+        """True se existe um salvamento (gravado ou a caminho do disco)."""
+        with self._condition:
+            if self._pending is not None:
+                return self._pending is not _DELETE
+        return os.path.exists(self.path)
+
+    def submit(self, data: bytes) -> None:
+        """Agenda a gravação de ``data`` (substitui qualquer pendente)."""
+        with self._condition:
+            self._pending = data
+            self._condition.notify()
+
+    def clear(self) -> None:
+        """Agenda a remoção do salvamento (partida terminada)."""
+        self.submit(_DELETE)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera as gravações pendentes.
+
+        Returns:
+            True se tudo foi gravado dentro do prazo
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Grava o que estiver pendente e encerra a thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending is not None or self._closed
+                )
+                if self._pending is None:
+                    return
+                data, self._pending = self._pending, None
+                self._busy = True
+
+            try:
+                self._write(data)
+            except OSError as e:
+                print(f"Erro no salvamento automático: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, data) -> None:
+        if data is _DELETE:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+        self.writes += 1
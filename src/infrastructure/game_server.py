@@ -0,0 +1,504 @@
+# ARQUIVO: src/infrastructure/game_server.py
+"""
+Servidor de partidas em rede (asyncio).
+
+Hospeda salas com um tabuleiro compartilhado (MultiPlayerGameService) e
+aceita jogadas de vários clientes via TCP. O protocolo é uma mensagem
+JSON por linha::
+
+    cliente -> {"op": "join", "room": "sala1", "name": "Ana",
+                "rows": 4, "cols": 4, "theme": "Animais"}
+    servidor -> {"op": "welcome", "player": 0, "snapshot": {...}}
+    cliente -> {"op": "pick", "row": 1, "col": 2}
+    servidor -> {"op": "delta", "result": "MATCH", "cards": [...], ...}
+
+Depois do ``welcome`` (retrato completo da sala), os clientes recebem
+apenas deltas: as cartas que mudaram e os contadores do jogador afetado.
+A memória por sala é limitada: tabuleiro de no máximo 20x20, número
+máximo de jogadores (vagas de quem saiu são reaproveitadas), fila de saída
+de tamanho fixo por cliente (cliente lento demais é desconectado) e nenhum
+histórico guardado. A semente da distribuição nunca vem do cliente: quem
+cria a sala não consegue prever o tabuleiro.
+
+Uso:
+    python -m src.infrastructure.game_server --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+from src.domain.board import Board
+from src.domain.strategies import strategy_for_theme
+from src.services.multiplayer_service import MultiPlayerGameService
+
+# Estado de uma carta no protocolo (bits)
+CARD_REVEALED = 1
+CARD_MATCHED = 2
+
+HIDE_DELAY = 1.0  # segundos com o par errado à mostra (igual ao GraphicUI)
+MAX_SIDE = 20
+MAX_LINE = 4096  # bytes por mensagem recebida
+MAX_NAME = 20
+
+
+class RoomError(Exception):
+    """Jogada ou entrada recusada pela sala."""
+
+
+def encode_message(message: Dict) -> bytes:
+    """Serializa uma mensagem do protocolo (JSON compacto + quebra de linha)."""
+    data = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+    return (data + "\n").encode("utf-8")
+
+
+class ClientConnection:
+    """
+    Conexão de um cliente com fila de saída limitada.
+
+    ``send`` nunca bloqueia: as mensagens vão para a fila e uma tarefa
+    própria as escreve no socket. Se a fila encher, o cliente é desconectado.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int = 64):
+        self.writer = writer
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.closed = False
+        self._task = asyncio.create_task(self._sender())
+
+    def send(self, data: bytes) -> None:
+        """Enfileira bytes para envio."""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self.close()
+
+    async def _sender(self) -> None:
+        try:
+            while True:
+                data = await self.queue.get()
+                if data is None:
+                    break
+                self.writer.write(data)
+                await self.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.writer.close()
+
+    def close(self) -> None:
+        """Encerra a conexão (mensagens ainda na fila são descartadas)."""
+        if not self.closed:
+            self.closed = True
+            self._task.cancel()
+
+    async def aclose(self, timeout: float = 1.0) -> None:
+        """Envia o que falta na fila (até ``timeout``) e encerra a conexão."""
+        if not self.closed:
+            self.closed = True
+            try:
+                self.queue.put_nowait(None)
+            except asyncio.QueueFull:
+                self._task.cancel()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+
+class Room:
+    """Uma partida compartilhada entre os clientes de uma sala."""
+
+    def __init__(
+        self,
+        room_id: str,
+        rows: int,
+        cols: int,
+        theme: str = "Animais",
+        seed: Optional[int] = None,
+        max_players: int = 30,
+        hide_delay: float = HIDE_DELAY,
+    ):
+        """
+        Cria a sala e distribui as cartas.
+
+        Args:
+            room_id: Identificador da sala
+            rows, cols: Dimensões do tabuleiro
+            theme: Tema das cartas
+            seed: Semente da distribuição (sorteada se None)
+            max_players: Limite de jogadores na sala
+            hide_delay: Segundos até esconder um par errado
+
+        Raises:
+            RoomError: Se o tabuleiro não puder ser criado
+        """
+        if not (2 <= rows <= MAX_SIDE and 2 <= cols <= MAX_SIDE):
+            raise RoomError(f"Tabuleiro deve ter entre 2 e {MAX_SIDE} de lado.")
+        try:
+            board = Board(rows, cols, strategy=strategy_for_theme(theme), seed=seed)
+        except ValueError as e:
+            raise RoomError(str(e)) from e
+
+        self.room_id = room_id
+        self.theme = theme
+        self.max_players = max_players
+        self.hide_delay = hide_delay
+        self.board = board
+        self.service: Optional[MultiPlayerGameService] = None
+        self.clients: Dict[int, ClientConnection] = {}
+        self.pending_hide: Optional[Tuple[Tuple[int, int], Tuple[int, int]]] = None
+        self._hide_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def empty(self) -> bool:
+        return not self.clients
+
+    def join(self, client: ClientConnection, name: str) -> int:
+        """
+        Adiciona um jogador à sala.
+
+        O limite vale para jogadores conectados; ver ``_free_slot``.
+
+        Returns:
+            Índice do jogador
+
+        Raises:
+            RoomError: Se a sala estiver cheia
+        """
+        if self.service is None:
+            self.service = MultiPlayerGameService(self.board, [name])
+            index = 0
+        elif len(self.clients) >= self.max_players:
+            raise RoomError("Sala cheia.")
+        else:
+            service = self.service
+            index = self._free_slot(name)
+            self.broadcast(
+                {
+                    "op": "player",
+                    "player": index,
+                    "name": name,
+                    "score": service.scores[index],
+                    "moves": service.player_moves[index],
+                    "combo": service.combos[index],
+                }
+            )
+
+        self.clients[index] = client
+        return index
+
+    def _free_slot(self, name: str) -> int:
+        """
+        Vaga para um jogador que entra numa sala já criada.
+
+        Quem volta com o mesmo nome recupera a própria vaga (e os pontos).
+        Enquanto houver espaço, entra no fim da ordem de turnos; depois,
+        ocupa a vaga de alguém que saiu, com os contadores zerados. Assim a
+        sala nunca passa de ``max_players`` vagas, por mais que os clientes
+        entrem e saiam.
+        """
+        service = self.service
+        departed = [i for i in range(len(service.players)) if i not in self.clients]
+        for index in departed:
+            if service.players[index] == name:
+                return index
+        if len(service.players) < self.max_players:
+            return service.add_player(name)
+
+        index = departed[0]
+        service.players[index] = name
+        for counters in (
+            service.scores,
+            service.player_moves,
+            service.combos,
+            service.pairs_found,
+        ):
+            counters[index] = 0
+        return index
+
+    def leave(self, index: int) -> None:
+        """Remove a conexão de um jogador (a vez passa adiante se for dele)."""
+        self.clients.pop(index, None)
+        if self.empty:
+            if self._hide_handle is not None:
+                self._hide_handle.cancel()
+            return
+        if self.service.current_player == index and self.pending_hide is None:
+            if self.service.first_selected_pos is not None:
+                # Desfaz a primeira carta virada por quem saiu
+                self.board.get_card(*self.service.first_selected_pos).hide()
+                changed = [self.service.first_selected_pos]
+                self.service.first_selected_pos = None
+            else:
+                changed = []
+            self._skip_disconnected(force=True)
+            self.broadcast(self._delta("TURN", changed, index))
+
+    def _skip_disconnected(self, force: bool = False) -> None:
+        """Passa a vez até chegar a um jogador conectado."""
+        service = self.service
+        if force:
+            service.advance_turn()
+        for _ in range(len(service.players)):
+            if service.current_player in self.clients:
+                return
+            service.advance_turn()
+
+    def _card_entry(self, row: int, col: int) -> list:
+        """Estado de uma carta: [linha, coluna, bits, conteúdo, match_id]."""
+        card = self.board.get_card(row, col)
+        flags = (CARD_REVEALED if card.is_revealed else 0) | (
+            CARD_MATCHED if card.is_matched else 0
+        )
+        # O conteúdo só vai para cartas visíveis e o match_id só para pares
+        # encontrados, para não entregar a resposta aos clientes
+        content = card.display_content if flags else None
+        match_id = card.match_id if card.is_matched else None
+        return [row, col, flags, content, match_id]
+
+    def _delta(self, result: str, cells, player: int) -> Dict:
+        service = self.service
+        return {
+            "op": "delta",
+            "result": result,
+            "cards": [self._card_entry(r, c) for r, c in cells],
+            "player": player,
+            "score": service.scores[player],
+            "moves": service.player_moves[player],
+            "combo": service.combos[player],
+            "turn": service.current_player,
+        }
+
+    def snapshot(self) -> Dict:
+        """Retrato completo da sala (enviado a quem entra)."""
+        board, service = self.board, self.service
+        elapsed = (service.end_time or time.time()) - service.start_time
+        return {
+            "room": self.room_id,
+            "rows": board.rows,
+            "cols": board.cols,
+            "theme": self.theme,
+            "cards": [
+                self._card_entry(r, c)[2:]
+                for r in range(board.rows)
+                for c in range(board.cols)
+            ],
+            "players": list(service.players),
+            "scores": list(service.scores),
+            "moves": list(service.player_moves),
+            "combos": list(service.combos),
+            "turn": service.current_player,
+            "first": service.first_selected_pos,
+            "elapsed_ms": int(elapsed * 1000),
+            "finished": service.end_time is not None,
+        }
+
+    def pick(self, index: int, row: int, col: int) -> str:
+        """
+        Aplica a jogada de um jogador e transmite o delta.
+
+        Returns:
+            Resultado de ``pick_card``
+
+        Raises:
+            RoomError: Se não for a vez do jogador ou a jogada for inválida
+        """
+        service = self.service
+        if self.board.all_matched:
+            raise RoomError("A partida terminou.")
+        if index != service.current_player:
+            raise RoomError("Não é sua vez.")
+        if self.pending_hide is not None:
+            raise RoomError("Aguarde as cartas serem escondidas.")
+
+        first = service.first_selected_pos
+        result = service.pick_card(row, col)
+        if result == "INVALID":
+            raise RoomError("Jogada inválida.")
+
+        cells = [(row, col)] if result != "MATCH" else [first, (row, col)]
+        self.broadcast(self._delta(result, cells, index))
+
+        if result == "NO_MATCH":
+            self.pending_hide = (first, (row, col))
+            loop = asyncio.get_running_loop()
+            self._hide_handle = loop.call_later(self.hide_delay, self._hide)
+        return result
+
+    def _hide(self) -> None:
+        """Esconde o par errado e libera a próxima jogada."""
+        first, second = self.pending_hide
+        self.pending_hide = None
+        self._hide_handle = None
+        player = (self.service.current_player - 1) % len(self.service.players)
+        self.service.hide_cards(first, second)
+        self._skip_disconnected()
+        self.broadcast(self._delta("HIDE", [first, second], player))
+
+    def broadcast(self, message: Dict) -> None:
+        """Envia uma mensagem a todos os clientes da sala."""
+        data = encode_message(message)
+        for client in list(self.clients.values()):
+            client.send(data)
+
+
+class GameServer:
+    """Servidor TCP que hospeda várias salas num único processo."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_rooms: int = 500,
+        max_players: int = 30,
+        queue_size: int = 64,
+        hide_delay: float = HIDE_DELAY,
+    ):
+        """
+        Configura o servidor.
+
+        Args:
+            host, port: Endereço de escuta (porta 0 = qualquer livre)
+            max_rooms: Limite de salas simultâneas
+            max_players: Limite de jogadores por sala
+            queue_size: Mensagens pendentes por cliente antes de desconectar
+            hide_delay: Segundos até esconder um par errado
+        """
+        self.host = host
+        self.port = port
+        self.max_rooms = max_rooms
+        self.max_players = max_players
+        self.queue_size = queue_size
+        self.hide_delay = hide_delay
+        self.rooms: Dict[str, Room] = {}
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._connections: set = set()
+
+    async def start(self) -> None:
+        """Começa a aceitar conexões (atualiza ``self.port`` se era 0)."""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Inicia (se necessário) e atende até ser cancelado."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Para de aceitar conexões e encerra as existentes."""
+        if self._server is not None:
+            self._server.close()
+        for client in list(self._connections):
+            client.close()
+        for room in self.rooms.values():
+            if room._hide_handle is not None:
+                room._hide_handle.cancel()
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _join(self, client: ClientConnection, hello: Dict) -> Tuple[Room, int]:
+        """Valida a mensagem de entrada e coloca o cliente numa sala."""
+        if hello.get("op") != "join":
+            raise RoomError("Primeira mensagem deve ser 'join'.")
+        room_id = str(hello.get("room", ""))[:32]
+        name = str(hello.get("name", "")).strip()[:MAX_NAME] or "Jogador"
+        if not room_id:
+            raise RoomError("Sala não informada.")
+
+        room = self.rooms.get(room_id)
+        if room is None:
+            if len(self.rooms) >= self.max_rooms:
+                raise RoomError("Servidor cheio.")
+            room = Room(
+                room_id,
+                int(hello.get("rows", 4)),
+                int(hello.get("cols", 4)),
+                theme=str(hello.get("theme", "Animais")),
+                max_players=self.max_players,
+                hide_delay=self.hide_delay,
+            )
+            self.rooms[room_id] = room
+        return room, room.join(client, name)
+
+    async def _read(self, reader: asyncio.StreamReader) -> Optional[Dict]:
+        """Lê a próxima mensagem (None se a conexão terminou)."""
+        line = await reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            raise ValueError("Mensagem deve ser um objeto JSON.")
+        return message
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        client = ClientConnection(writer, self.queue_size)
+        self._connections.add(client)
+        room: Optional[Room] = None
+        index = -1
+        try:
+            hello = await self._read(reader)
+            if hello is None:
+                return
+            room, index = self._join(client, hello)
+            client.send(
+                encode_message(
+                    {"op": "welcome", "player": index, "snapshot": room.snapshot()}
+                )
+            )
+
+            while not client.closed:
+                try:
+                    message = await self._read(reader)
+                except ValueError as e:
+                    client.send(encode_message({"op": "error", "message": str(e)}))
+                    continue
+                if message is None:
+                    break
+                if message.get("op") != "pick":
+                    continue
+                try:
+                    room.pick(index, int(message["row"]), int(message["col"]))
+                except (RoomError, KeyError, TypeError, ValueError) as e:
+                    client.send(encode_message({"op": "error", "message": str(e)}))
+
+        except (RoomError, ValueError, TypeError) as e:
+            client.send(encode_message({"op": "error", "message": str(e)}))
+        except ConnectionError:
+            pass
+        finally:
+            if room is not None and index >= 0:
+                room.leave(index)
+                if room.empty and self.rooms.get(room.room_id) is room:
+                    del self.rooms[room.room_id]
+            self._connections.discard(client)
+            await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Servidor de partidas em rede")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rooms", type=int, default=500)
+    args = parser.parse_args()
+
+    server = GameServer(args.host, args.port, max_rooms=args.max_rooms)
+    print(f"🌐 Servidor em {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# ARQUIVO: src/infrastructure/leaderboard.py
+"""
+Rankings de janela móvel (últimas 24 horas, últimos 7 dias).
+
+Cada RollingLeaderboard guarda só as partidas dentro da sua janela, em
+duas listas ordenadas: por pontuação (para o top-K) e por data (para
+expirar). Partidas novas entram com inserção binária; as que saíram da
+janela só são removidas quando alguém consulta (expiração preguiçosa).
+"""
+
+import math
+import time
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.infrastructure.score_columns import entry_timestamp
+
+# Períodos disponíveis e o tamanho da janela em segundos
+PERIODS = {"day": 24 * 3600, "week": 7 * 24 * 3600}
+
+
+class RollingLeaderboard:
+    """Partidas de uma janela móvel, ordenadas por pontuação."""
+
+    def __init__(self, window: float):
+        """
+        Args:
+            window: Tamanho da janela em segundos
+        """
+        self.window = window
+        self._seq = 0
+        # (-score, ts, seq): o primeiro item é o melhor, desempate pelo mais antigo
+        self._ranked: List[tuple] = []
+        self._by_time: List[tuple] = []  # (ts, seq, chave em _ranked)
+        self._entries: Dict[int, Dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._ranked)
+
+    def add(self, entry: Dict, ts: float, now: Optional[float] = None) -> None:
+        """Inclui uma partida jogada em ``ts`` (ignorada se já expirou)."""
+        now = time.time() if now is None else now
+        if ts < now - self.window:
+            return
+        self._seq += 1
+        key = (-entry["score"], ts, self._seq)
+        self._entries[self._seq] = entry
+        insort(self._ranked, key)
+        insort(self._by_time, (ts, self._seq, key))
+
+    def load(self, items: Iterable[tuple], now: Optional[float] = None) -> None:
+        """
+        Inclui várias partidas de uma vez (ordena uma única vez no fim).
+
+        Args:
+            items: Pares (registro, ts)
+        """
+        now = time.time() if now is None else now
+        for entry, ts in items:
+            if ts < now - self.window:
+                continue
+            self._seq += 1
+            key = (-entry["score"], ts, self._seq)
+            self._entries[self._seq] = entry
+            self._ranked.append(key)
+            self._by_time.append((ts, self._seq, key))
+        self._ranked.sort()
+        self._by_time.sort()
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Remove as partidas que saíram da janela."""
+        now = time.time() if now is None else now
+        cut = bisect_left(self._by_time, (now - self.window,))
+        if not cut:
+            return
+        for _, seq, key in self._by_time[:cut]:
+            del self._ranked[bisect_left(self._ranked, key)]
+            del self._entries[seq]
+        del self._by_time[:cut]
+
+    def top(
+        self,
+        limit: Optional[int] = 10,
+        difficulty: str = None,
+        theme: str = None,
+        now: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        Melhores partidas da janela.
+
+        Args:
+            limit: Quantidade máxima (None = todas)
+            difficulty, theme: Filtros opcionais
+            now: Instante de referência (padrão: agora)
+        """
+        self.expire(now)
+        result = []
+        for _, _, seq in self._ranked:
+            entry = self._entries[seq]
+            if difficulty and entry["difficulty"] != difficulty:
+                continue
+            if theme and entry["theme"] != theme:
+                continue
+            result.append(entry)
+            if len(result) == limit:
+                break
+        return result
+
+
+class Leaderboards:
+    """Um RollingLeaderboard por período de PERIODS."""
+
+    def __init__(self, entries: Iterable[Dict] = (), now: Optional[float] = None):
+        """
+        Monta os rankings com as partidas ainda dentro de alguma janela.
+
+        Args:
+            entries: Registros do histórico
+            now: Instante de referência (padrão: agora), usado também como
+                "hoje" para o ano das datas antigas (sem ``ts``)
+        """
+        now = time.time() if now is None else now
+        today = datetime.fromtimestamp(now)
+        self.boards = {name: RollingLeaderboard(w) for name, w in PERIODS.items()}
+        oldest = now - max(PERIODS.values())
+        items = []
+        for entry in entries:
+            ts = entry_timestamp(entry, today)
+            if ts >= oldest:  # NaN (sem data) também fica de fora
+                items.append((entry, ts))
+        for board in self.boards.values():
+            board.load(items, now)
+
+    def add(self, entry: Dict, now: Optional[float] = None) -> None:
+        """Inclui uma partida nova em todos os períodos."""
+        now = time.time() if now is None else now
+        ts = entry_timestamp(entry, datetime.fromtimestamp(now))
+        if math.isnan(ts):  # Partida sem data legível
+            return
+        for board in self.boards.values():
+            board.add(entry, ts, now)
+
+    def top(self, period: str, limit: Optional[int] = 10, **filters) -> List[Dict]:
+        """Top do período ("day" ou "week"); ver RollingLeaderboard.top."""
+        return self.boards[period].top(limit, **filters)
@@ -0,0 +1,165 @@
+# ARQUIVO: src/infrastructure/player_index.py
+"""
+Índice do histórico por jogador.
+
+O campo ``name`` é texto livre; ``player_id`` o normaliza (sem acentos,
+maiúsculas ou espaços extras) para que "Ana", " ana " e "Ána" sejam o
+mesmo jogador. O índice guarda, por jogador, as partidas em ordem
+cronológica e os recordes por dificuldade, além de listas ordenadas de
+pontuações para consultar posições no ranking com busca binária.
+"""
+
+import math
+import unicodedata
+from bisect import bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from src.infrastructure.score_columns import entry_timestamp
+
+
+def player_id(name: str) -> str:
+    """
+    Identificador normalizado de um jogador.
+
+    Args:
+        name: Nome como digitado no login
+
+    Returns:
+        Nome sem acentos, em minúsculas e com espaços simples
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    plain = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(plain.casefold().split())
+
+
+@dataclass
+class PlayerRecord:
+    """Partidas e recordes de um jogador."""
+
+    name: str  # Nome exibido (o da partida mais recente)
+    games: List[Dict] = field(default_factory=list)  # Mais antiga primeiro
+    best: Dict[Optional[str], Dict] = field(default_factory=dict)
+    total_score: int = 0
+
+    @property
+    def average(self) -> float:
+        return self.total_score / len(self.games) if self.games else 0.0
+
+
+class PlayerIndex:
+    """
+    Consultas por jogador sem varrer o histórico.
+
+    A montagem acrescenta tudo e ordena cada lista uma única vez
+    (O(n log n)); a inserção binária de ``add`` é só para a partida que
+    acabou de ser gravada. Muitas partidas novas de uma vez (ex: importação)
+    mudam o arquivo e o índice é remontado, nunca inserido um a um.
+    """
+
+    def __init__(self, entries: Iterable[Dict] = (), today: datetime = None):
+        """
+        Monta o índice.
+
+        Args:
+            entries: Registros do histórico (qualquer ordem)
+            today: Referência para o ano das datas (padrão: agora)
+        """
+        today = today or datetime.now()
+
+        def played_at(entry):
+            ts = entry_timestamp(entry, today)
+            return -math.inf if math.isnan(ts) else ts
+
+        self.players: Dict[str, PlayerRecord] = {}
+        # Pontuações em ordem crescente: None = todas, ou por dificuldade
+        self._scores: Dict[Optional[str], List[int]] = {None: []}
+        # Recorde geral de cada jogador, em ordem crescente
+        self._bests: List[int] = []
+
+        for entry in sorted(entries, key=played_at):
+            self._index(entry)
+        for scores in self._scores.values():
+            scores.sort()
+        self._bests = sorted(
+            record.best[None]["score"] for record in self.players.values()
+        )
+
+    def _index(self, entry: Dict) -> PlayerRecord:
+        """Registra uma partida (listas de pontuação ficam fora de ordem)."""
+        pid = player_id(entry["name"])
+        record = self.players.get(pid)
+        if record is None:
+            record = self.players[pid] = PlayerRecord(entry["name"])
+        record.name = entry["name"]
+        record.games.append(entry)
+        record.total_score += entry["score"]
+        for key in (None, entry["difficulty"]):
+            best = record.best.get(key)
+            if best is None or entry["score"] > best["score"]:
+                record.best[key] = entry
+            self._scores.setdefault(key, []).append(entry["score"])
+        return record
+
+    def add(self, entry: Dict) -> None:
+        """
+        Acrescenta uma partida nova (mais recente que as indexadas).
+
+        Mantém as listas ordenadas com inserção binária: O(n) por partida,
+        então serve para gravações isoladas, não para carga em lote.
+        """
+        pid = player_id(entry["name"])
+        old = self.players.get(pid)
+        old_best = old.best[None]["score"] if old is not None else None
+
+        record = self._index(entry)
+        for key in (None, entry["difficulty"]):
+            scores = self._scores[key]
+            scores.pop()  # _index acrescentou no fim
+            insort(scores, entry["score"])
+
+        new_best = record.best[None]["score"]
+        if old_best != new_best:
+            if old_best is not None:
+                del self._bests[bisect_right(self._bests, old_best) - 1]
+            insort(self._bests, new_best)
+
+    # ----------------------------------------
+    # Consultas
+    # ----------------------------------------
+
+    def get(self, name: str) -> Optional[PlayerRecord]:
+        """Registro do jogador (None se nunca jogou)."""
+        return self.players.get(player_id(name))
+
+    def personal_best(self, name: str, difficulty: str = None) -> Optional[Dict]:
+        """Melhor partida do jogador, geral ou numa dificuldade."""
+        record = self.get(name)
+        return record.best.get(difficulty) if record else None
+
+    def recent_games(self, name: str, limit: int = 5) -> List[Dict]:
+        """Últimas partidas do jogador, da mais recente para a mais antiga."""
+        record = self.get(name)
+        return record.games[: -limit - 1 : -1] if record else []
+
+    def rank_of_score(self, score: int, difficulty: str = None) -> int:
+        """
+        Posição que ``score`` ocupa no ranking (1 = primeiro).
+
+        Empates ficam com a melhor posição. O(log n).
+        """
+        scores = self._scores.get(difficulty, [])
+        return len(scores) - bisect_right(scores, score) + 1
+
+    def rank_of_player(self, name: str) -> Optional[int]:
+        """Posição do jogador pelo recorde pessoal, entre todos os jogadores."""
+        record = self.get(name)
+        if record is None:
+            return None
+        best = record.best[None]["score"]
+        return len(self._bests) - bisect_right(self._bests, best) + 1
+
+    @property
+    def total_players(self) -> int:
+        return len(self.players)
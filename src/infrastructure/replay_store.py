@@ -0,0 +1,455 @@
+# ARQUIVO: src/infrastructure/replay_store.py
+"""
+Formato binário compacto para replays.
+
+Arquivo de uma partida (``.mgr``)::
+
+    b"MGR1" | varint(tamanho do cabeçalho) | cabeçalho JSON (UTF-8) | eventos
+    | trailer (opcional)
+
+Cada evento ocupa tipicamente 2-4 bytes::
+
+    varint((linha * colunas + coluna) << 2 | tipo) | varint(zigzag(Δt_ms))
+
+O trailer é gravado ao fechar a partida, com dados que só existem no fim
+(ex: a pontuação final, conferida por ``GameReplay.verify``). Ele usa uma
+posição fora do tabuleiro como marca::
+
+    varint((linhas * colunas) << 2) | varint(tamanho) | JSON (UTF-8)
+
+Na leitura, os campos do trailer entram em ``metadata`` do registro.
+
+O arquivo é escrito evento a evento durante a partida (ReplayWriter) e lido
+como gerador (stream_events). Para guardar milhões de partidas, o
+ReplayArchive concatena partidas num único arquivo de dados e mantém um
+índice de offsets de 8 bytes, acessado via ``mmap`` (acesso O(1) por índice).
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from src.services.event_log import GameEvent, GameEventLog
+
+MAGIC = b"MGR1"
+ARCHIVE_MAGIC = b"MGRA"
+OFFSET = struct.Struct("<Q")
+
+
+# ----------------------------------------
+# Varints
+# ----------------------------------------
+
+
+def encode_varint(value: int) -> bytes:
+    """Codifica um inteiro não negativo em LEB128 (7 bits por byte)."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(buffer, offset: int) -> Tuple[int, int]:
+    """
+    Decodifica um varint.
+
+    Args:
+        buffer: bytes/bytearray/mmap
+        offset: Posição inicial
+
+    Returns:
+        Tupla (valor, próxima posição)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    """Mapeia inteiros com sinal em não negativos (0, -1, 1 -> 0, 1, 2)."""
+    return (value << 1) ^ (value >> 63)
+
+
+def unzigzag(value: int) -> int:
+    """Inverso de ``zigzag``."""
+    return (value >> 1) ^ -(value & 1)
+
+
+# ----------------------------------------
+# Codificação de partidas
+# ----------------------------------------
+
+
+def _encode_header(log: GameEventLog) -> bytes:
+    header = json.dumps(log.header(), ensure_ascii=False, separators=(",", ":"))
+    data = header.encode("utf-8")
+    return encode_varint(len(data)) + data
+
+
+def _encode_event(event: GameEvent, cols: int, previous_t: int) -> bytes:
+    cell = event.row * cols + event.col
+    return encode_varint((cell << 2) | event.kind) + encode_varint(
+        zigzag(event.t_ms - previous_t)
+    )
+
+
+def _encode_trailer(trailer: Dict, rows: int, cols: int) -> bytes:
+    data = json.dumps(trailer, ensure_ascii=False, separators=(",", ":"))
+    data = data.encode("utf-8")
+    return encode_varint((rows * cols) << 2) + encode_varint(len(data)) + data
+
+
+def _decode_trailer(buffer, offset: int) -> Tuple[Dict, int]:
+    """Lê o JSON do trailer (``offset`` logo após a marca)."""
+    size, offset = decode_varint(buffer, offset)
+    if offset + size > len(buffer):
+        raise IndexError("Trailer incompleto.")
+    trailer = json.loads(bytes(buffer[offset : offset + size]).decode("utf-8"))
+    return trailer, offset + size
+
+
+def encode_log(log: GameEventLog) -> bytes:
+    """Codifica uma partida completa (com o prefixo MAGIC)."""
+    parts = [MAGIC, _encode_header(log)]
+    previous_t = 0
+    for event in log.events:
+        parts.append(_encode_event(event, log.cols, previous_t))
+        previous_t = event.t_ms
+    return b"".join(parts)
+
+
+def _decode_header(buffer, offset: int) -> Tuple[Dict, int]:
+    signature = bytes(buffer[offset : offset + len(MAGIC)])
+    if len(signature) < len(MAGIC) and MAGIC.startswith(signature):
+        # Arquivo recém-criado (ainda sem cabeçalho completo)
+        raise IndexError("Assinatura incompleta.")
+    if signature != MAGIC:
+        raise ValueError("Arquivo de replay inválido (assinatura incorreta).")
+    offset += len(MAGIC)
+    size, offset = decode_varint(buffer, offset)
+    if offset + size > len(buffer):
+        raise IndexError("Cabeçalho incompleto.")
+    header = json.loads(bytes(buffer[offset : offset + size]).decode("utf-8"))
+    return header, offset + size
+
+
+def iter_encoded_events(
+    buffer,
+    offset: int,
+    end: int,
+    rows: int,
+    cols: int,
+    metadata: Optional[Dict] = None,
+) -> Iterator[GameEvent]:
+    """
+    Decodifica eventos de ``buffer[offset:end]`` sob demanda.
+
+    Args:
+        buffer: bytes/bytearray/mmap com a partida
+        offset: Início do primeiro evento
+        end: Fim dos eventos
+        rows, cols: Dimensões do tabuleiro (para desempacotar a posição)
+        metadata: Se informado, recebe os campos do trailer
+
+    Yields:
+        GameEvent
+    """
+    t_ms = 0
+    while offset < end:
+        packed, offset = decode_varint(buffer, offset)
+        if packed >> 2 >= rows * cols:
+            trailer, offset = _decode_trailer(buffer, offset)
+            if metadata is not None:
+                metadata.update(trailer)
+            return
+        delta, offset = decode_varint(buffer, offset)
+        t_ms += unzigzag(delta)
+        row, col = divmod(packed >> 2, cols)
+        yield GameEvent(t_ms, packed & 0b11, row, col)
+
+
+def decode_log(buffer, offset: int = 0, end: Optional[int] = None) -> GameEventLog:
+    """Decodifica uma partida codificada por ``encode_log``."""
+    end = len(buffer) if end is None else end
+    header, offset = _decode_header(buffer, offset)
+    log = GameEventLog.from_header(header)
+    log.events = list(
+        iter_encoded_events(
+            buffer, offset, end, log.rows, log.cols, metadata=log.metadata
+        )
+    )
+    return log
+
+
+# ----------------------------------------
+# Arquivo de uma partida (escrita incremental)
+# ----------------------------------------
+
+
+class ReplayWriter:
+    """
+    Grava uma partida em disco à medida que os eventos acontecem.
+
+    Usado como ``sink`` de um GameEventLog: cada ``append`` do registro
+    escreve alguns bytes e descarrega o buffer (``flush``), para que o
+    arquivo no disco acompanhe a partida (leitura com ``stream_events``) e
+    uma partida abandonada ou interrompida não perca jogadas.
+    """
+
+    def __init__(self, path: str, log: GameEventLog):
+        """
+        Abre o arquivo e grava o cabeçalho da partida.
+
+        Args:
+            path: Caminho do arquivo ``.mgr``
+            log: Registro da partida (cabeçalho e eventos já existentes)
+        """
+        self.path = path
+        self.rows = log.rows
+        self.cols = log.cols
+        self._previous_t = 0
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(MAGIC + _encode_header(log))
+        for event in log.events:
+            self._write(event)
+        self._file.flush()
+
+    def write(self, event: GameEvent) -> None:
+        """Anexa um evento ao arquivo (visível para leitores em seguida)."""
+        if self._file is None:
+            return
+        self._write(event)
+        self._file.flush()
+
+    def _write(self, event: GameEvent) -> None:
+        self._file.write(_encode_event(event, self.cols, self._previous_t))
+        self._previous_t = event.t_ms
+
+    def close(self, trailer: Optional[Dict] = None) -> None:
+        """
+        Descarrega e fecha o arquivo.
+
+        Args:
+            trailer: Dados do fim da partida (ex: {"score": 1200})
+        """
+        if self._file is not None:
+            if trailer:
+                self._file.write(_encode_trailer(trailer, self.rows, self.cols))
+            self._file.close()
+            self._file = None
+
+
+def read_replay(path: str) -> GameEventLog:
+    """Lê uma partida gravada em ``.mgr``."""
+    with open(path, "rb") as f:
+        return decode_log(f.read())
+
+
+def stream_events(
+    path: str, chunk_size: int = 64 * 1024, metadata: Optional[Dict] = None
+) -> Iterator[GameEvent]:
+    """
+    Lê os eventos de um ``.mgr`` sem carregar o arquivo inteiro.
+
+    Também funciona com arquivos ainda em escrita (partida em andamento):
+    um arquivo vazio ou com cabeçalho incompleto não rende eventos, e um
+    evento incompleto no final é ignorado.
+
+    Args:
+        path: Caminho do arquivo
+        chunk_size: Bytes lidos por vez
+        metadata: Se informado, recebe os campos do trailer (ao fim da leitura)
+
+    Yields:
+        GameEvent
+    """
+    with open(path, "rb") as f:
+        buffer = bytearray(f.read(chunk_size))
+        while True:
+            try:
+                header, offset = _decode_header(buffer, 0)
+                break
+            except IndexError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                buffer += chunk
+        rows, cols = header["rows"], header["cols"]
+
+        t_ms = 0
+        while True:
+            # Decodifica todos os eventos completos do buffer atual
+            while True:
+                try:
+                    packed, pos = decode_varint(buffer, offset)
+                    if packed >> 2 >= rows * cols:
+                        trailer, _ = _decode_trailer(buffer, pos)
+                        if metadata is not None:
+                            metadata.update(trailer)
+                        return
+                    delta, pos = decode_varint(buffer, pos)
+                except IndexError:
+                    break
+                offset = pos
+                t_ms += unzigzag(delta)
+                row, col = divmod(packed >> 2, cols)
+                yield GameEvent(t_ms, packed & 0b11, row, col)
+
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            del buffer[:offset]
+            offset = 0
+            buffer += chunk
+
+
+def load_replay(path: str) -> GameEventLog:
+    """Lê um replay em ``.mgr`` (binário) ou JSON, conforme a extensão."""
+    if path.endswith(".mgr"):
+        return read_replay(path)
+    return GameEventLog.load(path)
+
+
+# ----------------------------------------
+# Arquivo de muitas partidas
+# ----------------------------------------
+
+
+class ReplayArchive:
+    """
+    Coleção de partidas em dois arquivos: dados (``.mga``) e índice (``.idx``).
+
+    O índice guarda o offset de cada partida (uint64); a leitura usa
+    ``mmap``, então abrir o arquivo não carrega nada na memória e a
+    partida ``i`` é localizada em O(1). Os eventos têm tamanho variável:
+    ``event_at`` monta, no primeiro acesso a uma partida, um índice com o
+    offset e o tempo de cada evento; os acessos seguintes são O(1).
+    """
+
+    # Índices de eventos guardados (partidas consultadas mais recentemente)
+    EVENT_INDEX_CACHE = 32
+
+    def __init__(self, path: str):
+        """
+        Abre (ou cria) o arquivo.
+
+        Args:
+            path: Caminho do arquivo de dados; o índice fica em ``path + ".idx"``
+        """
+        self.path = path
+        self.index_path = path + ".idx"
+        # Partida → (colunas, offsets dos eventos, tempos dos eventos)
+        self._event_indexes: "OrderedDict[int, Tuple[int, array, array]]" = (
+            OrderedDict()
+        )
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(ARCHIVE_MAGIC)
+            open(self.index_path, "wb").close()
+
+    def __len__(self) -> int:
+        return os.path.getsize(self.index_path) // OFFSET.size
+
+    def append(self, log: GameEventLog) -> int:
+        """
+        Acrescenta uma partida ao arquivo.
+
+        Args:
+            log: Registro da partida
+
+        Returns:
+            Índice da partida no arquivo
+        """
+        data = encode_log(log)
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(encode_varint(len(data)) + data)
+        with open(self.index_path, "ab") as f:
+            f.write(OFFSET.pack(offset))
+        return len(self) - 1
+
+    def _locate(self, index: int) -> int:
+        """Retorna o offset da partida ``index`` no arquivo de dados."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"Replay {index} não existe no arquivo.")
+        with open(self.index_path, "rb") as f:
+            f.seek(index * OFFSET.size)
+            (offset,) = OFFSET.unpack(f.read(OFFSET.size))
+        return offset
+
+    def _map(self):
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, index: int) -> GameEventLog:
+        """Carrega a partida ``index``."""
+        offset = self._locate(index)
+        with self._map() as data:
+            size, start = decode_varint(data, offset)
+            return decode_log(data, start, start + size)
+
+    def iter_events(self, index: int) -> Iterator[GameEvent]:
+        """Gera os eventos da partida ``index`` direto do arquivo mapeado."""
+        offset = self._locate(index)
+        with self._map() as data:
+            size, start = decode_varint(data, offset)
+            header, events_start = _decode_header(data, start)
+            yield from iter_encoded_events(
+                data, events_start, start + size, header["rows"], header["cols"]
+            )
+
+    def _event_index(self, index: int) -> Tuple[int, array, array]:
+        """
+        Offsets e tempos dos eventos da partida ``index``.
+
+        Montado com uma passada pela partida e guardado (as partidas do
+        arquivo nunca mudam depois de gravadas).
+        """
+        cached = self._event_indexes.get(index)
+        if cached is not None:
+            self._event_indexes.move_to_end(index)
+            return cached
+
+        offset = self._locate(index)
+        offsets, times = array("Q"), array("q")
+        with self._map() as data:
+            size, start = decode_varint(data, offset)
+            header, pos = _decode_header(data, start)
+            cells, cols = header["rows"] * header["cols"], header["cols"]
+            t_ms = 0
+            while pos < start + size:
+                packed, following = decode_varint(data, pos)
+                if packed >> 2 >= cells:  # Trailer
+                    break
+                delta, following = decode_varint(data, following)
+                t_ms += unzigzag(delta)
+                offsets.append(pos)
+                times.append(t_ms)
+                pos = following
+
+        cached = self._event_indexes[index] = (cols, offsets, times)
+        if len(self._event_indexes) > self.EVENT_INDEX_CACHE:
+            self._event_indexes.popitem(last=False)
+        return cached
+
+    def event_at(self, index: int, event_index: int) -> GameEvent:
+        """Retorna o evento ``event_index`` da partida ``index``."""
+        cols, offsets, times = self._event_index(index)
+        if not 0 <= event_index < len(offsets):
+            raise IndexError(f"Replay {index} não tem o evento {event_index}.")
+        with self._map() as data:
+            packed, _ = decode_varint(data, offsets[event_index])
+        row, col = divmod(packed >> 2, cols)
+        return GameEvent(times[event_index], packed & 0b11, row, col)
@@ -1,69 +1,609 @@
 # ARQUIVO: src/infrastructure/repository.py
+import heapq
 import json
+import math
 import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List
+from itertools import islice, pairwise
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.infrastructure.leaderboard import PERIODS, Leaderboards
+from src.infrastructure.player_index import PlayerIndex
+from src.infrastructure.score_columns import ScoreColumns
+
+try:
+    import fcntl
+except ImportError:  # Windows: só a trava entre threads
+    fcntl = None
+
+# Campos obrigatórios de um registro de partida
+RECORD_KEYS = ("name", "score", "theme", "difficulty")
+
+
+def _is_record(value) -> bool:
+    """
+    True se ``value`` é uma partida válida.
+
+    Confere os tipos, não só a presença dos campos: registros vindos de
+    outras máquinas podem ter pontuação em texto, nomes que não são texto
+    etc., e quebrariam a ordenação ou a deduplicação.
+    """
+    if not isinstance(value, dict) or not all(k in value for k in RECORD_KEYS):
+        return False
+    score = value["score"]
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        return False
+    if isinstance(score, float) and not math.isfinite(score):
+        return False
+    if not all(isinstance(value[k], str) for k in ("name", "theme", "difficulty")):
+        return False
+    if not isinstance(value.get("date", ""), str):
+        return False
+    ts = value.get("ts")
+    return ts is None or (
+        isinstance(ts, (int, float))
+        and not isinstance(ts, bool)
+        and math.isfinite(ts)
+    )
+
+
+def entry_month(entry: Dict, today: datetime) -> Optional[str]:
+    """
+    Mês ("AAAA-MM") em que a partida foi jogada.
+
+    Usa ``ts`` quando existe. Registros antigos só têm ``date`` (dia e
+    mês): o ano é o atual, ou o anterior se o mês ainda não chegou.
+
+    Returns:
+        Chave do mês ou None se a data for ilegível
+    """
+    if entry.get("ts") is not None:
+        return datetime.fromtimestamp(entry["ts"]).strftime("%Y-%m")
+    try:
+        month = int(entry["date"].split()[0].split("/")[1])
+    except (KeyError, IndexError, ValueError, AttributeError):
+        return None
+    if not 1 <= month <= 12:
+        return None
+    year = today.year if month <= today.month else today.year - 1
+    return f"{year:04d}-{month:02d}"
+
+
+# Estruturas derivadas que as gravações atualizam em vez de reconstruir
+INCREMENTAL_KINDS = ("players", "leaderboards", "columns")
+
+# Arquivos já lidos neste processo:
+# (tipo, caminho absoluto) → ((inode, tamanho, mtime_ns), dados)
+_PARSE_CACHE: Dict[Tuple[str, str], Tuple[tuple, object]] = {}
+
+
+# Problemas da última leitura de cada arquivo (caminho absoluto → mensagem).
+# Leituras não imprimem nem gravam: só registram aqui, e quem chamou decide
+# o que fazer (ver ScoreRepository.diagnostics e repair)
+_READ_PROBLEMS: Dict[str, str] = {}
+
+
+def _stat_key(st: os.stat_result) -> tuple:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def read_json_cached(
+    path: str, parse: Callable[[], object], default=None, kind: str = "json"
+):
+    """
+    Lê um JSON reaproveitando a última leitura se o arquivo não mudou.
+
+    A validade é conferida com um ``stat`` a cada chamada: qualquer
+    gravação, deste ou de outro processo, muda inode/tamanho/mtime e força
+    nova leitura. Os dados devolvidos são compartilhados: não altere.
+
+    Args:
+        path: Arquivo
+        parse: Lê e decodifica o arquivo (chamado só quando mudou)
+        default: Valor quando o arquivo não existe
+        kind: Representação guardada (ex: "json", "columns"); cada tipo
+            tem sua própria entrada no cache
+
+    Returns:
+        Dados decodificados
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return default
+    key = _stat_key(st)
+    cached = _PARSE_CACHE.get((kind, path))
+    if cached is None or cached[0] != key:
+        if kind == "json":  # Os demais tipos derivam da leitura do JSON
+            _READ_PROBLEMS.pop(path, None)
+        cached = (key, parse())
+        _PARSE_CACHE[(kind, path)] = cached
+    return cached[1]
+
+
+def write_json_atomic(path: str, data) -> None:
+    """
+    Grava ``data`` em ``path`` sem nunca deixar o arquivo pela metade.
+
+    Escreve num temporário, força para o disco (fsync) e troca com
+    ``os.replace``; a pasta também recebe fsync para a troca sobreviver
+    a uma queda de energia.
+
+    O cache de ``read_json_cached`` é atualizado com ``data`` (o temporário
+    mantém inode e mtime ao ser renomeado), evitando reler o que acabou de
+    ser escrito.
+
+    Raises:
+        OSError: Se a gravação falhar (o arquivo antigo fica intacto)
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+        key = _stat_key(os.fstat(f.fileno()))
+    os.replace(tmp_path, path)
+    _PARSE_CACHE[("json", os.path.abspath(path))] = (key, data)
+    _READ_PROBLEMS.pop(os.path.abspath(path), None)
+    if os.name == "posix":
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _top_by_bucket(entries: List[Dict], k: int) -> List[Dict]:
+    """Os ``k`` maiores scores de cada par (dificuldade, tema)."""
+    buckets: Dict[tuple, List[Dict]] = {}
+    for entry in entries:
+        buckets.setdefault((entry["difficulty"], entry["theme"]), []).append(entry)
+    top: List[Dict] = []
+    for bucket in buckets.values():
+        bucket.sort(key=lambda x: x["score"], reverse=True)
+        top.extend(bucket[:k])
+    return top
+
+
+def summarize_month(entries: List[Dict], top_k: int) -> Dict:
+    """
+    Resumo de um mês arquivado.
+
+    Guarda as contagens usadas nas estatísticas e os ``top_k`` melhores de
+    cada combinação dificuldade/tema, o suficiente para qualquer ranking
+    filtrado de até ``top_k`` linhas.
+    """
+    themes: Dict[str, int] = {}
+    difficulties: Dict[str, int] = {}
+    for entry in entries:
+        themes[entry["theme"]] = themes.get(entry["theme"], 0) + 1
+        difficulty = entry["difficulty"]
+        difficulties[difficulty] = difficulties.get(difficulty, 0) + 1
+    return {
+        "games": len(entries),
+        "best_score": max((e["score"] for e in entries), default=0),
+        "themes_count": themes,
+        "difficulty_count": difficulties,
+        "top": _top_by_bucket(entries, top_k),
+    }
+
+
+def salvage_records(text: str) -> List[Dict]:
+    """
+    Recupera os registros íntegros de um JSON de scores truncado.
+
+    Lê os objetos da lista um a um e para no primeiro que não fecha
+    (ex: escrita interrompida no meio).
+
+    Args:
+        text: Conteúdo do arquivo
+
+    Returns:
+        Registros válidos encontrados antes do ponto de corrupção
+    """
+    decoder = json.JSONDecoder()
+    records: List[Dict] = []
+    pos = text.find("[") + 1
+    if pos == 0:
+        return records
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return records
+        try:
+            value, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return records
+        if _is_record(value):
+            records.append(value)
+
+
+def iter_records(
+    path: str, chunk_size: int = 1 << 16, records_only: bool = True
+) -> Iterator:
+    """
+    Lê os registros de um arquivo de scores sem carregá-lo inteiro.
+
+    Aceita a lista JSON do scores.json ou JSONL (um registro por linha).
+    O texto é lido em blocos de ``chunk_size`` caracteres e decodificado
+    objeto a objeto, como em ``salvage_records``: a memória usada depende
+    do tamanho de um registro, não do arquivo. Um arquivo truncado rende
+    os registros anteriores ao corte.
+
+    Args:
+        path: Arquivo JSON ou JSONL
+        chunk_size: Tamanho de cada leitura
+        records_only: Ignora valores que não são partidas válidas; com
+            False devolve todos (ex: para contar os inválidos)
+
+    Yields:
+        Registros de partida (ou valores JSON), na ordem do arquivo
+    """
+    decoder = json.JSONDecoder()
+    separators = " \t\r\n"
+    started = False
+    # "utf-8-sig": arquivos vindos do Windows podem começar com BOM
+    with open(path, "r", encoding="utf-8-sig") as f:
+        buf, pos, eof = "", 0, False
+        while True:
+            while pos < len(buf) and buf[pos] in separators:
+                pos += 1
+            if pos < len(buf):
+                if not started:
+                    started = True
+                    if buf[pos] == "[":  # Lista JSON: vírgulas também separam
+                        separators += ","
+                        pos += 1
+                        continue
+                if buf[pos] == "]":
+                    return
+                try:
+                    value, pos = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    pass
+                else:
+                    if not records_only or _is_record(value):
+                        yield value
+                    continue
+            # Fim do bloco no meio de um registro: lê mais texto
+            if eof or len(buf) - pos > 64 * chunk_size:
+                return  # Arquivo truncado ou registro corrompido
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+
+
+def record_key(entry: Dict) -> tuple:
+    """
+    Identidade de uma partida para deduplicar importações.
+
+    (nome, score, tema, dificuldade, momento): o ``ts`` quando existe, ou o
+    texto de ``date`` dos registros antigos (sem ano, não dá para converter
+    com segurança).
+    """
+    when = entry.get("ts")
+    if when is None:
+        when = entry.get("date")
+    return (
+        entry["name"],
+        entry["score"],
+        entry["theme"],
+        entry["difficulty"],
+        when,
+    )
 
 
 class ScoreRepository:
     """Gerencia a persistência dos recordes e estatísticas em arquivo JSON."""
 
     FILE_PATH = "scores.json"
+    # Versões anteriores mantidas como scores.json.1, .2, ...
+    BACKUP_COUNT = 3
+    # Melhores partidas por dificuldade/tema guardadas no resumo de cada mês
+    ARCHIVE_TOP_K = 10
 
-    def save_score(self, player_name: str, score: int, theme: str, difficulty: str):
-        data = self._load_file()
-        timestamp = datetime.now().strftime("%d/%m %H:%M")
+    def __init__(self):
+        # Serializa leituras e escritas entre threads (jogo, gravação,
+        # compactação em segundo plano)
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
+        # Último ranking completo filtrado (paginação): (chave, linhas)
+        self._view: Tuple[Optional[tuple], List[Dict]] = (None, [])
 
-        new_entry = {
-            "name": player_name,
-            "score": score,
-            "theme": theme,
-            "difficulty": difficulty,
-            "date": timestamp,
-        }
-        data.append(new_entry)
+    @contextmanager
+    def _write_lock(self):
+        """
+        Trava de escrita entre threads e entre processos.
 
-        # Ordena por Score, mas NÃO apaga mais o histórico
-        data.sort(key=lambda x: x["score"], reverse=True)
-        self._save_file(data)
+        Várias instâncias do jogo podem dividir o mesmo scores.json: o ciclo
+        ler → alterar → gravar roda com ``flock`` exclusivo num arquivo
+        ``.lock`` ao lado (o próprio scores.json é trocado a cada gravação,
+        então não serve para travar). Reentrante dentro do processo.
+        """
+        with self._lock:
+            if self._lock_depth == 0 and fcntl is not None:
+                self._lock_file = open(self.FILE_PATH + ".lock", "a")
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0 and self._lock_file is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    @property
+    def archive_dir(self) -> str:
+        """Pasta dos segmentos mensais (ex: scores_archive/2025-01.json)."""
+        return os.path.splitext(self.FILE_PATH)[0] + "_archive"
+
+    @property
+    def summary_path(self) -> str:
+        """Resumos dos meses arquivados (ex: scores_summary.json)."""
+        return os.path.splitext(self.FILE_PATH)[0] + "_summary.json"
+
+    def save_score(
+        self, player_name: str, score: int, theme: str, difficulty: str
+    ) -> bool:
+        """Grava uma partida no histórico. Retorna True se chegou ao disco."""
+        with self._write_lock():
+            data = self._load_file()
+            now = datetime.now()
+
+            new_entry = {
+                "name": player_name,
+                "score": score,
+                "theme": theme,
+                "difficulty": difficulty,
+                "date": now.strftime("%d/%m %H:%M"),
+                "ts": round(now.timestamp(), 3),
+            }
+            data.append(new_entry)
+
+            path = os.path.abspath(self.FILE_PATH)
+            read_key = _PARSE_CACHE.get(("json", path), (None,))[0]
+            if not self._save_file(data):
+                return False
+
+            # Índices derivados são atualizados em vez de reconstruídos
+            new_key = _PARSE_CACHE[("json", path)][0]
+            for kind in INCREMENTAL_KINDS:
+                cached = _PARSE_CACHE.get((kind, path))
+                if cached is not None and cached[0] == read_key:
+                    cached[1].add(new_entry)
+                    _PARSE_CACHE[(kind, path)] = (new_key, cached[1])
+            return True
+
+    @property
+    def version(self) -> tuple:
+        """Muda sempre que o histórico muda no disco (para caches de tela)."""
+        keys = []
+        for path in (self.FILE_PATH, self.summary_path):
+            try:
+                keys.append(_stat_key(os.stat(path)))
+            except FileNotFoundError:
+                keys.append(None)
+        return tuple(keys)
 
     def get_top_scores(
-        self, limit=10, difficulty_filter=None, theme_filter=None
+        self, limit=10, difficulty_filter=None, theme_filter=None, period=None
     ) -> List[Dict]:
-        """Retorna scores filtrados por Dificuldade E Tema."""
-        data = self._load_file()
+        """
+        Retorna scores filtrados por Dificuldade E Tema.
+
+        Args:
+            limit: Quantidade máxima
+            difficulty_filter, theme_filter: Filtros opcionais
+            period: None (sempre) ou uma chave de PERIODS ("day", "week")
+
+        Sem período, inclui os meses arquivados (exato para ``limit`` até
+        ARCHIVE_TOP_K). O arquivo principal já está ordenado por score,
+        então a busca para assim que encontra ``limit`` partidas.
+        """
+        if period is not None:
+            with self._lock:
+                return self.leaderboards().top(
+                    period, limit, difficulty=difficulty_filter, theme=theme_filter
+                )
+
+        def by_score(entry):
+            return -entry["score"]
+
+        with self._lock:
+            data = read_json_cached(self.FILE_PATH, self._parse_file, [])
+            summaries = self._load_summary().values()
+            archived = sorted(
+                (entry for summary in summaries for entry in summary["top"]),
+                key=by_score,
+            )
+        entries = heapq.merge(data, archived, key=by_score)
 
         # 1. Filtro de Dificuldade
         if difficulty_filter:
-            data = [d for d in data if d["difficulty"] == difficulty_filter]
+            entries = (d for d in entries if d["difficulty"] == difficulty_filter)
 
         # 2. Filtro de Tema
         if theme_filter:
-            data = [d for d in data if d["theme"] == theme_filter]
+            entries = (d for d in entries if d["theme"] == theme_filter)
 
-        # 3. Ordena e Corta
-        data.sort(key=lambda x: x["score"], reverse=True)
-        return data[:limit]
+        # 3. Corta (já em ordem de score)
+        return list(islice(entries, limit))
+
+    def get_scores_page(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        difficulty_filter=None,
+        theme_filter=None,
+        period=None,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Uma página do ranking completo (todas as partidas, não só o top).
+
+        O ranking filtrado é montado uma vez (uma passada pelo histórico,
+        incluindo os segmentos arquivados) e guardado até os filtros ou o
+        arquivo mudarem; cada página é só um recorte dessa lista.
+
+        Args:
+            offset: Posição da primeira linha (0 = primeiro lugar)
+            limit: Linhas da página
+            difficulty_filter, theme_filter, period: Como em get_top_scores
+
+        Returns:
+            Tupla (linhas da página, total de linhas do ranking)
+        """
+        key = (
+            difficulty_filter,
+            theme_filter,
+            period,
+            self.version,
+            int(time.time() // 60) if period else None,
+        )
+        with self._lock:
+            if self._view[0] != key:
+                self._view = (
+                    key,
+                    self._build_view(difficulty_filter, theme_filter, period),
+                )
+            rows = self._view[1]
+        return rows[offset : offset + limit], len(rows)
+
+    def _build_view(self, difficulty_filter, theme_filter, period) -> List[Dict]:
+        if period is not None:
+            return self.leaderboards().top(
+                period, None, difficulty=difficulty_filter, theme=theme_filter
+            )
+        # Arquivo principal e segmentos já estão ordenados por score
+        segments = [self._load_segment(month) for month in self._archive_months()]
+        data = read_json_cached(self.FILE_PATH, self._parse_file, [])
+        return [
+            entry
+            for entry in heapq.merge(data, *segments, key=lambda x: -x["score"])
+            if (not difficulty_filter or entry["difficulty"] == difficulty_filter)
+            and (not theme_filter or entry["theme"] == theme_filter)
+        ]
+
+    def leaderboards(self) -> Leaderboards:
+        """
+        Rankings das últimas 24 horas e dos últimos 7 dias.
+
+        Construídos uma vez por versão do arquivo e atualizados pelas
+        gravações deste processo; partidas vencidas saem nas consultas.
+        """
+
+        def build():
+            # Um único "agora" para a montagem inteira
+            now = time.time()
+            # A janela mais longa pode alcançar o mês anterior, já arquivado
+            since = datetime.fromtimestamp(now - max(PERIODS.values()))
+            recent = self._load_archive(since.strftime("%Y-%m"))
+            return Leaderboards(self._load_file() + recent, now)
+
+        with self._lock:
+            boards = read_json_cached(self.FILE_PATH, build, kind="leaderboards")
+            return boards if boards is not None else build()
+
+    def load_columns(self) -> ScoreColumns:
+        """
+        Partidas do arquivo principal em formato de colunas.
+
+        Reaproveitado enquanto o arquivo não mudar (ver ``read_json_cached``).
+        """
+        with self._lock:
+            columns = read_json_cached(
+                self.FILE_PATH,
+                lambda: ScoreColumns.from_entries(self._load_file()),
+                kind="columns",
+            )
+        return columns if columns is not None else ScoreColumns.from_entries([])
+
+    # ----------------------------------------
+    # Jogadores
+    # ----------------------------------------
+
+    def player_index(self) -> PlayerIndex:
+        """
+        Índice por jogador de todo o histórico (incluindo o arquivado).
+
+        Construído uma vez por versão do arquivo e atualizado pelas
+        gravações deste processo.
+        """
+        with self._lock:
+            index = read_json_cached(
+                self.FILE_PATH,
+                lambda: PlayerIndex(self._load_file() + self._load_archive()),
+                kind="players",
+            )
+            return index if index is not None else PlayerIndex(self._load_archive())
+
+    def get_personal_best(self, player_name: str, difficulty: str = None):
+        """Melhor partida do jogador (geral ou numa dificuldade) ou None."""
+        with self._lock:
+            return self.player_index().personal_best(player_name, difficulty)
+
+    def get_recent_games(self, player_name: str, limit: int = 5) -> List[Dict]:
+        """Últimas partidas do jogador, da mais recente para a mais antiga."""
+        with self._lock:
+            return self.player_index().recent_games(player_name, limit)
+
+    def get_rank(self, score: int, difficulty: str = None) -> int:
+        """Posição que ``score`` teria no ranking (1 = primeiro)."""
+        with self._lock:
+            return self.player_index().rank_of_score(score, difficulty)
+
+    def get_player_profile(self, player_name: str) -> Dict:
+        """
+        Resumo de um jogador para o Dashboard.
+
+        Returns:
+            Dicionário vazio se o jogador nunca jogou
+        """
+        with self._lock:
+            index = self.player_index()
+            record = index.get(player_name)
+            if record is None:
+                return {}
+            return {
+                "name": record.name,
+                "games": len(record.games),
+                "average": record.average,
+                "best": record.best[None],
+                "rank": index.rank_of_player(player_name),
+                "total_players": index.total_players,
+                "recent": index.recent_games(player_name, 5),
+            }
 
     def get_statistics(self) -> Dict:
         """Gera dados agregados para o Dashboard."""
-        data = self._load_file()
-        if not data:
+        with self._lock:
+            stats = self.load_columns().statistics()
+            summaries = self._load_summary()
+        if not stats and not summaries:
             return {}
 
-        stats = {
-            "total_games": len(data),
-            "best_score": max(d["score"] for d in data),
+        stats = stats or {
+            "total_games": 0,
+            "best_score": 0,
             "themes_count": {},
             "difficulty_count": {},
         }
 
-        for entry in data:
-            t = entry["theme"]
-            stats["themes_count"][t] = stats["themes_count"].get(t, 0) + 1
-
-            d = entry["difficulty"]
-            stats["difficulty_count"][d] = stats["difficulty_count"].get(d, 0) + 1
+        # Meses arquivados entram pelas contagens do resumo
+        for summary in summaries.values():
+            stats["total_games"] += summary["games"]
+            stats["best_score"] = max(stats["best_score"], summary["best_score"])
+            for key in ("themes_count", "difficulty_count"):
+                for name, count in summary[key].items():
+                    stats[key][name] = stats[key].get(name, 0) + count
 
         if stats["themes_count"]:
             stats["favorite_theme"] = max(
@@ -74,18 +614,358 @@ class ScoreRepository:
 
         return stats
 
-    def _load_file(self) -> List[Dict]:
-        if not os.path.exists(self.FILE_PATH):
+    # ----------------------------------------
+    # Compactação
+    # ----------------------------------------
+
+    def compact(self, keep_months: int = 2, today: datetime = None) -> int:
+        """
+        Move as partidas antigas para o arquivo morto.
+
+        Partidas fora dos ``keep_months`` meses mais recentes (contando o
+        atual) vão para um segmento por mês em ``archive_dir`` e entram no
+        resumo do mês; o arquivo principal fica só com as recentes. Rodar
+        de novo depois de uma interrupção não duplica registros.
+
+        Args:
+            keep_months: Meses mantidos no arquivo principal (mínimo 1)
+            today: Data de referência (padrão: agora)
+
+        Returns:
+            Quantidade de partidas arquivadas
+        """
+        today = today or datetime.now()
+        index = today.year * 12 + today.month - 1 - max(1, keep_months)
+        cutoff = f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+        with self._write_lock():
+            self.repair()
+            data = self._load_file()
+            old: Dict[str, List[Dict]] = {}
+            hot: List[Dict] = []
+            for entry in data:
+                month = entry_month(entry, today)
+                if month is not None and month <= cutoff:
+                    old.setdefault(month, []).append(entry)
+                else:
+                    hot.append(entry)
+            if not old:
+                return 0
+
+            # Ordem segura: segmentos → resumo → arquivo principal
+            os.makedirs(self.archive_dir, exist_ok=True)
+            summaries = self._load_summary()
+            for month, entries in old.items():
+                segment = self._load_segment(month)
+                seen = {tuple(sorted(e.items())) for e in segment}
+                for entry in entries:
+                    key = tuple(sorted(entry.items()))
+                    if key not in seen:
+                        seen.add(key)
+                        segment.append(entry)
+                segment.sort(key=lambda x: x["score"], reverse=True)
+                write_json_atomic(self._segment_path(month), segment)
+                summaries[month] = summarize_month(segment, self.ARCHIVE_TOP_K)
+            write_json_atomic(self.summary_path, summaries)
+            if not self._save_file(hot):
+                return 0
+        return len(data) - len(hot)
+
+    def diagnostics(self) -> List[str]:
+        """
+        Problemas encontrados ao ler o histórico (arquivo corrompido etc.).
+
+        As consultas continuam funcionando com o que foi recuperado; nada
+        é gravado até ``repair`` (ou a próxima gravação/compactação).
+
+        Returns:
+            Mensagens, vazio se estiver tudo íntegro
+        """
+        with self._lock:
+            self._load_file()
+            self._load_summary()
+        paths = (self.FILE_PATH, self.summary_path)
+        problems = (_READ_PROBLEMS.get(os.path.abspath(p)) for p in paths)
+        return [problem for problem in problems if problem]
+
+    def repair(self) -> List[str]:
+        """
+        Regrava o que ``diagnostics`` apontou.
+
+        O arquivo principal corrompido é preservado em ``.corrupt`` e
+        substituído pelo histórico recuperado; o resumo é refeito a partir
+        dos segmentos.
+
+        Returns:
+            Os problemas encontrados antes do reparo
+        """
+        with self._write_lock():
+            problems = self.diagnostics()
+            if _READ_PROBLEMS.get(os.path.abspath(self.FILE_PATH)):
+                self._save_file(self._load_file())
+            self._repair_summary()
+        return problems
+
+    def rebuild_summary(self) -> Dict[str, Dict]:
+        """Recria o resumo a partir dos segmentos (ex: resumo corrompido)."""
+        summaries = self._summarize_archive()
+        with self._write_lock():
+            write_json_atomic(self.summary_path, summaries)
+        return summaries
+
+    def _summarize_archive(self) -> Dict[str, Dict]:
+        """Resumo de todos os segmentos, só em memória."""
+        return {
+            month: summarize_month(self._load_segment(month), self.ARCHIVE_TOP_K)
+            for month in self._archive_months()
+        }
+
+    def _repair_summary(self) -> None:
+        """Regrava o resumo se estiver ilegível ou faltando (com segmentos)."""
+        try:
+            with open(self.summary_path, "r", encoding="utf-8") as f:
+                if isinstance(json.load(f), dict):
+                    return
+        except FileNotFoundError:
+            if not self._archive_months():
+                return
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+            pass
+        self.rebuild_summary()
+
+    def _load_archive(self, since_month: str = None) -> List[Dict]:
+        """
+        Partidas arquivadas (lê os segmentos).
+
+        Args:
+            since_month: Só segmentos a partir deste mês ("AAAA-MM")
+        """
+        entries: List[Dict] = []
+        for month in self._archive_months(since_month):
+            entries.extend(self._load_segment(month))
+        return entries
+
+    def _archive_months(self, since_month: str = None) -> List[str]:
+        """Meses com segmento arquivado, em ordem ("AAAA-MM")."""
+        if not os.path.isdir(self.archive_dir):
             return []
+        months = sorted(
+            os.path.splitext(name)[0]
+            for name in os.listdir(self.archive_dir)
+            if name.endswith(".json")
+        )
+        return [m for m in months if since_month is None or m >= since_month]
+
+    def _segment_path(self, month: str) -> str:
+        return os.path.join(self.archive_dir, f"{month}.json")
+
+    def _load_segment(self, month: str) -> List[Dict]:
         try:
-            with open(self.FILE_PATH, "r", encoding="utf-8") as f:
+            with open(self._segment_path(month), "r", encoding="utf-8") as f:
                 return json.load(f)
-        except (json.JSONDecodeError, IOError):
+        except FileNotFoundError:
             return []
 
-    def _save_file(self, data: List[Dict]):
+    def _load_summary(self) -> Dict[str, Dict]:
+        return dict(read_json_cached(self.summary_path, self._parse_summary, {}))
+
+    def _parse_summary(self) -> Dict[str, Dict]:
+        try:
+            with open(self.summary_path, "r", encoding="utf-8") as f:
+                summaries = json.load(f)
+            if isinstance(summaries, dict):
+                return summaries
+        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+            pass
+        # Leitura não grava nada: o arquivo é refeito por ``repair`` (na
+        # compactação ou em ``scores_cli repair``)
+        _READ_PROBLEMS[os.path.abspath(self.summary_path)] = (
+            f"{self.summary_path} corrompido: resumo refeito dos segmentos"
+        )
+        return self._summarize_archive()
+
+    # ----------------------------------------
+    # Exportação e importação
+    # ----------------------------------------
+
+    def iter_entries(self) -> Iterator[Dict]:
+        """
+        Todas as partidas (arquivo principal e depois os meses arquivados).
+
+        Lidas do disco aos poucos com ``iter_records``, para exportar
+        históricos de qualquer tamanho.
+        """
+        paths = [self.FILE_PATH]
+        paths += [self._segment_path(m) for m in self._archive_months()]
+        for path in paths:
+            try:
+                yield from iter_records(path)
+            except FileNotFoundError:
+                continue
+
+    def import_scores(self, records: Iterable) -> Tuple[int, int, int]:
+        """
+        Junta partidas de outro histórico (ex: de outra máquina) a este.
+
+        Partidas que já existem aqui, no arquivo principal ou no arquivado,
+        são ignoradas (ver ``record_key``), assim como as repetidas dentro
+        de ``records``; importar o mesmo arquivo de novo não muda nada. Só
+        as chaves ficam em memória, além das partidas novas. As importadas
+        entram no arquivo principal; ``compact`` as leva ao mês certo.
+        Valores que não são partidas válidas (ver ``_is_record``) são
+        contados e ignorados, sem interromper a importação.
+
+        Args:
+            records: Valores lidos (ex: ``iter_records(caminho, records_only=False)``)
+
+        Returns:
+            Tupla (adicionadas, duplicadas ignoradas, inválidas ignoradas)
+        """
+        with self._write_lock():
+            data = self._load_file()
+            seen = {record_key(entry) for entry in data}
+            for month in self._archive_months():
+                seen.update(map(record_key, iter_records(self._segment_path(month))))
+
+            added = duplicates = invalid = 0
+            for entry in records:
+                if not _is_record(entry):
+                    invalid += 1
+                    continue
+                key = record_key(entry)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                data.append(
+                    {k: entry[k] for k in RECORD_KEYS + ("date", "ts") if k in entry}
+                )
+                added += 1
+
+            if added and not self._save_file(data):
+                return 0, duplicates, invalid
+        return added, duplicates, invalid
+
+    # ----------------------------------------
+    # Arquivo principal
+    # ----------------------------------------
+
+    def _load_file(self) -> List[Dict]:
+        """
+        Lê o arquivo principal.
+
+        Usa o cache do processo (``read_json_cached``): leituras repetidas
+        só custam um ``stat`` até o arquivo mudar no disco. Gravações de
+        outros processos são detectadas porque cada uma cria um arquivo
+        novo (``os.replace``).
+
+        Returns:
+            Cópia da lista de partidas (pode ser alterada pelo chamador)
+        """
+        return list(read_json_cached(self.FILE_PATH, self._parse_file, []))
+
+    def _parse_file(self) -> List[Dict]:
         try:
-            with open(self.FILE_PATH, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            with open(self.FILE_PATH, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (IOError, UnicodeDecodeError):
+            return self._recover("")
+        try:
+            data = json.loads(text)
+            if not isinstance(data, list):
+                raise TypeError("o histórico deve ser uma lista")
+            # As consultas contam com o arquivo ordenado por score
+            if any(a["score"] < b["score"] for a, b in pairwise(data)):
+                data.sort(key=lambda x: x["score"], reverse=True)
+        except (json.JSONDecodeError, TypeError, KeyError):
+            # Texto ilegível, ou JSON válido que não é uma lista de partidas
+            return self._recover(text)
+        return data
+
+    def _recover(self, text: str) -> List[Dict]:
+        """
+        Reconstrói o histórico a partir de um arquivo corrompido.
+
+        Junta o backup íntegro mais recente com os registros que ainda
+        podem ser lidos do arquivo principal (que pode ter partidas mais
+        novas que o backup). Não grava nada: o problema fica em
+        ``diagnostics`` e o arquivo corrompido é preservado em ``.corrupt``
+        pela próxima gravação (ver ``_save_file``).
+
+        Args:
+            text: Conteúdo do arquivo principal
+
+        Returns:
+            Registros recuperados, ordenados por score
+        """
+        data: List[Dict] = []
+        for i in range(1, self.BACKUP_COUNT + 1):
+            try:
+                with open(f"{self.FILE_PATH}.{i}", "r", encoding="utf-8") as f:
+                    backup = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(backup, list):
+                data = [entry for entry in backup if _is_record(entry)]
+                break
+
+        seen = {tuple(sorted(entry.items())) for entry in data}
+        for entry in salvage_records(text):
+            key = tuple(sorted(entry.items()))
+            if key not in seen:
+                seen.add(key)
+                data.append(entry)
+
+        _READ_PROBLEMS[os.path.abspath(self.FILE_PATH)] = (
+            f"{self.FILE_PATH} corrompido: {len(data)} registros recuperados"
+        )
+        data.sort(key=lambda x: x["score"], reverse=True)
+        return data
+
+    def _save_file(self, data: List[Dict]) -> bool:
+        """
+        Grava o histórico de forma atômica.
+
+        Ver ``write_json_atomic``: uma queda no meio deixa o arquivo antigo
+        intacto. A versão anterior vira backup por hard link, sem copiar
+        dados; se a última leitura achou o arquivo corrompido, ele também é
+        preservado em ``.corrupt``.
+        """
+        # Ordena por Score, mas NÃO apaga mais o histórico
+        data.sort(key=lambda x: x["score"], reverse=True)
+        try:
+            if _READ_PROBLEMS.get(os.path.abspath(self.FILE_PATH)):
+                self._preserve_corrupt()
+            self._rotate_backups()
+            write_json_atomic(self.FILE_PATH, data)
+            return True
         except IOError as e:
             print(f"Erro ao salvar score: {e}")
+            return False
+
+    def _preserve_corrupt(self) -> None:
+        """Copia o arquivo corrompido para ``.corrupt`` (só a 1ª vez)."""
+        corrupt_path = self.FILE_PATH + ".corrupt"
+        if os.path.exists(corrupt_path):
+            return
+        try:
+            shutil.copyfile(self.FILE_PATH, corrupt_path)
+        except OSError:  # A versão anterior ainda vai para o backup .1
+            pass
+
+    def _rotate_backups(self) -> None:
+        """Desloca scores.json.1 → .2 → ... e guarda a versão atual em .1."""
+        path = self.FILE_PATH
+        if self.BACKUP_COUNT <= 0 or not os.path.exists(path):
+            return
+        for i in range(self.BACKUP_COUNT - 1, 0, -1):
+            if os.path.exists(f"{path}.{i}"):
+                os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+        backup = f"{path}.1"
+        if os.path.exists(backup):
+            os.remove(backup)
+        try:
+            os.link(path, backup)
+        except OSError:
+            # Sistemas de arquivos sem hard link
+            shutil.copyfile(path, backup)
@@ -0,0 +1,280 @@
+# ARQUIVO: src/infrastructure/score_columns.py
+"""
+Histórico de pontuações em colunas, para estatísticas e relatórios.
+
+Cada campo vira um vetor: score (int64), data (segundos epoch, float64) e
+códigos categóricos (int32) para tema, dificuldade e jogador, com a lista
+de nomes de cada categoria ao lado. Contagens, melhor score, percentis e
+médias por jogador passam a ser operações vetoriais.
+
+Montar as colunas a partir dos registros extrai cada campo com
+``map``/``itemgetter`` e converte cada data antiga ("dd/mm HH:MM") uma vez
+só. Ainda assim passa por todos os dicts e custa da ordem de 1 s por
+milhão de partidas (cenário ``columns_from_entries`` de
+``benchmarks/domain_bench.py``); por isso o repositório monta uma vez e
+depois só acrescenta as partidas novas com ``add`` (ver
+``INCREMENTAL_KINDS``).
+
+Com NumPy instalado (``pip install numpy``) as agregações de 10 milhões de
+linhas levam algumas centenas de milissegundos (``columns_aggregate``).
+Sem NumPy os vetores são ``array.array`` e as agregações são laços
+simples, com o mesmo resultado.
+"""
+
+import math
+from array import array
+from datetime import datetime
+from operator import itemgetter, methodcaller
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Colunas categóricas disponíveis
+CATEGORIES = ("theme", "difficulty", "player")
+# Categoria → campo do registro
+_FIELDS = (("theme", "theme"), ("difficulty", "difficulty"), ("player", "name"))
+
+
+def entry_timestamp(entry: Dict, today: Optional[datetime] = None) -> float:
+    """
+    Data da partida em segundos epoch.
+
+    Usa o campo ``ts`` quando existe. Registros antigos só têm ``date``
+    ("dd/mm HH:MM"), sem o ano: usa o atual, ou o anterior se a data ainda
+    não chegou neste ano.
+
+    Returns:
+        Segundos epoch ou NaN se a data for ilegível
+    """
+    ts = entry.get("ts")
+    if ts is not None:
+        return float(ts)
+    today = today or datetime.now()
+    try:
+        day_month, hour_minute = entry["date"].split()
+        day, month = (int(x) for x in day_month.split("/"))
+        hour, minute = (int(x) for x in hour_minute.split(":"))
+    except (KeyError, ValueError, AttributeError):
+        return math.nan
+    for year in (today.year, today.year - 1):
+        try:
+            played = datetime(year, month, day, hour, minute)
+        except ValueError:  # 29/02 fora de ano bissexto, dia inválido...
+            continue
+        if played <= today:
+            return played.timestamp()
+    return math.nan
+
+
+class ScoreColumns:
+    """Histórico de partidas armazenado por colunas."""
+
+    def __init__(
+        self,
+        scores,
+        timestamps,
+        codes: Dict[str, object],
+        labels: Dict[str, List[str]],
+    ):
+        """
+        Args:
+            scores: Vetor de pontuações
+            timestamps: Vetor de datas (segundos epoch, NaN se desconhecida)
+            codes: Vetor de códigos por categoria (ver CATEGORIES)
+            labels: Nome de cada código por categoria
+        """
+        self.labels = labels
+        self._size = len(scores)
+        # Com NumPy, ``add`` aloca folga no fim: as colunas públicas são
+        # recortes (sem cópia) dos primeiros ``_size`` itens
+        self._columns = {"score": scores, "ts": timestamps, **codes}
+        self._label_codes = {
+            name: {label: i for i, label in enumerate(labels[name])}
+            for name in CATEGORIES
+        }
+
+    def _column(self, name: str):
+        column = self._columns[name]
+        return column if len(column) == self._size else column[: self._size]
+
+    @property
+    def scores(self):
+        return self._column("score")
+
+    @property
+    def timestamps(self):
+        return self._column("ts")
+
+    @property
+    def codes(self) -> Dict[str, object]:
+        return {name: self._column(name) for name in CATEGORIES}
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[Dict], today: Optional[datetime] = None
+    ) -> "ScoreColumns":
+        """
+        Monta as colunas a partir dos registros do repositório.
+
+        Args:
+            entries: Registros (dicts de ``scores.json``)
+            today: Referência para o ano das datas (padrão: agora)
+        """
+        today = today or datetime.now()
+        if not isinstance(entries, list):
+            entries = list(entries)
+
+        # Cada coluna é extraída por map/itemgetter (laço em C, não Python)
+        scores = array("q", map(itemgetter("score"), entries))
+        stamps = list(map(methodcaller("get", "ts"), entries))
+        if None in stamps:
+            # Registros antigos só têm "date": poucas datas distintas, então
+            # cada texto é convertido uma vez só
+            parsed: Dict[str, float] = {}
+            for i, ts in enumerate(stamps):
+                if ts is None:
+                    entry = entries[i]
+                    date = entry.get("date")
+                    if not isinstance(date, str):
+                        stamps[i] = entry_timestamp(entry, today)
+                        continue
+                    ts = parsed.get(date)
+                    if ts is None:
+                        ts = parsed[date] = entry_timestamp(entry, today)
+                    stamps[i] = ts
+        timestamps = array("d", stamps)
+
+        codes = {}
+        index: Dict[str, Dict[str, int]] = {}
+        for name, key in _FIELDS:
+            values = list(map(itemgetter(key), entries))
+            # Códigos na ordem de primeira aparição
+            mapping = index[name] = {
+                value: code for code, value in enumerate(dict.fromkeys(values))
+            }
+            codes[name] = array("i", map(mapping.__getitem__, values))
+
+        labels = {name: list(index[name]) for name in CATEGORIES}
+        if np is not None:
+            scores = np.frombuffer(scores, dtype=np.int64)
+            timestamps = np.frombuffer(timestamps, dtype=np.float64)
+            codes = {k: np.frombuffer(v, dtype=np.int32) for k, v in codes.items()}
+        return cls(scores, timestamps, codes, labels)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, entry: Dict, today: Optional[datetime] = None) -> None:
+        """
+        Acrescenta uma partida sem remontar as colunas.
+
+        Com NumPy a capacidade dobra quando enche, então o custo médio por
+        partida é constante.
+        """
+        values = {"score": entry["score"], "ts": entry_timestamp(entry, today)}
+        for name, key in _FIELDS:
+            mapping = self._label_codes[name]
+            code = mapping.get(entry[key])
+            if code is None:
+                code = mapping[entry[key]] = len(mapping)
+                self.labels[name].append(entry[key])
+            values[name] = code
+
+        for name, value in values.items():
+            column = self._columns[name]
+            if np is None:
+                column.append(value)
+                continue
+            if len(column) == self._size:
+                grown = np.empty(max(16, 2 * self._size), dtype=column.dtype)
+                grown[: self._size] = column
+                self._columns[name] = column = grown
+            column[self._size] = value
+        self._size += 1
+
+    # ----------------------------------------
+    # Agregações
+    # ----------------------------------------
+
+    def best_score(self) -> int:
+        """Maior pontuação (0 se vazio)."""
+        if not len(self):
+            return 0
+        return int(self.scores.max()) if np is not None else max(self.scores)
+
+    def counts(self, category: str) -> Dict[str, int]:
+        """
+        Partidas por valor de uma categoria.
+
+        Args:
+            category: "theme", "difficulty" ou "player"
+
+        Returns:
+            Nome → quantidade, na ordem de primeira aparição
+        """
+        labels = self.labels[category]
+        codes = self.codes[category]
+        if np is not None:
+            totals = np.bincount(codes, minlength=len(labels)).tolist()
+        else:
+            totals = [0] * len(labels)
+            for code in codes:
+                totals[code] += 1
+        return dict(zip(labels, totals))
+
+    def percentile(self, q: float) -> float:
+        """
+        Percentil ``q`` (0-100) das pontuações, com interpolação linear.
+
+        Returns:
+            Valor do percentil (NaN se vazio)
+        """
+        n = len(self)
+        if not n:
+            return math.nan
+        if np is not None:
+            return float(np.percentile(self.scores, q))
+        ordered = sorted(self.scores)
+        position = (n - 1) * q / 100
+        low = math.floor(position)
+        high = min(low + 1, n - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    def player_averages(self) -> Dict[str, float]:
+        """Pontuação média de cada jogador."""
+        labels = self.labels["player"]
+        codes = self.codes["player"]
+        if np is not None:
+            games = np.bincount(codes, minlength=len(labels))
+            totals = np.bincount(codes, weights=self.scores, minlength=len(labels))
+            return dict(zip(labels, (totals / np.maximum(games, 1)).tolist()))
+        games = [0] * len(labels)
+        totals = [0] * len(labels)
+        for code, score in zip(codes, self.scores):
+            games[code] += 1
+            totals[code] += score
+        return {
+            label: totals[i] / games[i] if games[i] else 0.0
+            for i, label in enumerate(labels)
+        }
+
+    def statistics(self) -> Dict:
+        """
+        Estatísticas do Dashboard (mesmo formato de ``get_statistics``).
+
+        Returns:
+            Dicionário vazio se não houver partidas
+        """
+        if not len(self):
+            return {}
+        themes = self.counts("theme")
+        return {
+            "total_games": len(self),
+            "best_score": self.best_score(),
+            "themes_count": themes,
+            "difficulty_count": self.counts("difficulty"),
+            "favorite_theme": max(themes, key=themes.get) if themes else "-",
+        }
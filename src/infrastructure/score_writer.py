@@ -0,0 +1,138 @@
+# ARQUIVO: src/infrastructure/score_writer.py
+"""
+Gravação de pontuações em segundo plano (write-behind).
+
+O ScoreWriter recebe os pedidos de ``save_score`` numa fila limitada e os
+executa numa thread própria, tirando a leitura/ordenação/escrita do JSON
+do frame da vitória. Cada pedido pode ter um callback chamado quando a
+gravação termina (``True`` se chegou ao disco), usado pela tela de Game
+Over para mostrar "Salvo". O callback roda na thread de escrita: deve só
+marcar estado, nunca desenhar.
+
+A compactação do histórico (``compact``) também roda nesta thread, na
+mesma fila das gravações.
+"""
+
+import queue
+import threading
+from typing import Callable, Optional
+
+from src.infrastructure.repository import ScoreRepository
+
+# Callback de confirmação: recebe True se a pontuação foi gravada
+SavedCallback = Callable[[bool], None]
+
+_STOP = object()
+
+
+class ScoreWriter:
+    """Fila de gravação de pontuações com uma thread de escrita."""
+
+    def __init__(self, repository: ScoreRepository, max_pending: int = 64):
+        """
+        Inicia a thread de escrita.
+
+        Args:
+            repository: Repositório onde as pontuações são gravadas
+            max_pending: Tamanho máximo da fila
+        """
+        self.repository = repository
+        self._queue: queue.Queue = queue.Queue(max_pending)
+        self._thread = threading.Thread(
+            target=self._run, name="score-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Pedidos ainda não gravados (aproximado)."""
+        return self._queue.unfinished_tasks
+
+    def submit(
+        self,
+        player_name: str,
+        score: int,
+        theme: str,
+        difficulty: str,
+        on_saved: Optional[SavedCallback] = None,
+    ) -> None:
+        """
+        Agenda a gravação de uma pontuação.
+
+        Se a fila estiver cheia, grava na hora (durabilidade acima de
+        latência); na prática isso só acontece com o disco travado.
+
+        Args:
+            player_name, score, theme, difficulty: Igual a ``save_score``
+            on_saved: Chamado após a gravação com o resultado
+        """
+        item = (player_name, score, theme, difficulty, on_saved)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._save(item)
+
+    def compact(self, keep_months: int = 2) -> None:
+        """
+        Agenda a compactação do histórico (ver ScoreRepository.compact).
+
+        Se a fila estiver cheia a compactação é simplesmente pulada: ela
+        pode rodar em qualquer outra abertura do jogo.
+        """
+        try:
+            self._queue.put_nowait(keep_months)
+        except queue.Full:
+            pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a fila esvaziar.
+
+        Args:
+            timeout: Espera máxima em segundos (None = sem limite)
+
+        Returns:
+            True se tudo foi gravado dentro do prazo
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Grava tudo o que está na fila e encerra a thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                if isinstance(item, int):
+                    self._compact(item)
+                else:
+                    self._save(item)
+            finally:
+                self._queue.task_done()
+
+    def _save(self, item) -> None:
+        player_name, score, theme, difficulty, on_saved = item
+        try:
+            ok = self.repository.save_score(player_name, score, theme, difficulty)
+        except Exception as e:  # A thread de escrita nunca pode morrer
+            print(f"Erro ao salvar score: {e}")
+            ok = False
+        if on_saved is not None:
+            on_saved(bool(ok))
+
+    def _compact(self, keep_months: int) -> None:
+        try:
+            archived = self.repository.compact(keep_months)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao compactar histórico: {e}")
+            return
+        if archived:
+            print(f"🗄️ {archived} partidas antigas arquivadas")
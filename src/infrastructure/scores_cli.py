@@ -0,0 +1,181 @@
+# ARQUIVO: src/infrastructure/scores_cli.py
+"""
+Manutenção do histórico de pontuações pela linha de comando.
+
+Uso:
+    python -m src.infrastructure.scores_cli compact --keep-months 2
+    python -m src.infrastructure.scores_cli rebuild-summary
+    python -m src.infrastructure.scores_cli repair
+    python -m src.infrastructure.scores_cli report
+    python -m src.infrastructure.scores_cli export historico.csv
+    python -m src.infrastructure.scores_cli import maquina01/scores.json ...
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import chain
+from typing import List, Optional
+
+from src.infrastructure.repository import ScoreRepository, iter_records
+
+# Colunas da exportação (``ts`` fica vazio nos registros antigos)
+EXPORT_FIELDS = ("name", "score", "theme", "difficulty", "date", "ts")
+
+
+def _repository(args) -> ScoreRepository:
+    repository = ScoreRepository()
+    repository.FILE_PATH = args.file
+    return repository
+
+
+def _print_problems(problems: List[str]) -> None:
+    for problem in problems:
+        print(f"⚠️ {problem}", file=sys.stderr)
+
+
+def cmd_compact(args) -> int:
+    repository = _repository(args)
+    # A compactação repara o que estiver corrompido antes de arquivar
+    _print_problems(repository.diagnostics())
+    archived = repository.compact(args.keep_months)
+    print(f"🗄️ {archived} partidas arquivadas")
+    return 0
+
+
+def cmd_repair(args) -> int:
+    problems = _repository(args).repair()
+    _print_problems(problems)
+    print("🛠️ Histórico reparado" if problems else "✅ Histórico íntegro")
+    return 0
+
+
+def cmd_rebuild_summary(args) -> int:
+    summaries = _repository(args).rebuild_summary()
+    print(f"📊 Resumo recriado com {len(summaries)} meses")
+    return 0
+
+
+def cmd_report(args) -> int:
+    columns = _repository(args).load_columns()
+    if not len(columns):
+        print("Nenhuma partida no arquivo principal.")
+        return 0
+    print(f"Partidas: {len(columns)}  Melhor: {columns.best_score()}")
+    print(
+        "Percentis (50/90/99): "
+        + " / ".join(f"{columns.percentile(q):.0f}" for q in (50, 90, 99))
+    )
+    for category in ("theme", "difficulty"):
+        counts = columns.counts(category)
+        print(f"{category}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    averages = sorted(columns.player_averages().items(), key=lambda x: -x[1])
+    for name, average in averages[: args.top]:
+        print(f"  {name:<20} média {average:8.1f}")
+    return 0
+
+
+def cmd_export(args) -> int:
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if fmt not in ("csv", "jsonl"):
+        print("Formato desconhecido: use --format csv ou jsonl", file=sys.stderr)
+        return 2
+
+    out = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", encoding="utf-8", newline="")
+    )
+    count = 0
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(
+                out, EXPORT_FIELDS, extrasaction="ignore", lineterminator="\n"
+            )
+            writer.writeheader()
+        for entry in _repository(args).iter_entries():
+            if fmt == "csv":
+                writer.writerow(entry)
+            else:
+                out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"📤 {count} partidas exportadas", file=sys.stderr)
+    return 0
+
+
+def cmd_import(args) -> int:
+    missing = [path for path in args.sources if not os.path.isfile(path)]
+    if missing:
+        print(f"Arquivo não encontrado: {', '.join(missing)}", file=sys.stderr)
+        return 1
+    # Um único ciclo ler → juntar → gravar para todos os arquivos
+    records = chain.from_iterable(
+        iter_records(path, records_only=False) for path in args.sources
+    )
+    added, duplicates, invalid = _repository(args).import_scores(records)
+    print(f"📥 {added} partidas importadas, {duplicates} repetidas ignoradas")
+    if invalid:
+        print(f"⚠️ {invalid} registros inválidos ignorados", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Manutenção do ranking")
+    parser.add_argument("--file", default=ScoreRepository.FILE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compact = commands.add_parser(
+        "compact", help="Arquiva as partidas antigas por mês"
+    )
+    compact.add_argument(
+        "--keep-months",
+        type=int,
+        default=2,
+        help="Meses mantidos no arquivo principal, contando o atual",
+    )
+    compact.set_defaults(func=cmd_compact)
+
+    rebuild = commands.add_parser(
+        "rebuild-summary", help="Recria o resumo a partir dos segmentos"
+    )
+    rebuild.set_defaults(func=cmd_rebuild_summary)
+
+    repair = commands.add_parser(
+        "repair", help="Regrava o histórico ou o resumo se estiverem corrompidos"
+    )
+    repair.set_defaults(func=cmd_repair)
+
+    report = commands.add_parser(
+        "report", help="Resumo estatístico das partidas recentes"
+    )
+    report.add_argument("--top", type=int, default=10, help="Jogadores listados")
+    report.set_defaults(func=cmd_report)
+
+    export = commands.add_parser(
+        "export", help="Exporta todo o histórico para CSV ou JSONL"
+    )
+    export.add_argument("output", help="Arquivo de saída ('-' = saída padrão)")
+    export.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        help="Formato (padrão: pela extensão do arquivo)",
+    )
+    export.set_defaults(func=cmd_export)
+
+    import_ = commands.add_parser(
+        "import", help="Junta scores.json/JSONL de outras máquinas, sem repetir"
+    )
+    import_.add_argument("sources", nargs="+", help="Arquivos a importar")
+    import_.set_defaults(func=cmd_import)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,356 @@
+# ARQUIVO: src/infrastructure/snapshot.py
+"""
+Retratos e deltas binários do estado de uma partida.
+
+Retrato (``encode_snapshot``): tudo o que é preciso para reconstruir o
+Board e o GameService (ou MultiPlayerGameService)::
+
+    b"MGS1" | tipo | linhas | colunas | semente+1 | multiplicador (double)
+    | tempo decorrido (ms) | terminou | cartas | estados | 1ª carta+1
+    | contadores
+
+Delta (``encode_delta``): apenas o que mudou entre dois GameState
+capturados com ``capture_state``::
+
+    máscara | [n, (célula << 2 | estado)...] | [n, (jogador, pontos,
+    movimentos, combo)...] | [1ª carta+1] | [vez]
+
+Inteiros são varints (ver replay_store); uma jogada comum gera 3 a 10
+bytes e o retrato de um 6x6 leva dezenas de microssegundos.
+"""
+
+import struct
+import time
+from typing import List, NamedTuple, Tuple
+
+from src.domain.board import Board
+from src.infrastructure.replay_store import (
+    decode_varint,
+    encode_varint,
+    unzigzag,
+    zigzag,
+)
+from src.services.game_service import GameService
+from src.services.multiplayer_service import MultiPlayerGameService
+from src.services.replay import RecordedLayoutStrategy
+
+MAGIC = b"MGS1"
+DOUBLE = struct.Struct("<d")
+
+# Estado de uma carta (mesmos bits do protocolo de rede)
+REVEALED = 1
+MATCHED = 2
+
+# Tipo de serviço no retrato
+SOLO = 0
+MULTIPLAYER = 1
+
+# Campos presentes num delta (máscara)
+DELTA_CARDS = 1
+DELTA_COUNTERS = 2
+DELTA_FIRST = 4
+DELTA_TURN = 8
+
+
+class GameState(NamedTuple):
+    """Estado mutável de uma partida, capturado para cálculo de deltas."""
+
+    flags: bytes  # Estado de cada carta, linha a linha
+    counters: Tuple[Tuple[int, int, int], ...]  # (pontos, movimentos, combo)
+    first: int  # Célula da primeira carta do par + 1 (0 = nenhuma)
+    turn: int  # Jogador da vez
+
+
+def _card_flags(board: Board) -> bytes:
+    return bytes(
+        (REVEALED if card.is_revealed else 0) | (MATCHED if card.is_matched else 0)
+        for row in board.grid
+        for card in row
+    )
+
+
+def _first_cell(service: GameService) -> int:
+    if service.first_selected_pos is None:
+        return 0
+    row, col = service.first_selected_pos
+    return row * service.board.cols + col + 1
+
+
+def capture_state(service: GameService) -> GameState:
+    """
+    Captura o estado mutável de uma partida.
+
+    Args:
+        service: GameService ou MultiPlayerGameService
+
+    Returns:
+        GameState imutável (para comparar com ``encode_delta``)
+    """
+    if isinstance(service, MultiPlayerGameService):
+        counters = tuple(zip(service.scores, service.player_moves, service.combos))
+        turn = service.current_player
+    else:
+        counters = ((service.score, service.moves, service.combo_streak),)
+        turn = 0
+    return GameState(_card_flags(service.board), counters, _first_cell(service), turn)
+
+
+# ----------------------------------------
+# Deltas
+# ----------------------------------------
+
+
+def encode_delta(previous: GameState, current: GameState) -> bytes:
+    """
+    Codifica as diferenças entre dois estados da mesma partida.
+
+    Args:
+        previous: Estado conhecido pelo destinatário
+        current: Estado atual
+
+    Returns:
+        Delta binário (``b"\\x00"`` se nada mudou)
+    """
+    mask = 0
+    body = bytearray()
+
+    cards = [
+        (i, new)
+        for i, (old, new) in enumerate(zip(previous.flags, current.flags))
+        if old != new
+    ]
+    if cards:
+        mask |= DELTA_CARDS
+        body += encode_varint(len(cards))
+        for cell, flags in cards:
+            body += encode_varint((cell << 2) | flags)
+
+    old_counters = previous.counters
+    counters = [
+        (i, values)
+        for i, values in enumerate(current.counters)
+        if i >= len(old_counters) or old_counters[i] != values
+    ]
+    if counters:
+        mask |= DELTA_COUNTERS
+        body += encode_varint(len(counters))
+        for index, (score, moves, combo) in counters:
+            body += encode_varint(index)
+            body += encode_varint(zigzag(score))
+            body += encode_varint(moves)
+            body += encode_varint(combo)
+
+    if previous.first != current.first:
+        mask |= DELTA_FIRST
+        body += encode_varint(current.first)
+
+    if previous.turn != current.turn:
+        mask |= DELTA_TURN
+        body += encode_varint(current.turn)
+
+    return bytes([mask]) + bytes(body)
+
+
+def apply_delta(service: GameService, data: bytes) -> None:
+    """
+    Aplica um delta de ``encode_delta`` a uma partida.
+
+    Args:
+        service: Partida no estado ``previous`` do delta
+        data: Delta binário
+    """
+    board = service.board
+    cols = board.cols
+    mask = data[0]
+    offset = 1
+
+    if mask & DELTA_CARDS:
+        count, offset = decode_varint(data, offset)
+        for _ in range(count):
+            packed, offset = decode_varint(data, offset)
+            row, col = divmod(packed >> 2, cols)
+            card = board.grid[row][col]
+            card.is_revealed = bool(packed & REVEALED)
+            card.is_matched = bool(packed & MATCHED)
+
+    if mask & DELTA_COUNTERS:
+        count, offset = decode_varint(data, offset)
+        multiplayer = isinstance(service, MultiPlayerGameService)
+        for _ in range(count):
+            index, offset = decode_varint(data, offset)
+            score, offset = decode_varint(data, offset)
+            moves, offset = decode_varint(data, offset)
+            combo, offset = decode_varint(data, offset)
+            if multiplayer:
+                while index >= len(service.players):
+                    service.add_player("")
+                service.scores[index] = unzigzag(score)
+                service.player_moves[index] = moves
+                service.combos[index] = combo
+            else:
+                service.score = unzigzag(score)
+                service.moves = moves
+                service.combo_streak = combo
+
+    if mask & DELTA_FIRST:
+        first, offset = decode_varint(data, offset)
+        service.first_selected_pos = divmod(first - 1, cols) if first else None
+
+    if mask & DELTA_TURN:
+        service.current_player, offset = decode_varint(data, offset)
+
+    if service.end_time is None and board.all_matched:
+        service.end_time = time.time()
+
+
+# ----------------------------------------
+# Retratos
+# ----------------------------------------
+
+
+def _encode_text(out: bytearray, text: str) -> None:
+    data = text.encode("utf-8")
+    out += encode_varint(len(data))
+    out += data
+
+
+def _decode_text(data: bytes, offset: int) -> Tuple[str, int]:
+    size, offset = decode_varint(data, offset)
+    end = offset + size
+    return data[offset:end].decode("utf-8"), end
+
+
+def encode_snapshot(service: GameService) -> bytes:
+    """
+    Codifica o estado completo de uma partida.
+
+    Args:
+        service: GameService ou MultiPlayerGameService
+
+    Returns:
+        Retrato binário
+    """
+    board = service.board
+    multiplayer = isinstance(service, MultiPlayerGameService)
+    out = bytearray(MAGIC)
+    out.append(MULTIPLAYER if multiplayer else SOLO)
+    out += encode_varint(board.rows)
+    out += encode_varint(board.cols)
+    out += encode_varint(board.seed + 1 if board.seed is not None else 0)
+    out += DOUBLE.pack(service.difficulty_multiplier)
+    elapsed = (service.end_time or time.time()) - service.start_time
+    out += encode_varint(max(0, int(elapsed * 1000)))
+    out.append(1 if service.end_time is not None else 0)
+
+    for row in board.grid:
+        for card in row:
+            match_id = card.match_id.encode("utf-8")
+            if card.display_content == card.match_id:
+                # Conteúdo igual ao match_id (emojis): grava uma vez só
+                out += encode_varint((len(match_id) << 1) | 1)
+                out += match_id
+            else:
+                out += encode_varint(len(match_id) << 1)
+                out += match_id
+                _encode_text(out, card.display_content)
+
+    out += _card_flags(board)
+    out += encode_varint(_first_cell(service))
+
+    if multiplayer:
+        out += encode_varint(len(service.players))
+        for i, name in enumerate(service.players):
+            _encode_text(out, name)
+            out += encode_varint(zigzag(service.scores[i]))
+            out += encode_varint(service.player_moves[i])
+            out += encode_varint(service.combos[i])
+        out += encode_varint(service.current_player)
+    else:
+        out += encode_varint(zigzag(service.score))
+        out += encode_varint(service.moves)
+        out += encode_varint(service.combo_streak)
+
+    return bytes(out)
+
+
+def decode_snapshot(data: bytes) -> GameService:
+    """
+    Reconstrói a partida de um retrato de ``encode_snapshot``.
+
+    Args:
+        data: Retrato binário
+
+    Returns:
+        GameService (ou MultiPlayerGameService) no estado do retrato
+
+    Raises:
+        ValueError: Se os dados não forem um retrato válido
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Retrato inválido (assinatura incorreta).")
+    offset = len(MAGIC)
+    kind = data[offset]
+    offset += 1
+    rows, offset = decode_varint(data, offset)
+    cols, offset = decode_varint(data, offset)
+    seed, offset = decode_varint(data, offset)
+    (multiplier,) = DOUBLE.unpack_from(data, offset)
+    offset += DOUBLE.size
+    elapsed_ms, offset = decode_varint(data, offset)
+    finished = data[offset] == 1
+    offset += 1
+
+    layout: List[List[str]] = []
+    for _ in range(rows * cols):
+        header, offset = decode_varint(data, offset)
+        end = offset + (header >> 1)
+        match_id = data[offset:end].decode("utf-8")
+        offset = end
+        if header & 1:
+            display = match_id
+        else:
+            display, offset = _decode_text(data, offset)
+        layout.append([match_id, display])
+
+    board = Board(
+        rows,
+        cols,
+        strategy=RecordedLayoutStrategy(layout),
+        seed=seed - 1 if seed else None,
+    )
+    flags = data[offset : offset + rows * cols]
+    offset += rows * cols
+    for i, card_flags in enumerate(flags):
+        card = board.grid[i // cols][i % cols]
+        card.is_revealed = bool(card_flags & REVEALED)
+        card.is_matched = bool(card_flags & MATCHED)
+    first, offset = decode_varint(data, offset)
+
+    if kind == MULTIPLAYER:
+        count, offset = decode_varint(data, offset)
+        players, counters = [], []
+        for _ in range(count):
+            name, offset = _decode_text(data, offset)
+            score, offset = decode_varint(data, offset)
+            moves, offset = decode_varint(data, offset)
+            combo, offset = decode_varint(data, offset)
+            players.append(name)
+            counters.append((unzigzag(score), moves, combo))
+        service = MultiPlayerGameService(board, players, multiplier)
+        for i, (score, moves, combo) in enumerate(counters):
+            service.scores[i] = score
+            service.player_moves[i] = moves
+            service.combos[i] = combo
+        service.current_player, offset = decode_varint(data, offset)
+    else:
+        service = GameService(board, multiplier)
+        score, offset = decode_varint(data, offset)
+        service.score = unzigzag(score)
+        service.moves, offset = decode_varint(data, offset)
+        service.combo_streak, offset = decode_varint(data, offset)
+
+    service.first_selected_pos = divmod(first - 1, cols) if first else None
+    now = time.time()
+    service.start_time = now - elapsed_ms / 1000
+    service.end_time = now if finished else None
+    return service
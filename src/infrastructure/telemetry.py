@@ -0,0 +1,171 @@
+# ARQUIVO: src/infrastructure/telemetry.py
+"""
+Telemetria de tempo por frame.
+
+Mede quanto cada fase do loop principal (eventos, update, desenho do
+tabuleiro, partículas, flip...) custa em cada frame e mantém uma janela
+móvel para cálculo de percentis (p50/p95/p99) e exportação em CSV.
+
+O "total" de um frame é só o trabalho (de ``begin_frame`` a
+``end_frame``); a taxa de quadros vem do intervalo entre inícios de frame
+consecutivos, que inclui a espera do ``clock.tick``.
+"""
+
+import csv
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+
+class FrameProfiler:
+    """
+    Coletor de tempos por fase de frame.
+
+    Uso típico no loop::
+
+        profiler.begin_frame()
+        profiler.start("events")
+        ...
+        profiler.stop("events")
+        with profiler.phase("board"):
+            ...
+        profiler.end_frame()
+    """
+
+    # Ordem das colunas (fases desconhecidas são adicionadas ao final)
+    PHASES = (
+        "events",
+        "update",
+        "board",
+        "stats",
+        "particles",
+        "flashcards",
+        "overlay",
+        "screen",
+        "flip",
+    )
+
+    def __init__(self, window: int = 600):
+        """
+        Inicializa o coletor.
+
+        Args:
+            window: Quantidade de frames mantidos na janela móvel
+        """
+        self.window = window
+        self.frames: deque[Dict[str, float]] = deque(maxlen=window)
+        # Intervalo (ms) entre inícios de frame consecutivos
+        self.intervals: deque[float] = deque(maxlen=window)
+        self.frame_count = 0
+
+        self._current: Dict[str, float] = {}
+        self._started: Dict[str, float] = {}
+        self._frame_start: float | None = None
+
+    def begin_frame(self) -> None:
+        """Marca o início de um frame."""
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.intervals.append((now - self._frame_start) * 1000)
+        self._current = {}
+        self._started = {}
+        self._frame_start = now
+
+    def start(self, name: str) -> None:
+        """Inicia a medição de uma fase."""
+        self._started[name] = time.perf_counter()
+
+    def stop(self, name: str) -> None:
+        """Encerra a medição de uma fase (acumula se chamada várias vezes)."""
+        started = self._started.pop(name, None)
+        if started is None:
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        self._current[name] = self._current.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Mede o bloco ``with`` como uma fase."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    def end_frame(self) -> None:
+        """Fecha o frame atual e o adiciona à janela móvel."""
+        self._current["total"] = (time.perf_counter() - self._frame_start) * 1000
+        self.frames.append(self._current)
+        self.frame_count += 1
+
+    def fps(self) -> float:
+        """
+        Quadros por segundo na janela móvel (0 antes do segundo frame).
+
+        Usa o tempo real entre frames, não o trabalho de cada um: um frame
+        de 2 ms limitado a 60 FPS pelo ``clock.tick`` conta como 60, não 500.
+        """
+        elapsed = sum(self.intervals)
+        return 1000 * len(self.intervals) / elapsed if elapsed > 0 else 0.0
+
+    def phase_names(self) -> List[str]:
+        """Retorna as fases vistas na janela, na ordem das colunas."""
+        seen = {name for frame in self.frames for name in frame}
+        names = [p for p in self.PHASES if p in seen]
+        names += sorted(seen - set(names) - {"total"})
+        return names
+
+    def percentiles(
+        self, name: str, quantiles: Tuple[int, ...] = (50, 95, 99)
+    ) -> Tuple[float, ...]:
+        """
+        Calcula percentis de uma fase na janela móvel.
+
+        Frames em que a fase não rodou contam como 0 ms.
+
+        Args:
+            name: Nome da fase (ou "total")
+            quantiles: Percentis desejados (0-100)
+
+        Returns:
+            Tupla com os valores em milissegundos
+        """
+        values = sorted(frame.get(name, 0.0) for frame in self.frames)
+        if not values:
+            return tuple(0.0 for _ in quantiles)
+
+        last = len(values) - 1
+        return tuple(values[min(last, int(round(q / 100 * last)))] for q in quantiles)
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Resume a janela móvel.
+
+        Returns:
+            Dicionário {fase: (p50, p95, p99)}, incluindo "total"
+        """
+        names = self.phase_names() + ["total"]
+        return {name: self.percentiles(name) for name in names}
+
+    def dump_csv(self, path: str) -> str:
+        """
+        Exporta os frames da janela móvel em CSV (um frame por linha).
+
+        Args:
+            path: Caminho do arquivo de saída
+
+        Returns:
+            O caminho gravado
+        """
+        names = self.phase_names() + ["total"]
+        first_frame = self.frame_count - len(self.frames)
+
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + [f"{n}_ms" for n in names])
+            for i, frame in enumerate(self.frames):
+                writer.writerow(
+                    [first_frame + i] + [f"{frame.get(n, 0.0):.3f}" for n in names]
+                )
+        return path
@@ -7,21 +7,32 @@ e gerencia o ciclo de vida da aplicação.
 """
 
 import os
+import time
 
 import pygame
 
 import src.ui.styles as styles  # Import do módulo inteiro
 from src.domain.board import Board
-from src.domain.strategies import ChemistryStrategy, EmojiStrategy, MathStrategy
+from src.domain.solver import score_multiplier
+from src.domain.strategies import strategy_for_theme
+from src.infrastructure.autosave import AutosaveWriter, encode_save, load_save
+from src.infrastructure.replay_store import ReplayWriter
 from src.infrastructure.repository import ScoreRepository
+from src.infrastructure.score_writer import ScoreWriter
+from src.infrastructure.telemetry import FrameProfiler
+from src.services.ai_player import AI_PROFILES, AIPlayer
+from src.services.event_log import GameEventLog
 from src.services.game_service import GameService
+from src.services.versus_service import VersusGameService
 from src.ui.components import InputBox
 from src.ui.gui import GraphicUI
 from src.ui.menu import MenuUI
+from src.ui.profiler import ProfilerOverlay
 from src.ui.ranking import RankingUI
 from src.ui.settings import SettingsUI
 from src.ui.statistics import StatisticsUI
 from src.ui.styles import DIMENSIONS
+from src.ui.versus import VersusUI
 
 
 class GameManager:
@@ -32,8 +43,22 @@ class GameManager:
     LOGIN → MENU → GAME/RANKING/STATS/SETTINGS
     """
 
-    def __init__(self):
-        """Inicializa o gerenciador e todos os subsistemas."""
+    # Pasta onde os replays das partidas são gravados
+    REPLAY_DIR = "replays"
+    # Partida em andamento salva automaticamente
+    AUTOSAVE_FILE = "autosave.mgv"
+    # Arquivar partidas antigas ao abrir o jogo é opcional (run_game.py
+    # --compact); o caminho explícito é ``scores_cli compact``
+    COMPACT_ON_START = False
+
+    def __init__(self, compact_on_start: bool | None = None):
+        """
+        Inicializa o gerenciador e todos os subsistemas.
+
+        Args:
+            compact_on_start: Arquiva as partidas antigas do ranking em
+                segundo plano ao abrir (None = ``COMPACT_ON_START``)
+        """
         os.environ["SDL_VIDEO_CENTERED"] = "1"
         pygame.init()
 
@@ -43,15 +68,29 @@ class GameManager:
         self.clock = pygame.time.Clock()
 
         self.repository = ScoreRepository()
+        # Pontuações são gravadas fora do loop de desenho
+        self.score_writer = ScoreWriter(self.repository)
+        if compact_on_start is None:
+            compact_on_start = self.COMPACT_ON_START
+        if compact_on_start:
+            self.score_writer.compact()
+        self.autosave = AutosaveWriter(self.AUTOSAVE_FILE)
         self.state = "LOGIN"
 
+        # Telemetria de frame (F3 mostra o overlay, F4 exporta CSV)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler)
+
         # Inicializa todas as telas
         self.menu = MenuUI()
+        self.menu.can_continue = self.autosave.has_save
         self.ranking_ui = RankingUI(self.repository)
         self.stats_ui = StatisticsUI(self.repository)
         self.settings_ui = SettingsUI()
 
         self.game_ui = None
+        self.replay_writer: ReplayWriter | None = None
+        self.replay_service = None
         self.player_name = ""
 
         self.font_login = pygame.font.SysFont("segoeui", 40)
@@ -71,55 +110,143 @@ class GameManager:
         rows, cols = difficulty_tuple
         self.current_difficulty = difficulty_tuple
 
-        current_card_size = DIMENSIONS["card_size"]
-        if rows >= 6:
-            current_card_size = 85
-
-        multiplier = 1.0
         if rows == 4 and cols == 4:
             self.selected_difficulty_label = "Fácil"
-            multiplier = 1.0
         elif cols == 4:
             self.selected_difficulty_label = "Médio"
-            multiplier = 1.5
         else:
             self.selected_difficulty_label = "Difícil"
-            multiplier = 2.0
 
-        if self.selected_theme == "Matemática":
-            strategy = MathStrategy()
-        elif self.selected_theme == "Química":
-            strategy = ChemistryStrategy()
-        else:
-            strategy = EmojiStrategy(theme=self.selected_theme)
+        # Multiplicadores históricos no menu; solver nos demais tamanhos
+        multiplier = score_multiplier(rows, cols)
+
+        strategy = strategy_for_theme(self.selected_theme)
 
         try:
             board = Board(rows=rows, cols=cols, strategy=strategy)
-            service = GameService(board, difficulty_multiplier=multiplier)
-
-            req_width = (cols * (current_card_size + DIMENSIONS["gap"])) + 100
-            req_height = (
-                DIMENSIONS["header_height"]
-                + (rows * (current_card_size + DIMENSIONS["gap"]))
-                + 120
+            event_log = GameEventLog.for_board(
+                board,
+                difficulty_multiplier=multiplier,
+                metadata={
+                    "player": self.player_name,
+                    "theme": self.selected_theme,
+                    "difficulty": self.selected_difficulty_label,
+                    "mode": "versus" if self.menu.versus else "solo",
+                },
             )
-
-            final_w = max(self.menu_size[0], req_width)
-            final_h = max(self.menu_size[1], req_height)
-
-            self.screen = pygame.display.set_mode((final_w, final_h))
-            self.game_ui = GraphicUI(service, card_size=current_card_size)
-            self.game_ui.screen = self.screen
-            self.game_ui.set_theme(
-                self.selected_theme
-            )  # Define o tema para buscar fatos
-            self.state = "GAME"
+            if self.menu.versus:
+                service = VersusGameService(
+                    board,
+                    players=(self.player_name or "Jogador", "Computador"),
+                    difficulty_multiplier=multiplier,
+                    event_log=event_log,
+                )
+            else:
+                service = GameService(
+                    board, difficulty_multiplier=multiplier, event_log=event_log
+                )
+            self._open_replay(service)
+
+            if self.menu.versus:
+                # O computador joga no nível da dificuldade escolhida
+                ai = AIPlayer(AI_PROFILES[self.selected_difficulty_label])
+                self._open_game_screen(service, ai=ai)
+            else:
+                self._open_game_screen(service)
+                self.game_ui.on_change = self._autosave_game
+                # Uma nova partida substitui o salvamento anterior
+                self._autosave_game()
 
         except ValueError as e:
             print(f"Erro Fatal: {e}")
 
+    def resume_game(self) -> None:
+        """Continua a partida salva automaticamente (opção do menu)."""
+        loaded = load_save(self.AUTOSAVE_FILE)
+        if loaded is None:
+            self.menu.can_continue = False
+            return
+
+        header, service = loaded
+        self.player_name = header.get("player") or self.player_name
+        self.selected_theme = header.get("theme")
+        self.selected_difficulty_label = header.get("difficulty", "")
+        self.current_difficulty = (service.board.rows, service.board.cols)
+
+        # Partidas retomadas não têm replay (o registro começou em outra sessão)
+        self._close_replay()
+        self._open_game_screen(service)
+        pending = header.get("pending_hide")
+        if pending:
+            self.game_ui.set_pending_hide(tuple(pending[0]), tuple(pending[1]))
+        self.game_ui.on_change = self._autosave_game
+
+    def _open_game_screen(self, service: GameService, ai: AIPlayer = None) -> None:
+        """
+        Ajusta a janela ao tabuleiro e cria a interface da partida.
+
+        Args:
+            service: Partida a exibir
+            ai: Oponente do modo versus (None = partida solo)
+        """
+        rows, cols = service.board.rows, service.board.cols
+        current_card_size = DIMENSIONS["card_size"]
+        if rows >= 6:
+            current_card_size = 85
+
+        req_width = (cols * (current_card_size + DIMENSIONS["gap"])) + 100
+        req_height = (
+            DIMENSIONS["header_height"]
+            + (rows * (current_card_size + DIMENSIONS["gap"]))
+            + 120
+        )
+
+        final_w = max(self.menu_size[0], req_width)
+        final_h = max(self.menu_size[1], req_height)
+
+        self.screen = pygame.display.set_mode((final_w, final_h))
+        if ai is not None:
+            self.game_ui = VersusUI(
+                service, ai, card_size=current_card_size, profiler=self.profiler
+            )
+        else:
+            self.game_ui = GraphicUI(
+                service, card_size=current_card_size, profiler=self.profiler
+            )
+        self.game_ui.screen = self.screen
+        self.game_ui.set_theme(self.selected_theme)  # Define o tema para buscar fatos
+        self.state = "GAME"
+
+    def _autosave_game(self) -> None:
+        """
+        Agenda o salvamento da partida solo em andamento.
+
+        Só codifica o retrato (microssegundos); a escrita acontece na
+        thread do AutosaveWriter. Partida terminada apaga o salvamento.
+        """
+        if self.game_ui is None or self.game_ui.on_change is None:
+            return
+        service = self.game_ui.service
+        if service.board.all_matched:
+            self.autosave.clear()
+            return
+
+        pending = self.game_ui.cards_to_hide if self.game_ui.waiting_to_hide else None
+        header = {
+            "player": self.player_name,
+            "theme": self.selected_theme,
+            "difficulty": self.selected_difficulty_label,
+            "pending_hide": pending,
+        }
+        self.autosave.submit(encode_save(service, header))
+
     def return_to_menu(self) -> None:
         """Retorna ao menu principal."""
+        if self.state == "GAME":
+            # Guarda o tempo decorrido até aqui
+            self._autosave_game()
+        self.menu.can_continue = self.autosave.has_save
+        self._close_replay()
         self.state = "MENU"
         os.environ["SDL_VIDEO_CENTERED"] = "1"
         self.screen = pygame.display.set_mode(self.menu_size)
@@ -129,18 +256,33 @@ class GameManager:
         """Loop principal da aplicação."""
         running = True
         while running:
+            profiler = self.profiler
+            profiler.begin_frame()
+
             if self.state != "MENU":
                 pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
+            profiler.start("events")
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
 
+                # --- TELEMETRIA ---
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_F3:
+                        self.profiler_overlay.toggle()
+                    elif event.key == pygame.K_F4:
+                        path = profiler.dump_csv(
+                            time.strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+                        )
+                        print(f"📈 Telemetria exportada: {path}")
+
                 # --- LOGIN ---
                 if self.state == "LOGIN":
                     name = self.input_box.handle_event(event)
                     if name:
                         self.player_name = name
+                        self.stats_ui.player_name = name
                         self.state = "MENU"
 
                 # --- MENU ---
@@ -152,14 +294,16 @@ class GameManager:
                             type_action, value = result
 
                             if type_action == "ACTION":
-                                if value == "RANKING":
-                                    self.state = "RANKING"
-                                elif value == "STATS":
-                                    self.state = "STATS"
+                                if value in ("RANKING", "STATS"):
+                                    self._open_scores_screen(value)
                                 elif value == "SETTINGS":
                                     self.state = "SETTINGS"
                                 elif value == "BACK":
                                     self.menu.reset()
+                                elif value == "VERSUS":
+                                    self.menu.toggle_versus()
+                                elif value == "CONTINUE":
+                                    self.resume_game()
 
                             elif type_action == "THEME_SELECT":
                                 self.selected_theme = value
@@ -171,6 +315,7 @@ class GameManager:
                 elif self.state == "RANKING":
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                         self.state = "MENU"
+                    self.ranking_ui.handle_scroll(event)
                     if event.type == pygame.MOUSEBUTTONDOWN:
                         if self.ranking_ui.handle_click(event) == "BACK":
                             self.state = "MENU"
@@ -210,42 +355,114 @@ class GameManager:
                         self.start_game(self.current_difficulty)
                     elif action == "RANKING":
                         self.return_to_menu()
-                        self.state = "RANKING"
+                        self._open_scores_screen("RANKING")
 
                     if (
                         self.game_ui.service.board.all_matched
                         and not self.game_ui.saved
                     ):
-                        self.repository.save_score(
-                            self.player_name,
-                            self.game_ui.service.score,
-                            self.selected_theme,
-                            self.selected_difficulty_label,
-                        )
+                        # Partidas contra o computador não entram no ranking
+                        if not isinstance(self.game_ui, VersusUI):
+                            self.game_ui.save_status = "saving"
+                            self.score_writer.submit(
+                                self.player_name,
+                                self.game_ui.service.score,
+                                self.selected_theme,
+                                self.selected_difficulty_label,
+                                on_saved=self.game_ui.mark_saved,
+                            )
+                        self._close_replay()
                         self.game_ui.saved = True
 
+            profiler.stop("events")
+
             # --- DESENHO ---
-            self.screen.fill(styles.COLORS["background"])
-
-            if self.state == "LOGIN":
-                self._draw_login()
-            elif self.state == "MENU":
-                self.menu.draw(self.screen)
-            elif self.state == "RANKING":
-                self.ranking_ui.draw(self.screen)
-            elif self.state == "STATS":
-                self.stats_ui.draw(self.screen)
-            elif self.state == "SETTINGS":
-                self.settings_ui.draw(self.screen)
-            elif self.state == "GAME":
-                self.game_ui.update()
+            if self.state == "GAME":
+                with profiler.phase("update"):
+                    self.game_ui.update()
                 self.game_ui.draw()
+            else:
+                with profiler.phase("screen"):
+                    self.screen.fill(styles.COLORS["background"])
+
+                    if self.state == "LOGIN":
+                        self._draw_login()
+                    elif self.state == "MENU":
+                        self.menu.draw(self.screen)
+                    elif self.state == "RANKING":
+                        self.ranking_ui.draw(self.screen)
+                    elif self.state == "STATS":
+                        self.stats_ui.draw(self.screen)
+                    elif self.state == "SETTINGS":
+                        self.settings_ui.draw(self.screen)
+
+            self.profiler_overlay.draw(self.screen)
+
+            with profiler.phase("flip"):
+                pygame.display.flip()
+            profiler.end_frame()
 
-            pygame.display.flip()
             self.clock.tick(60)
 
+        if self.state == "GAME":
+            self._autosave_game()
+        self.autosave.close()
+        # Garante que nenhuma pontuação na fila se perca ao fechar a janela
+        self.score_writer.close()
+        self._close_replay()
         pygame.quit()
 
+    def _open_scores_screen(self, state: str) -> None:
+        """
+        Abre o Ranking ou as Estatísticas.
+
+        Espera (no máximo 1s) as pontuações ainda na fila de gravação, para
+        que a última partida já apareça na tela.
+
+        Args:
+            state: "RANKING" ou "STATS"
+        """
+        self.score_writer.flush(timeout=1.0)
+        self.state = state
+
+    def _open_replay(self, service: GameService) -> None:
+        """
+        Começa a gravar a partida em REPLAY_DIR (formato binário ``.mgr``).
+
+        Cada evento é escrito no arquivo à medida que acontece, então até
+        partidas abandonadas ficam registradas.
+
+        Args:
+            service: Serviço da partida (com ``event_log``)
+        """
+        self._close_replay()
+        event_log = service.event_log
+        filename = time.strftime("%Y%m%d_%H%M%S") + f"_{event_log.seed}.mgr"
+        try:
+            os.makedirs(self.REPLAY_DIR, exist_ok=True)
+            self.replay_writer = ReplayWriter(
+                os.path.join(self.REPLAY_DIR, filename), event_log
+            )
+            event_log.sink = self.replay_writer
+            self.replay_service = service
+        except IOError as e:
+            print(f"Erro ao gravar replay: {e}")
+
+    def _close_replay(self) -> None:
+        """
+        Finaliza o arquivo de replay da partida atual, se houver.
+
+        Partidas solo ganham um trailer com a pontuação final, conferida
+        por ``GameReplay.verify`` (o versus não é auditado).
+        """
+        if self.replay_writer is not None:
+            trailer = None
+            if not isinstance(self.replay_service, VersusGameService):
+                trailer = {"score": self.replay_service.score}
+            self.replay_writer.close(trailer)
+            self.replay_writer = None
+            self.replay_service = None
+
     def _draw_login(self) -> None:
         """Renderiza a tela de login."""
         title = self.font_login.render("Digite seu Nome:", True, styles.COLORS["text"])
@@ -265,8 +482,9 @@ class GameManager:
         """
         # Recria todas as instâncias das telas
         self.menu = MenuUI()
+        self.menu.can_continue = self.autosave.has_save
         self.ranking_ui = RankingUI(self.repository)
-        self.stats_ui = StatisticsUI(self.repository)
+        self.stats_ui = StatisticsUI(self.repository, self.player_name)
         # settings_ui não precisa recriar pois está na tela ativa
 
         # Recria input box com novo tema
@@ -0,0 +1,177 @@
+# ARQUIVO: src/services/ai_player.py
+"""
+Oponentes controlados pelo computador.
+
+O AIPlayer lembra das cartas que viu (de qualquer jogador), mas cada
+lembrança enfraquece com o tempo: a chance de recordar uma carta vista há
+``idade`` jogadas é ``exp(-memory_decay * idade)``. O AIController agenda
+as jogadas com um tempo de reação, sem nunca bloquear o loop do jogo:
+``update`` é chamado a cada frame e a decisão custa O(cartas).
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.board import Board
+from src.services.versus_service import VersusGameService
+
+Position = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class AIProfile:
+    """Parâmetros de um oponente."""
+
+    name: str
+    memory_decay: float  # Esquecimento por jogada (0 = memória perfeita)
+    latency_ms: int  # Tempo de reação médio por carta
+    latency_jitter_ms: int = 0  # Variação aleatória do tempo de reação
+
+
+# Perfis por dificuldade (mesmos rótulos do menu)
+AI_PROFILES = {
+    "Fácil": AIProfile("Fácil", 0.35, latency_ms=1100, latency_jitter_ms=400),
+    "Médio": AIProfile("Médio", 0.12, latency_ms=850, latency_jitter_ms=300),
+    "Difícil": AIProfile("Difícil", 0.02, latency_ms=650, latency_jitter_ms=200),
+}
+
+
+class AIPlayer:
+    """Política de jogo com memória que decai."""
+
+    def __init__(self, profile: AIProfile, seed: Optional[int] = None):
+        """
+        Inicializa o oponente.
+
+        Args:
+            profile: Parâmetros de memória e reação
+            seed: Semente para decisões reprodutíveis
+        """
+        self.profile = profile
+        self.rng = random.Random(seed)
+        # Posição -> (match_id, instante em cartas viradas)
+        self.memory: Dict[Position, Tuple[str, int]] = {}
+        self._flips = 0
+
+    def observe(self, row: int, col: int, match_id: str) -> None:
+        """Registra uma carta revelada (por qualquer jogador)."""
+        self.memory[(row, col)] = (match_id, self._flips)
+        self._flips += 1
+
+    def _recall(self, board: Board) -> Dict[str, List[Position]]:
+        """
+        Consulta a memória, esquecendo o que não foi lembrado.
+
+        Returns:
+            match_id -> posições lembradas ainda em jogo
+        """
+        recalled: Dict[str, List[Position]] = {}
+        decay = self.profile.memory_decay
+        for pos, (match_id, seen_at) in list(self.memory.items()):
+            card = board.get_card(*pos)
+            age = (self._flips - seen_at) / 2
+            if (
+                card is None
+                or card.is_matched
+                or self.rng.random() > math.exp(-decay * age)
+            ):
+                del self.memory[pos]
+                continue
+            recalled.setdefault(match_id, []).append(pos)
+        return recalled
+
+    def choose(self, board: Board, first_pos: Optional[Position] = None) -> Position:
+        """
+        Escolhe a próxima carta.
+
+        Args:
+            board: Tabuleiro atual
+            first_pos: Primeira carta já virada neste turno (ou None)
+
+        Returns:
+            Posição (linha, coluna) de uma carta virada para baixo
+        """
+        recalled = self._recall(board)
+        hidden = [
+            (r, c)
+            for r in range(board.rows)
+            for c in range(board.cols)
+            if not board.grid[r][c].is_revealed and not board.grid[r][c].is_matched
+        ]
+
+        if first_pos is None:
+            # Par inteiro lembrado: começa por ele
+            for positions in recalled.values():
+                if len(positions) >= 2:
+                    return positions[0]
+        else:
+            match_id = board.get_card(*first_pos).match_id
+            for pos in recalled.get(match_id, []):
+                if pos != first_pos and pos in hidden:
+                    return pos
+
+        # Sem lembrança útil: prefere cartas nunca vistas
+        unseen = [pos for pos in hidden if pos not in self.memory]
+        return self.rng.choice(unseen or hidden)
+
+    def reaction_ms(self) -> int:
+        """Sorteia o tempo de reação da próxima carta."""
+        jitter = self.profile.latency_jitter_ms
+        return self.profile.latency_ms + self.rng.randint(-jitter, jitter)
+
+
+class AIController:
+    """
+    Agenda as jogadas do computador dentro do loop de jogo.
+
+    Não usa threads nem espera: a cada frame, ``update`` diz se já é hora
+    de virar uma carta e qual.
+    """
+
+    def __init__(
+        self, ai: AIPlayer, service: VersusGameService, player_index: int = 1
+    ):
+        """
+        Inicializa o controlador.
+
+        Args:
+            ai: Política do oponente
+            service: Partida em andamento
+            player_index: Índice do computador em ``service.players``
+        """
+        self.ai = ai
+        self.service = service
+        self.player_index = player_index
+        self._due_ms: Optional[int] = None
+
+    @property
+    def is_ai_turn(self) -> bool:
+        return (
+            self.service.current_player == self.player_index
+            and not self.service.board.all_matched
+        )
+
+    def update(self, now_ms: int, busy: bool = False) -> Optional[Position]:
+        """
+        Avança o relógio do oponente.
+
+        Args:
+            now_ms: Instante atual (ex: pygame.time.get_ticks())
+            busy: True enquanto a UI não aceita jogadas (cartas por esconder)
+
+        Returns:
+            A carta a virar agora, ou None
+        """
+        if busy or not self.is_ai_turn:
+            self._due_ms = None
+            return None
+        if self._due_ms is None:
+            self._due_ms = now_ms + self.ai.reaction_ms()
+            return None
+        if now_ms < self._due_ms:
+            return None
+
+        self._due_ms = None
+        return self.ai.choose(self.service.board, self.service.first_selected_pos)
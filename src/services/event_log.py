@@ -0,0 +1,167 @@
+# ARQUIVO: src/services/event_log.py
+"""
+Registro de eventos de uma partida (event sourcing).
+
+Cada jogada válida, acerto, erro e ocultação de cartas é anexada como uma
+tupla compacta ``(t_ms, tipo, linha, coluna)``. Junto com o cabeçalho
+(dimensões, semente e distribuição das cartas), o registro basta para
+reconstruir qualquer estado da partida (ver ``src/services/replay.py``).
+"""
+
+import json
+from typing import Dict, List, NamedTuple, Optional
+
+from src.domain.board import Board
+
+# Tipos de evento (inteiros para manter o registro compacto)
+PICK = 0  # Primeira carta do par revelada
+MATCH = 1  # Segunda carta revelada, par encontrado
+NO_MATCH = 2  # Segunda carta revelada, par errado
+HIDE = 3  # Carta escondida após um erro
+
+# Resultado de GameService.pick_card -> tipo de evento
+RESULT_TO_EVENT = {"FIRST_PICK": PICK, "MATCH": MATCH, "NO_MATCH": NO_MATCH}
+EVENT_TO_RESULT = {v: k for k, v in RESULT_TO_EVENT.items()}
+EVENT_NAMES = {PICK: "PICK", MATCH: "MATCH", NO_MATCH: "NO_MATCH", HIDE: "HIDE"}
+
+
+class GameEvent(NamedTuple):
+    """Evento da partida (tempo em ms desde o início)."""
+
+    t_ms: int
+    kind: int
+    row: int
+    col: int
+
+
+class GameEventLog:
+    """
+    Registro sequencial de eventos de uma partida.
+
+    O ``append`` apenas adiciona uma tupla a uma lista, mantendo o custo
+    por jogada desprezível.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        seed: Optional[int],
+        layout: List[List[str]],
+        difficulty_multiplier: float = 1.0,
+        metadata: Optional[Dict] = None,
+    ):
+        """
+        Inicializa o registro.
+
+        Args:
+            rows, cols: Dimensões do tabuleiro
+            seed: Semente usada para distribuir as cartas
+            layout: Pares [match_id, display_content] em ordem linha a linha
+            difficulty_multiplier: Multiplicador de pontuação da partida
+            metadata: Informações livres (jogador, tema, dificuldade...)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.seed = seed
+        self.layout = layout
+        self.difficulty_multiplier = difficulty_multiplier
+        self.metadata = metadata if metadata is not None else {}
+        self.events: List[GameEvent] = []
+        # Destino opcional para gravação incremental (ex: ReplayWriter)
+        self.sink = None
+
+    @classmethod
+    def for_board(
+        cls,
+        board: Board,
+        difficulty_multiplier: float = 1.0,
+        metadata: Optional[Dict] = None,
+    ) -> "GameEventLog":
+        """
+        Cria um registro a partir do tabuleiro recém-distribuído.
+
+        Args:
+            board: Tabuleiro da partida
+            difficulty_multiplier: Multiplicador de pontuação
+            metadata: Informações livres da partida
+
+        Returns:
+            Registro vazio com o cabeçalho preenchido
+        """
+        layout = [
+            [card.match_id, card.display_content] for row in board.grid for card in row
+        ]
+        return cls(
+            board.rows,
+            board.cols,
+            board.seed,
+            layout,
+            difficulty_multiplier=difficulty_multiplier,
+            metadata=metadata,
+        )
+
+    def append(self, t_ms: int, kind: int, row: int, col: int) -> None:
+        """Anexa um evento ao registro (e ao ``sink``, se houver)."""
+        event = GameEvent(t_ms, kind, row, col)
+        self.events.append(event)
+        if self.sink is not None:
+            self.sink.write(event)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def duration_ms(self) -> int:
+        """Tempo do último evento (0 se vazio)."""
+        return self.events[-1].t_ms if self.events else 0
+
+    def header(self) -> Dict:
+        """Cabeçalho serializável (tudo exceto os eventos)."""
+        return {
+            "version": self.VERSION,
+            "rows": self.rows,
+            "cols": self.cols,
+            "seed": self.seed,
+            "layout": self.layout,
+            "difficulty_multiplier": self.difficulty_multiplier,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_header(cls, header: Dict) -> "GameEventLog":
+        """Cria um registro vazio a partir de um cabeçalho serializado."""
+        return cls(
+            header["rows"],
+            header["cols"],
+            header.get("seed"),
+            header["layout"],
+            difficulty_multiplier=header.get("difficulty_multiplier", 1.0),
+            metadata=header.get("metadata", {}),
+        )
+
+    def to_dict(self) -> Dict:
+        """Serializa o registro (eventos como listas compactas)."""
+        data = self.header()
+        data["events"] = [list(event) for event in self.events]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GameEventLog":
+        """Reconstrói um registro serializado por ``to_dict``."""
+        log = cls.from_header(data)
+        log.events = [GameEvent(*event) for event in data.get("events", [])]
+        return log
+
+    def save(self, path: str) -> None:
+        """Grava o registro em JSON compacto."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "GameEventLog":
+        """Lê um registro gravado por ``save``."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
@@ -2,12 +2,20 @@ import time
 from typing import Optional, Tuple
 
 from src.domain.board import Board
+from src.services.event_log import HIDE, RESULT_TO_EVENT, GameEventLog
 
 
 class GameService:
-    def __init__(self, board: Board, difficulty_multiplier: float = 1.0):
+    def __init__(
+        self,
+        board: Board,
+        difficulty_multiplier: float = 1.0,
+        event_log: Optional[GameEventLog] = None,
+    ):
         self.board = board
         self.difficulty_multiplier = difficulty_multiplier  # Salva o multiplicador
+        # Registro de eventos opcional (None desliga o event sourcing)
+        self.event_log = event_log
 
         self.moves = 0
         self.score = 0
@@ -28,6 +36,18 @@ class GameService:
         return f"{minutes:02}:{seconds:02}"
 
     def pick_card(self, row: int, col: int) -> str:
+        result = self._pick_card(row, col)
+        if self.event_log is not None and result != "INVALID":
+            self.event_log.append(
+                self._elapsed_ms(), RESULT_TO_EVENT[result], row, col
+            )
+        return result
+
+    def _elapsed_ms(self) -> int:
+        """Milissegundos desde o início da partida."""
+        return int((time.time() - self.start_time) * 1000)
+
+    def _pick_card(self, row: int, col: int) -> str:
         card = self.board.get_card(row, col)
 
         if not card or card.is_revealed or card.is_matched:
@@ -75,3 +95,8 @@ class GameService:
             c1.hide()
         if c2:
             c2.hide()
+
+        if self.event_log is not None:
+            t_ms = self._elapsed_ms()
+            for pos in (pos1, pos2):
+                self.event_log.append(t_ms, HIDE, *pos)
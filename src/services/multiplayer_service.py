@@ -0,0 +1,148 @@
+# ARQUIVO: src/services/multiplayer_service.py
+"""
+GameService por turnos para N jogadores num mesmo tabuleiro.
+
+Os jogadores se alternam em ordem: quem acerta joga de novo, quem erra
+passa a vez ao próximo. Pontuação, movimentos, combo e pares encontrados
+de cada jogador ficam em arrays compactos (``array('i')``), então uma
+sala com dezenas de jogadores custa poucos bytes por jogador e o acesso
+ao jogador da vez é O(1).
+"""
+
+from array import array
+from typing import List, Optional, Sequence
+
+from src.domain.board import Board
+from src.services.event_log import GameEventLog
+from src.services.game_service import GameService
+
+
+class MultiPlayerGameService(GameService):
+    """
+    GameService com contadores por jogador.
+
+    ``score``, ``moves`` e ``combo_streak`` se referem ao jogador da vez,
+    então as regras do GameService, a UI e o replay funcionam sem
+    mudanças. Os resultados de ``pick_card`` são os mesmos.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        players: Sequence[str],
+        difficulty_multiplier: float = 1.0,
+        event_log: Optional[GameEventLog] = None,
+    ):
+        """
+        Inicializa a partida.
+
+        Args:
+            board: Tabuleiro compartilhado
+            players: Nomes dos jogadores, na ordem dos turnos
+            difficulty_multiplier: Multiplicador de pontuação
+            event_log: Registro de eventos opcional
+        """
+        if not players:
+            raise ValueError("A partida precisa de pelo menos um jogador.")
+
+        count = len(players)
+        self.players: List[str] = list(players)
+        self.scores = array("i", bytes(4 * count))
+        self.player_moves = array("i", bytes(4 * count))
+        self.combos = array("i", bytes(4 * count))
+        self.pairs_found = array("i", bytes(4 * count))
+        self.current_player = 0
+        super().__init__(board, difficulty_multiplier, event_log)
+
+    # Contadores do jogador da vez (usados pelas regras do GameService)
+    @property
+    def score(self) -> int:
+        return self.scores[self.current_player]
+
+    @score.setter
+    def score(self, value: int) -> None:
+        self.scores[self.current_player] = value
+
+    @property
+    def moves(self) -> int:
+        return self.player_moves[self.current_player]
+
+    @moves.setter
+    def moves(self, value: int) -> None:
+        self.player_moves[self.current_player] = value
+
+    @property
+    def combo_streak(self) -> int:
+        return self.combos[self.current_player]
+
+    @combo_streak.setter
+    def combo_streak(self, value: int) -> None:
+        self.combos[self.current_player] = value
+
+    @property
+    def current_player_name(self) -> str:
+        return self.players[self.current_player]
+
+    @property
+    def total_moves(self) -> int:
+        """Movimentos de todos os jogadores somados."""
+        return sum(self.player_moves)
+
+    def add_player(self, name: str) -> int:
+        """
+        Adiciona um jogador ao fim da ordem de turnos.
+
+        Args:
+            name: Nome do jogador
+
+        Returns:
+            Índice do novo jogador
+        """
+        self.players.append(name)
+        for counters in (
+            self.scores,
+            self.player_moves,
+            self.combos,
+            self.pairs_found,
+        ):
+            counters.append(0)
+        return len(self.players) - 1
+
+    def _pick_card(self, row: int, col: int) -> str:
+        result = super()._pick_card(row, col)
+        if result == "MATCH":
+            self.pairs_found[self.current_player] += 1
+        elif result == "NO_MATCH":
+            self.advance_turn()
+        return result
+
+    def advance_turn(self) -> int:
+        """
+        Passa a vez ao próximo jogador.
+
+        Returns:
+            Índice do novo jogador da vez
+        """
+        self.current_player = (self.current_player + 1) % len(self.players)
+        return self.current_player
+
+    def standings(self) -> List[int]:
+        """
+        Classificação atual.
+
+        Returns:
+            Índices dos jogadores por pontos (desempate: menos movimentos)
+        """
+        scores, moves = self.scores, self.player_moves
+        return sorted(range(len(self.players)), key=lambda i: (-scores[i], moves[i]))
+
+    def winner(self) -> Optional[int]:
+        """
+        Índice do jogador com mais pontos.
+
+        Returns:
+            O índice, ou None se houver empate na liderança
+        """
+        best = max(self.scores)
+        leaders = [i for i, score in enumerate(self.scores) if score == best]
+        return leaders[0] if len(leaders) == 1 else None
@@ -0,0 +1,199 @@
+# ARQUIVO: src/services/replay.py
+"""
+Motor de replay determinístico.
+
+Reconstrói o estado de uma partida (tabuleiro, pontos, combo, movimentos)
+a partir de um GameEventLog, em qualquer ponto e em qualquer velocidade.
+Cada jogada é reaplicada pelas regras do GameService e o resultado é
+conferido com o registrado, o que permite auditar recordes.
+"""
+
+import time
+from typing import Callable, Iterator, List, Optional
+
+from src.domain.board import Board
+from src.domain.card import Card
+from src.domain.strategies import GameStrategy
+from src.services.event_log import (
+    EVENT_NAMES,
+    EVENT_TO_RESULT,
+    HIDE,
+    GameEvent,
+    GameEventLog,
+)
+from src.services.game_service import GameService
+
+
+class ReplayError(ValueError):
+    """O registro não é consistente com as regras do jogo."""
+
+
+class RecordedLayoutStrategy(GameStrategy):
+    """Estratégia que devolve exatamente a distribuição registrada (sem embaralhar)."""
+
+    def __init__(self, layout: List[List[str]]):
+        self.layout = layout
+
+    def generate_cards(self, num_pairs: int) -> List[Card]:
+        if num_pairs * 2 != len(self.layout):
+            raise ReplayError(
+                f"Distribuição registrada tem {len(self.layout)} cartas, "
+                f"esperado {num_pairs * 2}."
+            )
+        return [Card(match_id=m, display_content=d) for m, d in self.layout]
+
+
+class GameReplay:
+    """
+    Reprodutor de uma partida registrada.
+
+    Mantém um GameService reconstruído (``self.service``) e a posição
+    atual no registro (``self.position``, número de eventos aplicados).
+    """
+
+    def __init__(self, log: GameEventLog):
+        """
+        Inicializa o replay no estado inicial da partida.
+
+        Args:
+            log: Registro de eventos da partida
+        """
+        self.log = log
+        self.service = self._new_service()
+        self.position = 0
+
+    def _new_service(self) -> GameService:
+        """Cria o serviço com o tabuleiro no estado inicial registrado."""
+        board = Board(
+            self.log.rows,
+            self.log.cols,
+            strategy=RecordedLayoutStrategy(self.log.layout),
+            seed=self.log.seed,
+        )
+        service = GameService(board, self.log.difficulty_multiplier)
+        service.start_time = time.time()
+        return service
+
+    @property
+    def finished(self) -> bool:
+        """True se todos os eventos já foram aplicados."""
+        return self.position >= len(self.log.events)
+
+    def apply(self, event: GameEvent) -> None:
+        """
+        Aplica um evento ao serviço reconstruído.
+
+        Args:
+            event: Evento do registro
+
+        Raises:
+            ReplayError: Se o resultado da jogada diverge do registrado
+        """
+        service = self.service
+        if event.kind == HIDE:
+            card = service.board.get_card(event.row, event.col)
+            if card is None:
+                raise ReplayError(f"HIDE fora do tabuleiro em {self.position}")
+            card.hide()
+        else:
+            result = service.pick_card(event.row, event.col)
+            expected = EVENT_TO_RESULT.get(event.kind)
+            if result != expected:
+                raise ReplayError(
+                    f"Evento {self.position} ({EVENT_NAMES.get(event.kind)} em "
+                    f"{event.row},{event.col}) resultou em {result}."
+                )
+
+        # Alinha o relógio da partida ao instante registrado
+        service.start_time = time.time() - event.t_ms / 1000
+        if service.board.all_matched:
+            service.end_time = service.start_time + event.t_ms / 1000
+
+    def step(self) -> Optional[GameEvent]:
+        """
+        Aplica o próximo evento.
+
+        Returns:
+            O evento aplicado ou None se o replay terminou
+        """
+        if self.finished:
+            return None
+        event = self.log.events[self.position]
+        self.apply(event)
+        self.position += 1
+        return event
+
+    def seek(self, index: int) -> GameService:
+        """
+        Posiciona o replay após ``index`` eventos aplicados.
+
+        Voltar no tempo reconstrói a partida do início.
+
+        Args:
+            index: Quantidade de eventos aplicados desejada
+
+        Returns:
+            O serviço no estado correspondente
+        """
+        index = max(0, min(index, len(self.log.events)))
+        if index < self.position:
+            self.service = self._new_service()
+            self.position = 0
+        while self.position < index:
+            self.step()
+        return self.service
+
+    def seek_time(self, t_ms: int) -> GameService:
+        """Posiciona o replay no último evento ocorrido até ``t_ms``."""
+        index = 0
+        for event in self.log.events:
+            if event.t_ms > t_ms:
+                break
+            index += 1
+        return self.seek(index)
+
+    def verify(self) -> GameService:
+        """
+        Reaplica a partida inteira (usado para auditar recordes).
+
+        Se o registro tiver ``metadata["score"]``, confere a pontuação final.
+
+        Returns:
+            O serviço no estado final
+
+        Raises:
+            ReplayError: Se alguma jogada ou a pontuação divergir
+        """
+        service = self.seek(len(self.log.events))
+        claimed = self.log.metadata.get("score")
+        if claimed is not None and claimed != service.score:
+            raise ReplayError(
+                f"Pontuação registrada ({claimed}) difere da reconstruída "
+                f"({service.score})."
+            )
+        return service
+
+    def play(
+        self,
+        speed: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Iterator[GameEvent]:
+        """
+        Reproduz os eventos restantes respeitando o tempo registrado.
+
+        Args:
+            speed: Fator de velocidade (2.0 = dobro; 0 = sem esperas)
+            sleep: Função de espera (injetável para testes/loops de jogo)
+
+        Yields:
+            Cada evento logo após ser aplicado
+        """
+        previous_t = self.log.events[self.position - 1].t_ms if self.position else 0
+        while not self.finished:
+            event = self.log.events[self.position]
+            if speed > 0:
+                delay = (event.t_ms - previous_t) / 1000 / speed
+                if delay > 0:
+                    sleep(delay)
+            previous_t = event.t_ms
+            yield self.step()
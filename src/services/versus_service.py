@@ -0,0 +1,37 @@
+# ARQUIVO: src/services/versus_service.py
+"""
+Variante de dois jogadores do GameService (modo versus).
+
+Caso particular do MultiPlayerGameService: os dois jogadores se alternam
+no mesmo tabuleiro, quem acerta joga de novo e quem erra passa a vez.
+"""
+
+from typing import Optional, Sequence
+
+from src.domain.board import Board
+from src.services.event_log import GameEventLog
+from src.services.multiplayer_service import MultiPlayerGameService
+
+
+class VersusGameService(MultiPlayerGameService):
+    """MultiPlayerGameService restrito a dois jogadores."""
+
+    def __init__(
+        self,
+        board: Board,
+        players: Sequence[str] = ("Jogador", "Computador"),
+        difficulty_multiplier: float = 1.0,
+        event_log: Optional[GameEventLog] = None,
+    ):
+        """
+        Inicializa a partida.
+
+        Args:
+            board: Tabuleiro compartilhado
+            players: Nomes dos dois jogadores (o primeiro começa)
+            difficulty_multiplier: Multiplicador de pontuação
+            event_log: Registro de eventos opcional
+        """
+        if len(players) != 2:
+            raise ValueError("O modo versus exige exatamente dois jogadores.")
+        super().__init__(board, players, difficulty_multiplier, event_log)
@@ -6,11 +6,51 @@ Exibe popups com informações interessantes quando o jogador
 acerta um par, enriquecendo a experiência educacional.
 """
 
+from functools import lru_cache
+
 import pygame
 
 import src.ui.styles as styles
 from src.ui.components import Tween
 
+# Passo de quantização da escala (evita um frame escalado por valor float)
+SCALE_STEP = 0.02
+MAX_SCALED_FRAMES = 32
+
+
+@lru_cache(maxsize=256)
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> tuple:
+    """
+    Quebra um texto em linhas que cabem na largura informada.
+
+    Usa ``font.size`` (apenas mede, não renderiza) e memoriza o resultado
+    por (texto, fonte, largura).
+
+    Args:
+        text: Texto a ser quebrado
+        font: Fonte usada na medição
+        max_width: Largura máxima de cada linha em pixels
+
+    Returns:
+        Tupla com as linhas resultantes
+    """
+    lines = []
+    current_line = []
+
+    for word in text.split():
+        test_line = " ".join(current_line + [word])
+        if font.size(test_line)[0] > max_width:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+        else:
+            current_line.append(word)
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines)
+
 
 class Flashcard:
     """
@@ -19,6 +59,10 @@ class Flashcard:
     Exibe fatos interessantes com animação de entrada suave.
     """
 
+    # Fontes compartilhadas entre flashcards (também tornam o cache de
+    # quebra de linha reaproveitável entre cards)
+    _shared_fonts: dict | None = None
+
     def __init__(
         self, fact_data: dict, position: tuple, duration: int = 5000
     ):  # Aumentado para 5 segundos
@@ -47,18 +91,47 @@ class Flashcard:
         # Fontes
         self._init_fonts()
 
+        # Cache de renderização: conteúdo completo (renderizado uma vez)
+        # e frames escalados indexados pela escala quantizada
+        self._surface: pygame.Surface | None = None
+        self._scaled_frames: dict[int, pygame.Surface] = {}
+
     def _init_fonts(self) -> None:
-        """Inicializa fontes com fallback."""
-        try:
-            self.font_title = pygame.font.SysFont("segoeui", 22, bold=True)
-            self.font_fact = pygame.font.SysFont("segoeui", 16)
-            self.font_extra = pygame.font.SysFont("segoeui", 14, italic=True)
-            self.font_emoji = pygame.font.SysFont("segoeuiemoji", 40)
-        except:
-            self.font_title = pygame.font.SysFont("arial", 20, bold=True)
-            self.font_fact = pygame.font.SysFont("arial", 14)
-            self.font_extra = pygame.font.SysFont("arial", 12, italic=True)
-            self.font_emoji = pygame.font.SysFont("arial", 36)
+        """Inicializa fontes com fallback (uma única vez por processo)."""
+        if Flashcard._shared_fonts is None:
+            try:
+                fonts = {
+                    "title": pygame.font.SysFont("segoeui", 22, bold=True),
+                    "fact": pygame.font.SysFont("segoeui", 16),
+                    "extra": pygame.font.SysFont("segoeui", 14, italic=True),
+                    "emoji": pygame.font.SysFont("segoeuiemoji", 40),
+                }
+            except:
+                fonts = {
+                    "title": pygame.font.SysFont("arial", 20, bold=True),
+                    "fact": pygame.font.SysFont("arial", 14),
+                    "extra": pygame.font.SysFont("arial", 12, italic=True),
+                    "emoji": pygame.font.SysFont("arial", 36),
+                }
+            Flashcard._shared_fonts = fonts
+
+        self.font_title = Flashcard._shared_fonts["title"]
+        self.font_fact = Flashcard._shared_fonts["fact"]
+        self.font_extra = Flashcard._shared_fonts["extra"]
+        self.font_emoji = Flashcard._shared_fonts["emoji"]
+
+    def restart(self, position: tuple) -> None:
+        """
+        Reinicia a animação de um flashcard já preparado.
+
+        Args:
+            position: Tupla (x, y) da posição central
+        """
+        self.position = position
+        self.start_time = pygame.time.get_ticks()
+        self.alpha = 0
+        self.scale = 0.5
+        self.is_active = True
 
     def update(self) -> bool:
         """
@@ -102,12 +175,55 @@ class Flashcard:
         if not self.is_active:
             return
 
-        # Cria superfície com alpha
-        card_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        frame = self._get_scaled_frame()
+        frame.set_alpha(self.alpha)
+
+        # Posiciona e desenha
+        x = self.position[0] - frame.get_width() // 2
+        y = self.position[1] - frame.get_height() // 2
+        screen.blit(frame, (x, y))
 
-        # Dimensões escaladas
-        scaled_w = int(self.width * self.scale)
-        scaled_h = int(self.height * self.scale)
+    def prepare(self) -> pygame.Surface:
+        """
+        Renderiza o conteúdo do flashcard (apenas na primeira chamada).
+
+        Returns:
+            Superfície com o card completo em escala 1.0
+        """
+        if self._surface is None:
+            self._surface = self._render_surface()
+        return self._surface
+
+    def _get_scaled_frame(self) -> pygame.Surface:
+        """
+        Retorna o card na escala atual, reaproveitando frames já escalados.
+
+        Returns:
+            Superfície escalada (ou a original quando a escala é 1.0)
+        """
+        surface = self.prepare()
+        step = round(self.scale / SCALE_STEP)
+        if step * SCALE_STEP == 1.0:
+            return surface
+
+        frame = self._scaled_frames.get(step)
+        if frame is None:
+            scale = step * SCALE_STEP
+            size = (int(self.width * scale), int(self.height * scale))
+            frame = pygame.transform.scale(surface, size)
+            if len(self._scaled_frames) >= MAX_SCALED_FRAMES:
+                self._scaled_frames.pop(next(iter(self._scaled_frames)))
+            self._scaled_frames[step] = frame
+        return frame
+
+    def _render_surface(self) -> pygame.Surface:
+        """
+        Desenha fundo, borda e conteúdo do card numa nova superfície.
+
+        Returns:
+            Superfície com alpha por pixel e opacidade total
+        """
+        card_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
 
         # Fundo do card com sombra
         shadow_rect = pygame.Rect(4, 4, self.width - 8, self.height - 8)
@@ -116,26 +232,18 @@ class Flashcard:
         card_rect = pygame.Rect(0, 0, self.width - 8, self.height - 8)
 
         # Cor de fundo baseada no tema
-        bg_color = (*styles.COLORS["card_face"], self.alpha)
-        pygame.draw.rect(card_surface, bg_color, card_rect, border_radius=15)
+        pygame.draw.rect(
+            card_surface, styles.COLORS["card_face"], card_rect, border_radius=15
+        )
 
         # Borda colorida
-        border_color = (*styles.COLORS["accent"], self.alpha)
         pygame.draw.rect(
-            card_surface, border_color, card_rect, width=3, border_radius=15
+            card_surface, styles.COLORS["accent"], card_rect, width=3, border_radius=15
         )
 
         # Renderiza conteúdo
         self._draw_content(card_surface)
-
-        # Escala a superfície
-        if self.scale != 1.0:
-            card_surface = pygame.transform.scale(card_surface, (scaled_w, scaled_h))
-
-        # Posiciona e desenha
-        x = self.position[0] - scaled_w // 2
-        y = self.position[1] - scaled_h // 2
-        screen.blit(card_surface, (x, y))
+        return card_surface
 
     def _draw_content(self, surface: pygame.Surface) -> None:
         """
@@ -149,7 +257,7 @@ class Flashcard:
         # Emoji (se disponível)
         if "emoji" in self.data:
             emoji_surf = self.font_emoji.render(
-                self.data["emoji"], True, (*styles.COLORS["text_card"], self.alpha)
+                self.data["emoji"], True, styles.COLORS["text_card"]
             )
             emoji_rect = emoji_surf.get_rect(center=(self.width // 2, y_offset + 25))
             surface.blit(emoji_surf, emoji_rect)
@@ -158,7 +266,7 @@ class Flashcard:
         # Título (nome do item)
         if "name" in self.data:
             title_surf = self.font_title.render(
-                self.data["name"], True, (*styles.COLORS["text_card"], self.alpha)
+                self.data["name"], True, styles.COLORS["text_card"]
             )
             title_rect = title_surf.get_rect(center=(self.width // 2, y_offset))
             surface.blit(title_surf, title_rect)
@@ -166,29 +274,13 @@ class Flashcard:
 
         # Fato principal
         if "fact" in self.data:
-            fact_text = self.data["fact"]
-            # Quebra de linha automática
-            words = fact_text.split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                test_line = " ".join(current_line + [word])
-                test_surf = self.font_fact.render(test_line, True, (0, 0, 0))
-                if test_surf.get_width() > self.width - 40:
-                    if current_line:
-                        lines.append(" ".join(current_line))
-                    current_line = [word]
-                else:
-                    current_line.append(word)
-
-            if current_line:
-                lines.append(" ".join(current_line))
+            # Quebra de linha automática (memorizada)
+            lines = wrap_text(self.data["fact"], self.font_fact, self.width - 40)
 
             # Renderiza linhas
             for line in lines[:2]:  # Máximo 2 linhas
                 line_surf = self.font_fact.render(
-                    line, True, (*styles.COLORS["text_card"], self.alpha)
+                    line, True, styles.COLORS["text_card"]
                 )
                 line_rect = line_surf.get_rect(center=(self.width // 2, y_offset))
                 surface.blit(line_surf, line_rect)
@@ -197,7 +289,7 @@ class Flashcard:
         # Informação extra (menor)
         if "extra" in self.data:
             extra_surf = self.font_extra.render(
-                self.data["extra"], True, (*styles.COLORS["accent"], self.alpha)
+                self.data["extra"], True, styles.COLORS["accent"]
             )
             extra_rect = extra_surf.get_rect(center=(self.width // 2, self.height - 20))
             surface.blit(extra_surf, extra_rect)
@@ -216,13 +308,36 @@ class FlashcardManager:
         self.flashcards: list[Flashcard] = []
         self.max_simultaneous = 2  # Máximo de flashcards simultâneos
 
-    def add_flashcard(self, fact_data: dict, position: tuple) -> None:
+        # Flashcards pré-construídos (por identificador) e fila de preparo
+        self._prepared: dict[str, Flashcard] = {}
+        self._pending: list[Flashcard] = []
+
+    def prefetch(self, facts: dict[str, dict]) -> None:
+        """
+        Pré-constrói os flashcards que podem aparecer na partida.
+
+        As superfícies são renderizadas aos poucos em ``update`` (uma por
+        frame), fora do clique que revela o par.
+
+        Args:
+            facts: Fatos por identificador (ex: ``match_id`` das cartas)
+        """
+        self._prepared = {
+            identifier: Flashcard(fact_data, (0, 0))
+            for identifier, fact_data in facts.items()
+        }
+        self._pending = list(self._prepared.values())
+
+    def add_flashcard(
+        self, fact_data: dict, position: tuple, key: str | None = None
+    ) -> None:
         """
         Adiciona um novo flashcard.
 
         Args:
             fact_data: Dados do fato educacional
             position: Posição central (x, y)
+            key: Identificador usado no ``prefetch`` (reaproveita o card pronto)
         """
         # Remove flashcards antigos se houver muitos
         if len(self.flashcards) >= self.max_simultaneous:
@@ -235,11 +350,18 @@ class FlashcardManager:
             # Desloca verticalmente para não sobrepor
             adjusted_position = (position[0], position[1] + 100)
 
-        flashcard = Flashcard(fact_data, adjusted_position)
+        flashcard = self._prepared.pop(key, None) if key is not None else None
+        if flashcard is None:
+            flashcard = Flashcard(fact_data, adjusted_position)
+        else:
+            flashcard.restart(adjusted_position)
         self.flashcards.append(flashcard)
 
     def update(self) -> None:
-        """Atualiza todos os flashcards ativos."""
+        """Atualiza todos os flashcards ativos e prepara um card pendente."""
+        if self._pending:
+            self._pending.pop().prepare()
+
         for flashcard in self.flashcards[:]:
             if not flashcard.update():
                 self.flashcards.remove(flashcard)
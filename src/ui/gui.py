@@ -6,11 +6,15 @@ Gerencia renderização do tabuleiro, estatísticas, animações e interações
 do jogador durante uma partida.
 """
 
+import logging
+
 import pygame
 
 import src.ui.styles as styles
 from src.domain.facts import FactsDatabase
 from src.infrastructure.sound import SoundManager
+from src.infrastructure.telemetry import FrameProfiler
+from src.services.event_log import HIDE, GameEvent
 from src.services.game_service import GameService
 from src.ui.components import (
     AdvancedParticleSystem,
@@ -20,6 +24,8 @@ from src.ui.components import (
 from src.ui.flashcard import FlashcardManager
 from src.ui.styles import DIMENSIONS
 
+logger = logging.getLogger(__name__)
+
 
 class GraphicUI:
     """
@@ -29,15 +35,22 @@ class GraphicUI:
     de cartas, estatísticas, animações e tela de Game Over.
     """
 
-    def __init__(self, service: GameService, card_size: int = None):
+    def __init__(
+        self,
+        service: GameService,
+        card_size: int = None,
+        profiler: FrameProfiler | None = None,
+    ):
         """
         Inicializa a interface gráfica.
 
         Args:
             service: Instância do serviço de jogo contendo a lógica
             card_size: Tamanho customizado das cartas (padrão: do tema)
+            profiler: Coletor de tempos por fase (cria um próprio se None)
         """
         self.service = service
+        self.profiler = profiler if profiler else FrameProfiler()
         self.screen = pygame.display.get_surface()
         self.width = self.screen.get_width()
         self.height = self.screen.get_height()
@@ -61,6 +74,9 @@ class GraphicUI:
 
         # Armazena tema atual para buscar fatos
         self.current_theme = None
+        # Cobertura de fatos do tabuleiro: pares com fato e pares sem fato
+        self.fact_coverage = (0, 0)
+        self.missing_facts: list[str] = []
 
         self.stars_earned = 0
         self.animation_triggered = False
@@ -71,6 +87,18 @@ class GraphicUI:
         self.cards_to_hide = None
 
         self.saved = False
+        # Gravação da pontuação: None, "saving", "saved" ou "error"
+        self.save_status: str | None = None
+        self._save_label: tuple | None = None  # (status, superfície)
+
+        # Chamado após cada mudança de estado da partida (ex: autosave)
+        self.on_change = None
+
+        # Superfícies do Game Over (criadas sob demanda e reutilizadas)
+        self._overlay_backdrop: pygame.Surface | None = None
+        self._overlay_backdrop_size: tuple | None = None
+        self._game_over_panel: pygame.Surface | None = None
+        self._game_over_panel_pos = (0, 0)
 
         # Botões de Game Over
         self._init_game_over_buttons()
@@ -166,6 +194,7 @@ class GraphicUI:
                 self.waiting_to_hide = False
                 self.cards_to_hide = None
                 self.message = "Tente novamente!"
+                self._notify_change()
 
     def handle_click(self, event: pygame.event.Event) -> str | None:
         """
@@ -209,6 +238,34 @@ class GraphicUI:
             theme_name: Nome do tema (ex: "Química", "Animais")
         """
         self.current_theme = theme_name
+        self._prefetch_facts()
+
+    def _prefetch_facts(self) -> None:
+        """
+        Resolve os fatos dos pares do tabuleiro atual e agenda seus flashcards.
+
+        A cobertura fica em ``fact_coverage`` e ``missing_facts`` (e no log
+        de depuração), em vez de um aviso no terminal a cada acerto.
+        """
+        if not self.current_theme:
+            return
+
+        match_ids = {
+            card.match_id for row in self.service.board.grid for card in row
+        }
+        found, missing = FactsDatabase.get_facts_for(self.current_theme, match_ids)
+        self.flashcards.prefetch(found)
+        self.fact_coverage = (len(found), len(match_ids))
+        self.missing_facts = sorted(missing)
+
+        if missing:
+            logger.debug(
+                "Fatos: %d/%d pares cobertos em %s (sem fato: %s)",
+                len(found),
+                len(match_ids),
+                self.current_theme,
+                ", ".join(self.missing_facts),
+            )
 
     def reset_animations(self) -> None:
         """Limpa todas as animações e efeitos visuais."""
@@ -218,6 +275,35 @@ class GraphicUI:
         self.animation_triggered = False
         print("🧹 Animações limpas!")  # Debug
 
+    def set_pending_hide(self, first_pos: tuple, second_pos: tuple) -> None:
+        """
+        Retoma um par errado que ainda estava à mostra (partida salva).
+
+        Args:
+            first_pos, second_pos: Cartas a esconder após o intervalo normal
+        """
+        self.waiting_to_hide = True
+        self.hide_timestamp = pygame.time.get_ticks()
+        self.cards_to_hide = (first_pos, second_pos)
+        self.message = "Ops... errou."
+
+    def apply_replay_event(self, event: GameEvent) -> None:
+        """
+        Aplica um evento de replay como se fosse uma jogada do usuário.
+
+        Args:
+            event: Evento do registro da partida
+        """
+        if event.kind == HIDE:
+            if self.waiting_to_hide:
+                self.service.hide_cards(*self.cards_to_hide)
+                self.waiting_to_hide = False
+                self.cards_to_hide = None
+                self.message = "Tente novamente!"
+            return
+
+        self._process_pick(event.row, event.col)
+
     def _process_pick(self, r: int, c: int) -> None:
         """
         Processa a escolha de uma carta pelo jogador.
@@ -227,9 +313,26 @@ class GraphicUI:
             c: Coluna da carta
         """
         first_pos = self.service.first_selected_pos
-        current_pos = (r, c)
         result = self.service.pick_card(r, c)
+        self._show_pick_result(result, first_pos, (r, c))
+        if result != "INVALID":
+            self._notify_change()
 
+    def _notify_change(self) -> None:
+        """Avisa ``on_change`` de que o estado da partida mudou."""
+        if self.on_change is not None:
+            self.on_change()
+
+    def _show_pick_result(self, result: str, first_pos, current_pos: tuple) -> None:
+        """
+        Aplica os efeitos visuais e sonoros do resultado de uma jogada.
+
+        Args:
+            result: Resultado de ``pick_card``
+            first_pos: Primeira carta do par (antes da jogada)
+            current_pos: Carta escolhida agora
+        """
+        r, c = current_pos
         card_rect = self._get_card_rect(r, c)
         self.flip_animations[current_pos] = CardFlipAnimation(card_rect)
 
@@ -237,21 +340,16 @@ class GraphicUI:
             self.sounds.play("match")
             combo = self.service.combo_streak
 
-            # Busca fato educacional
+            # Exibe fato educacional (pré-carregado em set_theme)
             card = self.service.board.get_card(r, c)
             if card and self.current_theme:
                 fact = FactsDatabase.get_fact(self.current_theme, card.match_id)
                 if fact:
                     # Exibe flashcard no centro da tela
                     flashcard_pos = (self.width // 2, self.height // 2 + 100)
-                    self.flashcards.add_flashcard(fact, flashcard_pos)
-                    print(
-                        f"✅ Flashcard exibido: {fact.get('name', card.match_id)}"
-                    )  # Debug
-                else:
-                    print(
-                        f"⚠️ Nenhum fato encontrado para: {self.current_theme} / {card.match_id}"
-                    )  # Debug
+                    self.flashcards.add_flashcard(
+                        fact, flashcard_pos, key=card.match_id
+                    )
 
             if combo == 1:
                 self.particles.sparkle(card_rect.centerx, card_rect.centery)
@@ -285,79 +383,168 @@ class GraphicUI:
 
     def draw(self) -> None:
         """Renderiza toda a interface do jogo."""
-        self.screen.fill(styles.COLORS["background"])
+        profiler = self.profiler
 
-        title = self.font_title.render("Memory Game", True, styles.COLORS["accent"])
-        self.screen.blit(title, title.get_rect(center=(self.width // 2, 40)))
+        with profiler.phase("board"):
+            self.screen.fill(styles.COLORS["background"])
 
-        self._draw_stats()
+            title = self.font_title.render("Memory Game", True, styles.COLORS["accent"])
+            self.screen.blit(title, title.get_rect(center=(self.width // 2, 40)))
 
-        mouse_pos = pygame.mouse.get_pos()
-        for r in range(self.service.board.rows):
-            for c in range(self.service.board.cols):
-                card = self.service.board.get_card(r, c)
-                rect = self._get_card_rect(r, c)
-                self._draw_single_card(card, rect, mouse_pos, (r, c))
+        with profiler.phase("stats"):
+            self._draw_stats()
 
-        if not self.service.board.all_matched:
-            msg_surf = self.font_msg.render(self.message, True, styles.COLORS["accent"])
-            msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height - 50))
-            self.screen.blit(msg_surf, msg_rect)
+        with profiler.phase("board"):
+            mouse_pos = pygame.mouse.get_pos()
+            for r in range(self.service.board.rows):
+                for c in range(self.service.board.cols):
+                    card = self.service.board.get_card(r, c)
+                    rect = self._get_card_rect(r, c)
+                    self._draw_single_card(card, rect, mouse_pos, (r, c))
+
+            if not self.service.board.all_matched:
+                msg_surf = self.font_msg.render(
+                    self.message, True, styles.COLORS["accent"]
+                )
+                msg_rect = msg_surf.get_rect(center=(self.width // 2, self.height - 50))
+                self.screen.blit(msg_surf, msg_rect)
 
         if self.service.board.all_matched:
-            self._draw_game_over_overlay()
+            with profiler.phase("overlay"):
+                self._draw_game_over_overlay()
 
         # Partículas e Flashcards (sempre por cima)
-        self.particles.update_and_draw(self.screen)
-        self.flashcards.draw(self.screen)
+        with profiler.phase("particles"):
+            self.particles.update_and_draw(self.screen)
+        with profiler.phase("flashcards"):
+            self.flashcards.draw(self.screen)
 
     def _draw_game_over_overlay(self) -> None:
         """Renderiza a tela de Game Over com resultados e botões."""
         if not self.animation_triggered:
             self.stars_earned = self._calculate_stars()
+            self._build_game_over_panel()
             self.animation_triggered = True
 
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(210)
-        overlay.fill((15, 15, 20))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay_backdrop(), (0, 0))
+        self.screen.blit(self._game_over_panel, self._game_over_panel_pos)
 
+        # Apenas os botões (hover) são redesenhados a cada frame
+        self.btn_restart.draw(self.screen)
+        self.btn_menu.draw(self.screen)
+        self.btn_ranking.draw(self.screen)
+        self._draw_save_status()
+
+    def mark_saved(self, ok: bool) -> None:
+        """
+        Confirmação da gravação da pontuação (callback do ScoreWriter).
+
+        Pode ser chamado pela thread de escrita: só atualiza o estado, o
+        rótulo é desenhado no próximo frame.
+
+        Args:
+            ok: True se a pontuação chegou ao disco
+        """
+        self.save_status = "saved" if ok else "error"
+
+    def _draw_save_status(self) -> None:
+        """Mostra se a pontuação já foi gravada (abaixo do tempo)."""
+        status = self.save_status
+        if status is None:
+            return
+        if self._save_label is None or self._save_label[0] != status:
+            text, color = {
+                "saving": ("Salvando...", (180, 180, 180)),
+                "saved": ("✔ Salvo", styles.COLORS["success"]),
+                "error": ("Erro ao salvar", styles.COLORS["error"]),
+            }[status]
+            self._save_label = (status, self.font_stats.render(text, True, color))
+        surf = self._save_label[1]
+        center = (self.width // 2, self.height // 2 + 90)
+        self.screen.blit(surf, surf.get_rect(center=center))
+
+    def _get_overlay_backdrop(self) -> pygame.Surface:
+        """
+        Retorna o fundo translúcido do Game Over.
+
+        A superfície é alocada uma única vez por tamanho de janela.
+
+        Returns:
+            Superfície do tamanho da tela com alpha aplicado
+        """
+        size = (self.width, self.height)
+        if self._overlay_backdrop is None or self._overlay_backdrop_size != size:
+            self._overlay_backdrop = pygame.Surface(size)
+            self._overlay_backdrop.set_alpha(210)
+            self._overlay_backdrop.fill((15, 15, 20))
+            self._overlay_backdrop_size = size
+        return self._overlay_backdrop
+
+    def _game_over_title(self) -> str:
+        """Título do painel de Game Over."""
+        return "NÍVEL CONCLUÍDO!"
+
+    def _final_score(self) -> int:
+        """Pontuação exibida no painel de Game Over."""
+        return self.service.score
+
+    def _build_game_over_panel(self) -> None:
+        """
+        Pré-renderiza o painel de resultados do Game Over.
+
+        Título, estrelas, pontuação e tempo não mudam depois que o jogo
+        termina, então são desenhados uma única vez numa superfície própria.
+        Os botões também são posicionados aqui.
+        """
         card_w, card_h = 480, 460
         cx, cy = self.width // 2, self.height // 2
         card_rect = pygame.Rect(0, 0, card_w, card_h)
         card_rect.center = (cx, cy)
 
-        pygame.draw.rect(self.screen, (50, 52, 64), card_rect, border_radius=20)
-        pygame.draw.rect(
-            self.screen, styles.COLORS["accent"], card_rect, width=2, border_radius=20
+        lbl = self.font_title.render(
+            self._game_over_title(), True, styles.COLORS["success"]
         )
-
-        lbl = self.font_title.render("NÍVEL CONCLUÍDO!", True, styles.COLORS["success"])
-        self.screen.blit(lbl, lbl.get_rect(center=(cx, cy - 170)))
-
-        star_str = "⭐" * self.stars_earned
         base_stars = self.font_emoji.render("⭐" * 3, True, (80, 80, 90))
-        gold_stars = self.font_emoji.render(star_str, True, (255, 215, 0))
+        gold_stars = self.font_emoji.render(
+            "⭐" * self.stars_earned, True, (255, 215, 0)
+        )
+        score_lbl = self.font_stats.render("PONTUAÇÃO FINAL", True, (180, 180, 180))
+        score_val = self.font_score_big.render(
+            str(self._final_score()), True, styles.COLORS["text"]
+        )
+        time_str = f"Tempo: {self.service.get_time_formatted()}"
+        time_surf = self.font_msg.render(time_str, True, styles.COLORS["accent"])
 
         stars_y = cy - 110
-        self.screen.blit(base_stars, base_stars.get_rect(center=(cx, stars_y)))
+        blits = [
+            (lbl, lbl.get_rect(center=(cx, cy - 170))),
+            (base_stars, base_stars.get_rect(center=(cx, stars_y))),
+        ]
         if self.stars_earned > 0:
-            self.screen.blit(gold_stars, gold_stars.get_rect(center=(cx, stars_y)))
+            blits.append((gold_stars, gold_stars.get_rect(center=(cx, stars_y))))
+        blits += [
+            (score_lbl, score_lbl.get_rect(center=(cx, cy - 40))),
+            (score_val, score_val.get_rect(center=(cx, cy + 10))),
+            (time_surf, time_surf.get_rect(center=(cx, cy + 60))),
+        ]
 
-        score_lbl = self.font_stats.render("PONTUAÇÃO FINAL", True, (180, 180, 180))
-        score_val = self.font_score_big.render(
-            str(self.service.score), True, styles.COLORS["text"]
-        )
+        # O painel cobre o card e qualquer texto que ultrapasse suas bordas
+        bounds = card_rect.unionall([rect for _, rect in blits])
+        panel = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        offset = (-bounds.x, -bounds.y)
 
-        self.screen.blit(score_lbl, score_lbl.get_rect(center=(cx, cy - 40)))
-        self.screen.blit(score_val, score_val.get_rect(center=(cx, cy + 10)))
+        local_card = card_rect.move(offset)
+        pygame.draw.rect(panel, (50, 52, 64), local_card, border_radius=20)
+        pygame.draw.rect(
+            panel, styles.COLORS["accent"], local_card, width=2, border_radius=20
+        )
+        for surf, rect in blits:
+            panel.blit(surf, rect.move(offset))
 
-        time_str = f"Tempo: {self.service.get_time_formatted()}"
-        time_surf = self.font_msg.render(time_str, True, styles.COLORS["accent"])
-        self.screen.blit(time_surf, time_surf.get_rect(center=(cx, cy + 60)))
+        self._game_over_panel = panel
+        self._game_over_panel_pos = bounds.topleft
 
         self.btn_restart.rect.center = (cx, cy + 130)
-        self.btn_restart.draw(self.screen)
 
         button_gap = 20
         total_w_secondary = (
@@ -373,9 +560,6 @@ class GraphicUI:
             cy + 190,
         )
 
-        self.btn_menu.draw(self.screen)
-        self.btn_ranking.draw(self.screen)
-
     def _draw_stats(self) -> None:
         """Renderiza as estatísticas do jogo (movimentos, pontos, tempo)."""
         section_w = self.width // 3
@@ -64,11 +64,18 @@ class MenuUI:
 
         self.current_buttons = self.theme_buttons
 
+        # Modo versus (contra o computador)
+        self.versus = False
+        # Existe partida salva para continuar (definido pelo GameManager)
+        self.can_continue = False
+
         # Áreas clicáveis do rodapé
         self.ranking_btn_rect = None
         self.stats_btn_rect = None
         self.settings_btn_rect = None
         self.back_btn_rect = None
+        self.versus_btn_rect = None
+        self.continue_btn_rect = None
 
     def draw(self, screen: pygame.Surface) -> None:
         """
@@ -97,6 +104,7 @@ class MenuUI:
             self._draw_footer_buttons(
                 screen, width, height, show_main_actions=False, show_back=True
             )
+            self._draw_versus_toggle(screen, width, height)
 
     def _draw_grid_menu(self, screen: pygame.Surface, width: int) -> None:
         """Desenha menu em grade (para temas)."""
@@ -208,6 +216,16 @@ class MenuUI:
             start_x = (width - total_w) // 2
             y = height - 70
 
+            if self.can_continue:
+                c_rect = pygame.Rect(0, 0, 3 * btn_w + 2 * gap, 45)
+                c_rect.midbottom = (width // 2, y - 15)
+                self.continue_btn_rect = c_rect
+                self._draw_footer_btn(
+                    screen, c_rect, "Continuar partida salva", mouse_pos
+                )
+            else:
+                self.continue_btn_rect = None
+
             r_rect = pygame.Rect(start_x, y, btn_w, 45)
             self.ranking_btn_rect = r_rect
             self._draw_footer_btn(screen, r_rect, "Ranking", mouse_pos, "🏆")
@@ -223,6 +241,7 @@ class MenuUI:
             self.ranking_btn_rect = None
             self.stats_btn_rect = None
             self.settings_btn_rect = None
+            self.continue_btn_rect = None
 
         if show_back:
             btn_rect = pygame.Rect(40, height - 70, 120, 40)
@@ -239,6 +258,15 @@ class MenuUI:
         else:
             self.back_btn_rect = None
 
+    def _draw_versus_toggle(
+        self, screen: pygame.Surface, width: int, height: int
+    ) -> None:
+        """Desenha o botão que liga/desliga o modo contra o computador."""
+        rect = pygame.Rect(width - 240, height - 70, 200, 40)
+        self.versus_btn_rect = rect
+        text = "Contra o PC: Sim" if self.versus else "Contra o PC: Não"
+        self._draw_footer_btn(screen, rect, text, pygame.mouse.get_pos())
+
     def _draw_footer_btn(
         self,
         screen: pygame.Surface,
@@ -270,6 +298,9 @@ class MenuUI:
             if btn["rect"] and btn["rect"].collidepoint(pos):
                 return (self.state, btn["value"])
 
+        if self.continue_btn_rect and self.continue_btn_rect.collidepoint(pos):
+            return ("ACTION", "CONTINUE")
+
         if self.ranking_btn_rect and self.ranking_btn_rect.collidepoint(pos):
             return ("ACTION", "RANKING")
 
@@ -282,6 +313,9 @@ class MenuUI:
         if self.back_btn_rect and self.back_btn_rect.collidepoint(pos):
             return ("ACTION", "BACK")
 
+        if self.versus_btn_rect and self.versus_btn_rect.collidepoint(pos):
+            return ("ACTION", "VERSUS")
+
         return None
 
     def switch_to_difficulty(self) -> None:
@@ -289,6 +323,10 @@ class MenuUI:
         self.state = "DIFFICULTY_SELECT"
         self.current_buttons = self.difficulty_buttons
 
+    def toggle_versus(self) -> None:
+        """Liga/desliga o modo contra o computador."""
+        self.versus = not self.versus
+
     def reset(self) -> None:
         """Reseta o menu para o estado inicial."""
         self.state = "THEME_SELECT"
@@ -297,3 +335,5 @@ class MenuUI:
         self.stats_btn_rect = None
         self.settings_btn_rect = None
         self.back_btn_rect = None
+        self.versus_btn_rect = None
+        self.continue_btn_rect = None
@@ -0,0 +1,81 @@
+# ARQUIVO: src/ui/profiler.py
+"""
+Overlay de diagnóstico com o custo de cada fase do frame.
+
+Exibe p50/p95/p99 (em ms) coletados pelo FrameProfiler e a taxa de
+quadros real (intervalo entre frames). A linha "total" é o trabalho do
+frame, sem a espera do ``clock.tick``. O texto só é re-renderizado a cada
+poucos frames para não distorcer a própria medição.
+"""
+
+import pygame
+
+from src.infrastructure.telemetry import FrameProfiler
+
+
+class ProfilerOverlay:
+    """Painel translúcido com a tabela de percentis por fase."""
+
+    def __init__(self, profiler: FrameProfiler, refresh_frames: int = 30):
+        """
+        Inicializa o overlay.
+
+        Args:
+            profiler: Coletor de tempos a ser exibido
+            refresh_frames: Intervalo (em frames) entre re-renderizações
+        """
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.visible = False
+
+        try:
+            self.font = pygame.font.SysFont("consolas", 14)
+        except:
+            self.font = pygame.font.SysFont("arial", 14)
+
+        self._surface: pygame.Surface | None = None
+        self._rendered_at = -1
+
+    def toggle(self) -> None:
+        """Mostra/oculta o overlay."""
+        self.visible = not self.visible
+        self._rendered_at = -1
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Desenha o overlay no canto superior esquerdo.
+
+        Args:
+            screen: Superfície do Pygame
+        """
+        if not self.visible:
+            return
+
+        frame = self.profiler.frame_count
+        if self._surface is None or frame - self._rendered_at >= self.refresh_frames:
+            self._surface = self._render()
+            self._rendered_at = frame
+
+        screen.blit(self._surface, (10, 10))
+
+    def _render(self) -> pygame.Surface:
+        """Renderiza a tabela de percentis numa nova superfície."""
+        summary = self.profiler.summary()
+        work = summary.pop("total", (0.0, 0.0, 0.0))
+
+        lines = [f"{'fase (ms)':<11}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in summary.items():
+            lines.append(f"{name:<11}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        lines.append(f"{'trabalho':<11}{work[0]:>7.2f}{work[1]:>7.2f}{work[2]:>7.2f}")
+        lines.append(f"{self.profiler.fps():.0f} FPS | F3 ocultar | F4 CSV")
+
+        line_h = self.font.get_linesize()
+        text_surfs = [self.font.render(line, True, (230, 230, 230)) for line in lines]
+        width = max(s.get_width() for s in text_surfs) + 16
+        height = line_h * len(text_surfs) + 12
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, text_surf in enumerate(text_surfs):
+            surface.blit(text_surf, (8, 6 + i * line_h))
+        return surface
@@ -1,4 +1,6 @@
 # ARQUIVO: src/ui/ranking.py
+from collections import OrderedDict
+
 import pygame
 
 from src.ui.components import Button
@@ -22,6 +24,16 @@ class RankingUI:
 
         self.difficulty_filter = None
         self.theme_filter = None
+        self.period_filter = None
+
+        # Rolagem: primeira linha visível e tamanho da última página desenhada
+        self.scroll = 0
+        self.visible_rows = 10
+        self.total_rows = 0
+
+        # Superfícies de linhas já desenhadas (só as visíveis são criadas)
+        self._row_cache: OrderedDict = OrderedDict()
+        self._row_cache_size = 256
 
         # Filtros Dificuldade
         self.diff_filters = [
@@ -41,6 +53,13 @@ class RankingUI:
             {"label": "Bandeiras", "value": "Bandeiras"},
         ]
 
+        # Filtros Período (janelas móveis, ver infrastructure/leaderboard)
+        self.period_filters = [
+            {"label": "Sempre", "value": None},
+            {"label": "Últimos 7 dias", "value": "week"},
+            {"label": "Últimas 24h", "value": "day"},
+        ]
+
         self.btn_back = Button(
             0,
             0,
@@ -51,6 +70,12 @@ class RankingUI:
             COLORS["card_back"],
             COLORS["accent"],
         )
+        self.btn_prev = Button(
+            0, 0, 120, 30, "< Anterior", self.font_btn, COLORS["card_back"]
+        )
+        self.btn_next = Button(
+            0, 0, 120, 30, "Próxima >", self.font_btn, COLORS["card_back"]
+        )
 
     def draw(self, screen):
         screen.fill(COLORS["background"])
@@ -66,12 +91,15 @@ class RankingUI:
         self._draw_filter_row(
             screen, self.theme_filters, width, y=135, selected_val=self.theme_filter
         )
+        self._draw_filter_row(
+            screen, self.period_filters, width, y=180, selected_val=self.period_filter
+        )
 
         # Cabeçalho
         headers = ["Pos", "Nome", "Pontos", "Tema", "Nível", "Data"]
         col_x = [width * p for p in [0.08, 0.20, 0.45, 0.60, 0.75, 0.90]]
 
-        header_y = 180
+        header_y = 230
         for i, h in enumerate(headers):
             surf = self.font_header.render(h, True, COLORS["success"])
             screen.blit(surf, surf.get_rect(center=(col_x[i], header_y)))
@@ -80,13 +108,12 @@ class RankingUI:
             screen, COLORS["text"], (40, header_y + 20), (width - 40, header_y + 20), 2
         )
 
-        # Busca Dados
-        scores = self.repository.get_top_scores(
-            10, difficulty_filter=self.difficulty_filter, theme_filter=self.theme_filter
-        )
-
+        # Busca só as linhas visíveis (o resto do ranking nem é desenhado)
         start_y = header_y + 40
         row_height = 35
+        pager_y = height - 100
+        self.visible_rows = max(1, (pager_y - 20 - start_y) // row_height)
+        scores = self._get_page()
 
         if not scores:
             msg = self.font_header.render(
@@ -96,32 +123,124 @@ class RankingUI:
 
         for i, entry in enumerate(scores):
             y = start_y + (i * row_height)
-            row_data = [
-                str(i + 1),
-                entry["name"][:12],
-                str(entry["score"]),
-                entry["theme"][:9],
-                entry["difficulty"][:3],
-                entry.get("date", "--/--"),
-            ]
-
-            for j, text in enumerate(row_data):
-                color = COLORS["text"]
-                if i == 0:
-                    color = (255, 215, 0)
-                elif i == 1:
-                    color = (192, 192, 192)
-                elif i == 2:
-                    color = (205, 127, 50)
-
-                surf = self.font_row.render(text, True, color)
-                screen.blit(surf, surf.get_rect(center=(col_x[j], y)))
+            surf = self._row_surface(self.scroll + i, entry, col_x, width, row_height)
+            screen.blit(surf, (0, y - row_height // 2))
+
+        self._draw_scrollbar(screen, width, start_y - row_height // 2, row_height)
+        self._draw_pager(screen, width, pager_y)
 
         # Rodapé
         self.btn_back.rect.centerx = width // 2
         self.btn_back.rect.bottom = height - 30
         self.btn_back.draw(screen)
 
+    def _get_page(self):
+        """Linhas visíveis dos filtros atuais (consulta paginada)."""
+        page, self.total_rows = self.repository.get_scores_page(
+            self.scroll,
+            self.visible_rows,
+            difficulty_filter=self.difficulty_filter,
+            theme_filter=self.theme_filter,
+            period=self.period_filter,
+        )
+        if not page and self.scroll > 0:
+            # O ranking encolheu (filtro, partidas expiradas): volta ao fim
+            self.scroll_to(self.total_rows)
+            return self._get_page()
+        return page
+
+    def _row_surface(self, position, entry, col_x, width, row_height):
+        """
+        Superfície de uma linha do ranking, reaproveitada entre frames.
+
+        Args:
+            position: Posição no ranking (0 = primeiro lugar)
+            entry: Registro da partida
+            col_x: Centro de cada coluna
+            width, row_height: Tamanho da linha
+        """
+        row_data = (
+            str(position + 1),
+            entry["name"][:12],
+            str(entry["score"]),
+            entry["theme"][:9],
+            entry["difficulty"][:3],
+            entry.get("date", "--/--"),
+        )
+        key = (row_data, width)
+        surf = self._row_cache.get(key)
+        if surf is not None:
+            self._row_cache.move_to_end(key)
+            return surf
+
+        color = COLORS["text"]
+        if position == 0:
+            color = (255, 215, 0)
+        elif position == 1:
+            color = (192, 192, 192)
+        elif position == 2:
+            color = (205, 127, 50)
+
+        surf = pygame.Surface((width, row_height), pygame.SRCALPHA)
+        for j, text in enumerate(row_data):
+            cell = self.font_row.render(text, True, color)
+            surf.blit(cell, cell.get_rect(center=(col_x[j], row_height // 2)))
+
+        self._row_cache[key] = surf
+        if len(self._row_cache) > self._row_cache_size:
+            self._row_cache.popitem(last=False)
+        return surf
+
+    def _draw_scrollbar(self, screen, width, top, row_height):
+        """Barra de rolagem proporcional à parte visível do ranking."""
+        if self.total_rows <= self.visible_rows:
+            return
+        track = pygame.Rect(width - 25, top, 6, self.visible_rows * row_height)
+        pygame.draw.rect(screen, COLORS["card_back"], track, border_radius=3)
+        thumb_h = max(20, track.height * self.visible_rows // self.total_rows)
+        max_scroll = self.total_rows - self.visible_rows
+        thumb_y = track.top + (track.height - thumb_h) * self.scroll // max_scroll
+        thumb = pygame.Rect(track.left, thumb_y, track.width, thumb_h)
+        pygame.draw.rect(screen, COLORS["accent"], thumb, border_radius=3)
+
+    def _draw_pager(self, screen, width, y):
+        """Botões de página e a faixa de posições exibidas."""
+        if self.total_rows <= self.visible_rows:
+            return
+        last = min(self.scroll + self.visible_rows, self.total_rows)
+        label = self.font_btn.render(
+            f"{self.scroll + 1}–{last} de {self.total_rows}", True, COLORS["text"]
+        )
+        screen.blit(label, label.get_rect(center=(width // 2, y)))
+
+        self.btn_prev.rect.center = (width // 2 - 170, y)
+        self.btn_next.rect.center = (width // 2 + 170, y)
+        self.btn_prev.draw(screen)
+        self.btn_next.draw(screen)
+
+    def scroll_to(self, row: int) -> None:
+        """Rola para que ``row`` seja a primeira linha visível (limitado)."""
+        max_scroll = max(0, self.total_rows - self.visible_rows)
+        self.scroll = max(0, min(row, max_scroll))
+
+    def handle_scroll(self, event):
+        """Roda do mouse e teclas de navegação (setas, PgUp/PgDn, Home/End)."""
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_to(self.scroll - event.y * 3)
+        elif event.type == pygame.KEYDOWN:
+            steps = {
+                pygame.K_UP: -1,
+                pygame.K_DOWN: 1,
+                pygame.K_PAGEUP: -self.visible_rows,
+                pygame.K_PAGEDOWN: self.visible_rows,
+            }
+            if event.key in steps:
+                self.scroll_to(self.scroll + steps[event.key])
+            elif event.key == pygame.K_HOME:
+                self.scroll_to(0)
+            elif event.key == pygame.K_END:
+                self.scroll_to(self.total_rows)
+
     def _draw_filter_row(self, screen, filters, width, y, selected_val):
         btn_w, btn_h = 110, 30
         gap = 8
@@ -163,14 +282,30 @@ class RankingUI:
         if self.btn_back.check_click(event):
             return "BACK"
 
+        if self.total_rows > self.visible_rows:
+            if self.btn_prev.check_click(event):
+                self.scroll_to(self.scroll - self.visible_rows)
+                return "PAGE_CHANGED"
+            if self.btn_next.check_click(event):
+                self.scroll_to(self.scroll + self.visible_rows)
+                return "PAGE_CHANGED"
+
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             for f in self.diff_filters:
                 if f["rect"] and f["rect"].collidepoint(event.pos):
                     self.difficulty_filter = f["value"]
+                    self.scroll = 0
                     return "FILTER_CHANGED"
 
             for f in self.theme_filters:
                 if f["rect"] and f["rect"].collidepoint(event.pos):
                     self.theme_filter = f["value"]
+                    self.scroll = 0
+                    return "FILTER_CHANGED"
+
+            for f in self.period_filters:
+                if f["rect"] and f["rect"].collidepoint(event.pos):
+                    self.period_filter = f["value"]
+                    self.scroll = 0
                     return "FILTER_CHANGED"
         return None
@@ -0,0 +1,407 @@
+# ARQUIVO: src/ui/remote.py
+"""
+Cliente do servidor de partidas (src/infrastructure/game_server.py).
+
+O GameClient conversa com o servidor por duas threads próprias (leitura e
+escrita do socket), de modo que um servidor lento nunca trava o frame: o
+loop do jogo só consulta filas. O RemoteGameService espelha o estado recebido
+(retrato inicial + deltas) com a mesma interface que o GraphicUI usa do
+GameService, e o RemoteGraphicUI envia as jogadas ao servidor em vez de
+aplicá-las localmente.
+
+Uso:
+    python -m src.ui.remote --room sala1 --name Ana --host 127.0.0.1
+"""
+
+import argparse
+import collections
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+
+import src.ui.styles as styles
+from src.domain.board import Board
+from src.infrastructure.game_server import CARD_MATCHED, CARD_REVEALED, encode_message
+from src.services.game_service import GameService
+from src.services.replay import RecordedLayoutStrategy
+from src.ui.gui import GraphicUI
+from src.ui.styles import DIMENSIONS
+
+
+class GameClient:
+    """Conexão com o servidor, lida sem bloquear o loop do jogo."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, timeout=5.0):
+        """
+        Conecta e inicia as threads de leitura e escrita.
+
+        Args:
+            host, port: Endereço do servidor
+            timeout: Espera máxima pela conexão (só no connect)
+        """
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        # Depois do connect o socket só é usado pelas threads: pode bloquear
+        self.sock.settimeout(None)
+        self.connected = True
+        self._inbox: queue.Queue = queue.Queue()
+        self._outbox: queue.Queue = queue.Queue()
+        # Mensagens já lidas da fila mas ainda não entregues (ver wait_for)
+        self._pending: collections.deque = collections.deque()
+        self._reader = threading.Thread(
+            target=self._read_loop, name="game-client-reader", daemon=True
+        )
+        self._writer = threading.Thread(
+            target=self._write_loop, name="game-client-writer", daemon=True
+        )
+        self._reader.start()
+        self._writer.start()
+
+    def send(self, message: Dict) -> None:
+        """Agenda o envio de uma mensagem ao servidor (não bloqueia)."""
+        if self.connected:
+            self._outbox.put(encode_message(message))
+
+    def join(self, room: str, name: str, rows=4, cols=4, theme="Animais") -> None:
+        """Entra (ou cria) uma sala."""
+        self.send(
+            {
+                "op": "join",
+                "room": room,
+                "name": name,
+                "rows": rows,
+                "cols": cols,
+                "theme": theme,
+            }
+        )
+
+    def pick(self, row: int, col: int) -> None:
+        """Envia uma jogada."""
+        self.send({"op": "pick", "row": row, "col": col})
+
+    def poll(self, timeout: float = 0.0) -> List[Dict]:
+        """
+        Retorna as mensagens recebidas desde a última consulta.
+
+        Args:
+            timeout: Espera máxima pela primeira mensagem (0 = não bloqueia)
+        """
+        messages = list(self._pending)
+        self._pending.clear()
+        if not messages and timeout > 0:
+            try:
+                messages.append(self._inbox.get(timeout=timeout))
+            except queue.Empty:
+                return []
+        while True:
+            try:
+                messages.append(self._inbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def wait_for(self, ops: Iterable[str], timeout: float) -> Optional[Dict]:
+        """
+        Espera a primeira mensagem com ``op`` em ``ops``.
+
+        As demais mensagens recebidas no caminho (por exemplo, um delta que
+        chegou junto com o ``welcome``) ficam guardadas para o próximo
+        ``poll``.
+
+        Args:
+            ops: Operações aceitas
+            timeout: Espera máxima em segundos
+
+        Returns:
+            A mensagem, ou None se o prazo acabou ou a conexão caiu
+        """
+        ops = set(ops)
+        deadline = time.monotonic() + timeout
+        skipped = []
+        found = None
+        while found is None:
+            if self._pending:
+                message = self._pending.popleft()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = self._inbox.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if message.get("op") in ops:
+                found = message
+            else:
+                skipped.append(message)
+        self._pending.extendleft(reversed(skipped))
+        return found
+
+    def close(self) -> None:
+        self.connected = False
+        self._outbox.put(None)
+        try:
+            # Acorda a thread de leitura presa no recv
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _read_loop(self) -> None:
+        buffer = b""
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except OSError:
+                data = b""
+            if not data:
+                self.connected = False
+                return
+            *lines, buffer = (buffer + data).split(b"\n")
+            for line in lines:
+                if line:
+                    self._inbox.put(json.loads(line))
+
+    def _write_loop(self) -> None:
+        while True:
+            data = self._outbox.get()
+            if data is None:
+                return
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                self.connected = False
+                return
+
+
+class RemoteGameService:
+    """
+    Espelho do estado de uma sala remota.
+
+    Expõe os atributos do GameService usados pela UI (``board``, ``score``,
+    ``moves``, ``combo_streak``...), referentes ao jogador local.
+    """
+
+    get_time_formatted = GameService.get_time_formatted
+
+    def __init__(self, welcome: Dict):
+        """
+        Monta o espelho a partir da mensagem ``welcome`` do servidor.
+
+        Args:
+            welcome: Mensagem com ``player`` e ``snapshot``
+        """
+        snapshot = welcome["snapshot"]
+        self.player_index = welcome["player"]
+        self.room = snapshot["room"]
+        self.theme = snapshot["theme"]
+        rows, cols = snapshot["rows"], snapshot["cols"]
+
+        # Conteúdo desconhecido até o servidor revelar
+        layout = [["", ""] for _ in range(rows * cols)]
+        self.board = Board(rows, cols, strategy=RecordedLayoutStrategy(layout))
+        for i, (flags, content, match_id) in enumerate(snapshot["cards"]):
+            self._set_card(i // cols, i % cols, flags, content, match_id)
+
+        self.players: List[str] = snapshot["players"]
+        self.scores: List[int] = snapshot["scores"]
+        self.player_moves: List[int] = snapshot["moves"]
+        self.combos: List[int] = snapshot["combos"]
+        self.current_player: int = snapshot["turn"]
+        first = snapshot["first"]
+        self.first_selected_pos = tuple(first) if first else None
+        self.start_time = time.time() - snapshot["elapsed_ms"] / 1000
+        self.end_time = time.time() if snapshot["finished"] else None
+        self.last_error: Optional[str] = None
+
+    @property
+    def score(self) -> int:
+        return self.scores[self.player_index]
+
+    @property
+    def moves(self) -> int:
+        return self.player_moves[self.player_index]
+
+    @property
+    def combo_streak(self) -> int:
+        return self.combos[self.player_index]
+
+    @property
+    def is_my_turn(self) -> bool:
+        return self.current_player == self.player_index
+
+    def _set_card(self, row, col, flags, content, match_id) -> None:
+        card = self.board.get_card(row, col)
+        card.is_revealed = bool(flags & CARD_REVEALED)
+        card.is_matched = bool(flags & CARD_MATCHED)
+        if content is not None:
+            card.display_content = content
+        if match_id is not None:
+            card.match_id = match_id
+
+    def apply(self, message: Dict) -> Optional[str]:
+        """
+        Aplica uma mensagem do servidor.
+
+        Returns:
+            O resultado da jogada (para deltas) ou None
+        """
+        op = message.get("op")
+        if op == "player":
+            index = message["player"]
+            if index == len(self.players):
+                self.players.append(message["name"])
+                for counters in (self.scores, self.player_moves, self.combos):
+                    counters.append(0)
+            # Vaga nova ou reaproveitada (de quem saiu da sala)
+            self.players[index] = message["name"]
+            self.scores[index] = message.get("score", 0)
+            self.player_moves[index] = message.get("moves", 0)
+            self.combos[index] = message.get("combo", 0)
+        elif op == "error":
+            self.last_error = message["message"]
+        elif op == "delta":
+            for row, col, flags, content, match_id in message["cards"]:
+                self._set_card(row, col, flags, content, match_id)
+            player = message["player"]
+            self.scores[player] = message["score"]
+            self.player_moves[player] = message["moves"]
+            self.combos[player] = message["combo"]
+            self.current_player = message["turn"]
+
+            result = message["result"]
+            if result == "FIRST_PICK":
+                self.first_selected_pos = tuple(message["cards"][0][:2])
+            elif result in ("MATCH", "NO_MATCH", "TURN"):
+                self.first_selected_pos = None
+            if self.board.all_matched and self.end_time is None:
+                self.end_time = time.time()
+            return result
+        return None
+
+    def hide_cards(self, pos1, pos2) -> None:
+        """As cartas são escondidas pelo servidor (delta ``HIDE``)."""
+
+
+class RemoteGraphicUI(GraphicUI):
+    """GraphicUI que joga numa sala remota."""
+
+    def __init__(self, client: GameClient, service: RemoteGameService, **kwargs):
+        """
+        Inicializa a interface.
+
+        Args:
+            client: Conexão com o servidor
+            service: Espelho da sala
+            **kwargs: Repassados ao GraphicUI (card_size, profiler)
+        """
+        super().__init__(service, **kwargs)
+        self.client = client
+        # Sem pré-carga de fatos: as cartas só são conhecidas ao serem reveladas
+        self.current_theme = service.theme
+
+    def update(self) -> None:
+        """Aplica as mensagens do servidor e atualiza as animações."""
+        for message in self.client.poll():
+            first_pos = self.service.first_selected_pos
+            result = self.service.apply(message)
+            if result in ("FIRST_PICK", "MATCH", "NO_MATCH"):
+                current_pos = tuple(message["cards"][-1][:2])
+                self._show_pick_result(result, first_pos, current_pos)
+            elif message.get("op") == "error":
+                self.message = message["message"]
+        super().update()
+
+    def handle_click(self, event: pygame.event.Event) -> str | None:
+        """Ignora cliques no tabuleiro fora da sua vez."""
+        if not self.service.board.all_matched and not self.service.is_my_turn:
+            return None
+        return super().handle_click(event)
+
+    def _process_pick(self, r: int, c: int) -> None:
+        """Envia a jogada; o resultado chega como delta em ``update``."""
+        self.client.pick(r, c)
+
+    def _draw_stats(self) -> None:
+        """Renderiza pontos, vez e tempo."""
+        section_w = self.width // 3
+        y_pos = 90
+        service = self.service
+
+        self._draw_stat_box(f"Pontos: {service.score}", (section_w // 2, y_pos))
+        if service.is_my_turn:
+            turn = "Sua vez!"
+        else:
+            turn = f"Vez de {service.players[service.current_player]}"
+        color = styles.COLORS["success"] if service.is_my_turn else None
+        self._draw_stat_box(turn, (section_w + section_w // 2, y_pos), color)
+        self._draw_stat_box(
+            f"Tempo: {service.get_time_formatted()}",
+            (section_w * 2 + section_w // 2, y_pos),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cliente de partidas em rede")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--room", required=True)
+    parser.add_argument("--name", default="Jogador")
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--cols", type=int, default=4)
+    parser.add_argument("--theme", default="Animais")
+    args = parser.parse_args()
+
+    client = GameClient(args.host, args.port)
+    client.join(args.room, args.name, args.rows, args.cols, args.theme)
+    welcome = client.wait_for(("welcome", "error"), timeout=5.0)
+    if welcome is None or welcome["op"] == "error":
+        print(f"Erro ao entrar na sala: {welcome and welcome['message']}")
+        return
+
+    service = RemoteGameService(welcome)
+    rows, cols = service.board.rows, service.board.cols
+    card_size = 85 if rows >= 6 else DIMENSIONS["card_size"]
+
+    os.environ["SDL_VIDEO_CENTERED"] = "1"
+    pygame.init()
+    screen = pygame.display.set_mode(
+        (
+            max(900, cols * (card_size + DIMENSIONS["gap"]) + 100),
+            max(
+                750,
+                DIMENSIONS["header_height"]
+                + rows * (card_size + DIMENSIONS["gap"])
+                + 120,
+            ),
+        )
+    )
+    pygame.display.set_caption(f"Memória Pythônica - Sala {service.room}")
+    ui = RemoteGraphicUI(client, service, card_size=card_size)
+    ui.screen = screen
+
+    clock = pygame.time.Clock()
+    running = True
+    while running and client.connected:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (
+                event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+            ):
+                running = False
+            elif ui.handle_click(event) == "MENU":
+                running = False
+        ui.update()
+        ui.draw()
+        pygame.display.flip()
+        clock.tick(60)
+
+    client.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
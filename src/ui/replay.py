@@ -0,0 +1,112 @@
+# ARQUIVO: src/ui/replay.py
+"""
+Visualizador de replays.
+
+Reproduz um GameEventLog no GraphicUI (com animações, sons e Game Over)
+na velocidade escolhida. Setas ↑/↓ dobram/reduzem a velocidade e ESC sai.
+
+Uso:
+    python -m src.ui.replay replays/partida.mgr --speed 2
+"""
+
+import argparse
+import os
+
+import pygame
+
+import src.ui.styles as styles
+from src.infrastructure.replay_store import load_replay
+from src.services.event_log import GameEventLog
+from src.services.replay import GameReplay
+from src.ui.gui import GraphicUI
+from src.ui.styles import DIMENSIONS
+
+
+class ReplayUI:
+    """Executa um replay dentro do GraphicUI."""
+
+    def __init__(self, log: GameEventLog, speed: float = 1.0):
+        """
+        Inicializa o visualizador.
+
+        Args:
+            log: Registro da partida
+            speed: Velocidade inicial de reprodução
+        """
+        self.log = log
+        self.speed = speed
+
+        service = GameReplay(log).service
+        card_size = 85 if log.rows >= 6 else DIMENSIONS["card_size"]
+        width = max(900, (log.cols * (card_size + DIMENSIONS["gap"])) + 100)
+        height = max(
+            750,
+            DIMENSIONS["header_height"]
+            + (log.rows * (card_size + DIMENSIONS["gap"]))
+            + 120,
+        )
+
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption("Memória Pythônica - Replay")
+        self.ui = GraphicUI(service, card_size=card_size)
+        self.ui.screen = self.screen
+        self.ui.set_theme(log.metadata.get("theme"))
+
+        self.position = 0
+        self.replay_ms = 0.0
+
+    def update(self, dt_ms: float) -> None:
+        """
+        Avança o relógio do replay e aplica os eventos vencidos.
+
+        Args:
+            dt_ms: Tempo real decorrido desde o último frame
+        """
+        self.replay_ms += dt_ms * self.speed
+        events = self.log.events
+        while self.position < len(events) and events[self.position].t_ms <= self.replay_ms:
+            self.ui.apply_replay_event(events[self.position])
+            self.position += 1
+        self.ui.update()
+
+    def run(self) -> None:
+        """Loop do visualizador (até ESC ou fechar a janela)."""
+        clock = pygame.time.Clock()
+        running = True
+        while running:
+            dt_ms = clock.tick(60)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_UP:
+                        self.speed = min(64.0, self.speed * 2)
+                    elif event.key == pygame.K_DOWN:
+                        self.speed = max(0.125, self.speed / 2)
+
+            self.update(dt_ms)
+            self.ui.draw()
+
+            label = self.ui.font_stats.render(
+                f"REPLAY {self.speed:g}x", True, styles.COLORS["warning"]
+            )
+            self.screen.blit(label, (10, 10))
+            pygame.display.flip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Visualizador de replays")
+    parser.add_argument("path", help="Arquivo de replay (.mgr ou .json)")
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEO_CENTERED"] = "1"
+    pygame.init()
+    ReplayUI(load_replay(args.path), speed=args.speed).run()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,10 @@ from src.ui.styles import COLORS
 
 
 class StatisticsUI:
-    def __init__(self, repository):
+    def __init__(self, repository, player_name: str = ""):
         self.repository = repository
+        # Jogador logado, mostrado no painel de perfil
+        self.player_name = player_name
 
         try:
             self.font_title = pygame.font.SysFont("segoeui", 48, bold=True)
@@ -75,8 +77,18 @@ class StatisticsUI:
             COLORS["accent"],
         )
 
+        # Perfil do jogador logado
+        profile = self.repository.get_player_profile(self.player_name)
+        if profile:
+            self._draw_profile(screen, profile, 100, 220, width - 200, 90)
+            chart_y, chart_h = 370, 240
+        else:
+            chart_y, chart_h = 280, 300
+
         # Gráfico
-        self._draw_bar_chart(screen, stats["themes_count"], 100, 280, width - 200, 300)
+        self._draw_bar_chart(
+            screen, stats["themes_count"], 100, chart_y, width - 200, chart_h
+        )
 
         # Rodapé
         self.btn_back.rect.centerx = width // 2
@@ -98,6 +110,32 @@ class StatisticsUI:
             val_surf, val_surf.get_rect(center=(rect.centerx, rect.centery + 15))
         )
 
+    def _draw_profile(self, screen, profile, x, y, w, h):
+        """Painel com recorde, média, posição e últimas partidas do jogador."""
+        rect = pygame.Rect(x, y, w, h)
+        pygame.draw.rect(screen, (50, 52, 64), rect, border_radius=15)
+        pygame.draw.rect(screen, COLORS["success"], rect, width=2, border_radius=15)
+
+        best = profile["best"]
+        title = self.font_btn.render(
+            f"Perfil de {profile['name']}", True, COLORS["success"]
+        )
+        summary = self.font_label.render(
+            f"Recorde {best['score']} ({best['difficulty']})   ·   "
+            f"Média {profile['average']:.0f} em {profile['games']} jogos   ·   "
+            f"Posição #{profile['rank']} de {profile['total_players']}",
+            True,
+            COLORS["text"],
+        )
+        recent = " · ".join(str(game["score"]) for game in profile["recent"])
+        recent_surf = self.font_label.render(
+            f"Últimas partidas: {recent}", True, (180, 180, 180)
+        )
+
+        screen.blit(title, (x + 20, y + 10))
+        screen.blit(summary, (x + 20, y + 38))
+        screen.blit(recent_surf, (x + 20, y + 62))
+
     def _draw_bar_chart(self, screen, data_dict, x, y, w, h):
         if not data_dict:
             return
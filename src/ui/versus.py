@@ -0,0 +1,102 @@
+# ARQUIVO: src/ui/versus.py
+"""
+Interface do modo versus (jogador contra o computador).
+
+Reaproveita o GraphicUI: as jogadas do computador passam pelo mesmo
+``_process_pick`` dos cliques, então animações, sons e flashcards são
+idênticos. Durante a vez do computador os cliques no tabuleiro são
+ignorados.
+"""
+
+import pygame
+
+import src.ui.styles as styles
+from src.infrastructure.telemetry import FrameProfiler
+from src.services.ai_player import AIController, AIPlayer
+from src.services.versus_service import VersusGameService
+from src.ui.gui import GraphicUI
+
+
+class VersusUI(GraphicUI):
+    """GraphicUI com um oponente controlado pelo computador."""
+
+    def __init__(
+        self,
+        service: VersusGameService,
+        ai: AIPlayer,
+        card_size: int = None,
+        profiler: FrameProfiler | None = None,
+    ):
+        """
+        Inicializa a interface.
+
+        Args:
+            service: Partida versus (o computador é o jogador 1)
+            ai: Política do computador
+            card_size: Tamanho customizado das cartas
+            profiler: Coletor de tempos por fase
+        """
+        super().__init__(service, card_size=card_size, profiler=profiler)
+        self.ai = ai
+        self.controller = AIController(ai, service, player_index=1)
+        self.message = f"Sua vez, {service.players[0]}!"
+
+    def update(self) -> None:
+        """Atualiza animações e deixa o computador jogar quando for a vez dele."""
+        was_waiting = self.waiting_to_hide
+        super().update()
+
+        if was_waiting and not self.waiting_to_hide:
+            self.message = (
+                "Vez do computador..."
+                if self.controller.is_ai_turn
+                else f"Sua vez, {self.service.players[0]}!"
+            )
+
+        pick = self.controller.update(
+            pygame.time.get_ticks(), busy=self.waiting_to_hide
+        )
+        if pick is not None:
+            self._process_pick(*pick)
+
+    def handle_click(self, event: pygame.event.Event) -> str | None:
+        """Ignora cliques no tabuleiro durante a vez do computador."""
+        if self.controller.is_ai_turn:
+            return None
+        return super().handle_click(event)
+
+    def _process_pick(self, r: int, c: int) -> None:
+        """Processa a jogada e mostra a carta revelada ao computador."""
+        card = self.service.board.get_card(r, c)
+        was_hidden = card is not None and not card.is_revealed
+        super()._process_pick(r, c)
+        if was_hidden and card.is_revealed:
+            self.ai.observe(r, c, card.match_id)
+
+    def _draw_stats(self) -> None:
+        """Renderiza o placar dos dois jogadores e o tempo."""
+        section_w = self.width // 3
+        y_pos = 90
+        service = self.service
+
+        for i in range(2):
+            name = service.players[i]
+            text = f"{name}: {service.scores[i]}"
+            if i == service.current_player and not service.board.all_matched:
+                text = f"▶ {text}"
+                color = styles.COLORS["success"]
+            else:
+                color = styles.COLORS["text"]
+            self._draw_stat_box(text, (section_w * i + section_w // 2, y_pos), color)
+
+        time_text = f"Tempo: {service.get_time_formatted()}"
+        self._draw_stat_box(time_text, (section_w * 2 + section_w // 2, y_pos))
+
+    def _game_over_title(self) -> str:
+        winner = self.service.winner()
+        if winner is None:
+            return "EMPATE!"
+        return "VOCÊ VENCEU!" if winner == 0 else "O COMPUTADOR VENCEU!"
+
+    def _final_score(self) -> int:
+        return self.service.scores[0]
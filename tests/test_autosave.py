@@ -0,0 +1,62 @@
+import os
+
+from src.domain.board import Board
+from src.infrastructure.autosave import (
+    AutosaveWriter,
+    decode_save,
+    encode_save,
+    load_save,
+)
+from src.services.game_service import GameService
+
+
+def test_save_round_trip_with_header(tmp_path):
+    """Garante que cabeçalho e partida voltam iguais do arquivo."""
+    service = GameService(Board(4, 4, seed=8))
+    service.pick_card(0, 0)
+    header = {"player": "Ana", "theme": "Animais", "pending_hide": None}
+
+    loaded_header, restored = decode_save(encode_save(service, header))
+
+    assert loaded_header == header
+    assert restored.first_selected_pos == (0, 0)
+    assert restored.board.get_card(0, 0).is_revealed
+
+
+def test_writer_coalesces_and_keeps_latest(tmp_path):
+    """Garante que rajadas de salvamentos gravam só o mais recente."""
+    path = str(tmp_path / "autosave.mgv")
+    writer = AutosaveWriter(path)
+    service = GameService(Board(4, 4, seed=8))
+
+    for i in range(200):
+        writer.submit(encode_save(service, {"i": i}))
+    assert writer.flush(timeout=5)
+
+    header, _ = load_save(path)
+    assert header == {"i": 199}
+    assert 1 <= writer.writes <= 200
+    assert not os.path.exists(path + ".tmp")
+    writer.close()
+
+
+def test_clear_removes_save(tmp_path):
+    """Garante que a partida terminada apaga o salvamento."""
+    path = str(tmp_path / "autosave.mgv")
+    writer = AutosaveWriter(path)
+    writer.submit(encode_save(GameService(Board(4, 4, seed=1)), {}))
+    writer.flush(timeout=5)
+    assert writer.has_save
+
+    writer.clear()
+    assert not writer.has_save
+    writer.close()
+    assert not os.path.exists(path)
+
+
+def test_corrupted_save_is_ignored(tmp_path):
+    """Garante que um arquivo inválido não impede o jogo de abrir."""
+    path = tmp_path / "autosave.mgv"
+    path.write_bytes(b"MGV1\x05{}")
+    assert load_save(str(path)) is None
+    assert load_save(str(tmp_path / "inexistente.mgv")) is None
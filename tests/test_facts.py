@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from src.domain.facts import FactsDatabase
+
+
+@pytest.fixture
+def facts_dir(tmp_path, monkeypatch):
+    # Isola a base em um diretório temporário com um tema pequeno
+    (tmp_path / "quimica.json").write_text(
+        json.dumps({"H": {"name": "Hidrogênio"}, "He": {"name": "Hélio"}}),
+        encoding="utf-8",
+    )
+    (tmp_path / "index.json").write_text(
+        json.dumps({"themes": {"Química": {"file": "quimica.json", "count": 2}}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(FactsDatabase, "DATA_DIR", str(tmp_path))
+    FactsDatabase.reload()
+    yield tmp_path
+    FactsDatabase.reload()
+
+
+def test_theme_is_loaded_only_on_first_lookup(facts_dir):
+    """Garante que o arquivo do tema só é lido na primeira consulta."""
+    assert FactsDatabase.count_facts("Química") == 2
+    assert "Química" not in FactsDatabase._facts
+
+    assert FactsDatabase.get_fact("Química", "H")["name"] == "Hidrogênio"
+    assert "Química" in FactsDatabase._facts
+
+
+def test_unknown_theme_returns_none(facts_dir):
+    """Garante que temas inexistentes não quebram a busca."""
+    assert FactsDatabase.get_fact("Dinossauros", "🦖") is None
+    assert FactsDatabase.get_random_fact("Dinossauros") is None
+
+
+def test_bulk_import_persists_and_updates_index(facts_dir):
+    """Garante que a importação em lote grava o tema e o índice."""
+    facts = {f"id{i}": {"name": f"Fato {i}"} for i in range(5000)}
+    assert FactsDatabase.import_facts("Dinossauros", facts) == 5000
+
+    FactsDatabase.reload()
+    assert FactsDatabase.count_facts("Dinossauros") == 5000
+    assert FactsDatabase.get_fact("Dinossauros", "id4999")["name"] == "Fato 4999"
+    assert FactsDatabase.get_random_fact("Dinossauros") in facts.values()
+
+
+def test_import_replaces_existing_identifiers(facts_dir):
+    """Garante que reimportar um identificador não duplica a chave de sorteio."""
+    FactsDatabase.import_facts("Química", {"H": {"name": "H2"}}, persist=False)
+
+    assert FactsDatabase.get_fact("Química", "H")["name"] == "H2"
+    assert FactsDatabase._keys["Química"].count("H") == 1
+
+
+def test_shipped_facts_are_available():
+    """Garante que os fatos distribuídos com o jogo continuam acessíveis."""
+    FactsDatabase.reload()
+    assert FactsDatabase.get_fact("Química", "Fe")["name"] == "Ferro"
+    assert "Animais" in FactsDatabase.get_all_themes()
+
+
+def test_get_facts_for_reports_missing_identifiers(facts_dir):
+    """Garante que a busca em lote separa itens com e sem fato."""
+    found, missing = FactsDatabase.get_facts_for("Química", ["H", "Fe", "He"])
+
+    assert set(found) == {"H", "He"}
+    assert missing == ["Fe"]
@@ -0,0 +1,230 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+
+from src.infrastructure.game_server import GameServer
+from src.ui.remote import GameClient, RemoteGameService
+
+
+class SimClient:
+    """Cliente simulado (asyncio) para testar o servidor em localhost."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def join(cls, port, room, name, **options):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        client = cls(reader, writer)
+        await client.send({"op": "join", "room": room, "name": name, **options})
+        return client, await client.recv()
+
+    async def send(self, message):
+        self.writer.write((json.dumps(message) + "\n").encode())
+        await self.writer.drain()
+
+    async def recv(self, op=None):
+        while True:
+            line = await asyncio.wait_for(self.reader.readline(), 2)
+            message = json.loads(line)
+            if op is None or message["op"] == op:
+                return message
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def _pairs(server, room):
+    """Posições agrupadas por par, lidas direto do tabuleiro do servidor."""
+    board = server.rooms[room].board
+    positions = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            positions.setdefault(board.get_card(r, c).match_id, []).append((r, c))
+    return list(positions.values())
+
+
+def _run(scenario):
+    async def main():
+        server = GameServer(port=0, hide_delay=0.01)
+        await server.start()
+        try:
+            await scenario(server)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_two_clients_share_board_and_receive_deltas():
+    """Garante que jogadas viram deltas para todos e a vez passa no erro."""
+
+    async def scenario(server):
+        ana, welcome = await SimClient.join(server.port, "s1", "Ana")
+        bia, welcome_bia = await SimClient.join(server.port, "s1", "Bia")
+        assert welcome["player"] == 0 and welcome_bia["player"] == 1
+        assert (await ana.recv("player"))["name"] == "Bia"
+        # O retrato não entrega o conteúdo das cartas viradas para baixo
+        cards = welcome_bia["snapshot"]["cards"]
+        assert all(card == [0, None, None] for card in cards)
+
+        pairs = _pairs(server, "s1")
+        await bia.send({"op": "pick", "row": 0, "col": 0})
+        assert (await bia.recv("error"))["message"] == "Não é sua vez."
+
+        await ana.send({"op": "pick", "row": pairs[0][0][0], "col": pairs[0][0][1]})
+        await ana.send({"op": "pick", "row": pairs[0][1][0], "col": pairs[0][1][1]})
+        await ana.send({"op": "pick", "row": pairs[1][0][0], "col": pairs[1][0][1]})
+        await ana.send({"op": "pick", "row": pairs[2][0][0], "col": pairs[2][0][1]})
+
+        mirror = RemoteGameService(welcome_bia)
+        results = []
+        while "HIDE" not in results:
+            results.append(mirror.apply(await bia.recv("delta")))
+
+        assert results == ["FIRST_PICK", "MATCH", "FIRST_PICK", "NO_MATCH", "HIDE"]
+        assert mirror.scores == [80, 0]
+        assert mirror.current_player == 1 and mirror.is_my_turn
+        matched = mirror.board.get_card(*pairs[0][0])
+        expected_id = server.rooms["s1"].board.get_card(*pairs[0][0]).match_id
+        assert matched.is_matched and matched.match_id == expected_id
+        assert not mirror.board.get_card(*pairs[1][0]).is_revealed
+
+        await ana.close()
+        await bia.close()
+
+    _run(scenario)
+
+
+def test_pick_delta_is_small():
+    """Garante que o delta de uma jogada tem poucas dezenas de bytes."""
+
+    async def scenario(server):
+        ana, _ = await SimClient.join(server.port, "s2", "Ana")
+        await ana.send({"op": "pick", "row": 0, "col": 0})
+        line = await asyncio.wait_for(ana.reader.readline(), 2)
+        assert json.loads(line)["result"] == "FIRST_PICK"
+        assert len(line) < 120
+        await ana.close()
+
+    _run(scenario)
+
+
+def test_many_rooms_and_cleanup():
+    """Garante centenas de salas simultâneas e remoção das vazias."""
+
+    async def scenario(server):
+        clients = []
+        for i in range(200):
+            client, welcome = await SimClient.join(server.port, f"r{i}", "P")
+            assert welcome["op"] == "welcome"
+            clients.append(client)
+        assert len(server.rooms) == 200
+
+        for client in clients:
+            await client.close()
+        for _ in range(100):
+            if not server.rooms:
+                break
+            await asyncio.sleep(0.01)
+        assert not server.rooms
+
+    _run(scenario)
+
+
+def test_leaving_player_passes_turn():
+    """Garante que, se o jogador da vez sai, a vez passa ao próximo."""
+
+    async def scenario(server):
+        ana, _ = await SimClient.join(server.port, "s3", "Ana")
+        bia, _ = await SimClient.join(server.port, "s3", "Bia")
+        await ana.close()
+        delta = await bia.recv("delta")
+        assert delta["result"] == "TURN" and delta["turn"] == 1
+        await bia.close()
+
+    _run(scenario)
+
+
+def test_invalid_join_is_rejected():
+    """Garante que tabuleiros inválidos são recusados com erro."""
+
+    async def scenario(server):
+        client, reply = await SimClient.join(server.port, "s4", "Ana", rows=3, cols=3)
+        assert reply["op"] == "error"
+        assert not server.rooms
+        await client.close()
+
+    _run(scenario)
+
+
+def test_departed_slots_are_reused_and_seed_is_ignored():
+    """Garante que entrar e sair várias vezes não enche a sala e que a
+    semente enviada pelo cliente não define o tabuleiro."""
+
+    async def main():
+        server = GameServer(port=0, hide_delay=0.01, max_players=2)
+        await server.start()
+        try:
+            ana, _ = await SimClient.join(server.port, "s5", "Ana", seed=12345)
+            assert server.rooms["s5"].board.seed != 12345
+            for i in range(5):
+                name = "Bia" if i % 2 else f"Visitante{i}"
+                guest, welcome = await SimClient.join(server.port, "s5", name)
+                assert welcome["op"] == "welcome" and welcome["player"] == 1
+                joined = await ana.recv("player")
+                assert (joined["player"], joined["name"]) == (1, name)
+                extra, reply = await SimClient.join(server.port, "s5", "Caio")
+                assert reply == {"op": "error", "message": "Sala cheia."}
+                await extra.close()
+                await guest.close()
+                for _ in range(100):
+                    if len(server.rooms["s5"].clients) == 1:
+                        break
+                    await asyncio.sleep(0.01)
+            assert len(server.rooms["s5"].service.players) == 2
+            await ana.close()
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_client_keeps_messages_received_with_welcome():
+    """Garante que o delta que chega no mesmo pacote do welcome não se perde
+    e que consultar a conexão não trava o frame."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    release = threading.Event()
+
+    def fake_server():
+        conn, _ = listener.accept()
+        with conn:
+            conn.makefile("rb").readline()  # join
+            batch = [{"op": "welcome", "player": 0}, {"op": "delta", "n": 1}]
+            conn.sendall(b"".join(json.dumps(m).encode() + b"\n" for m in batch))
+            release.wait(5)  # Servidor "lento": segura a próxima mensagem
+            conn.sendall(b'{"op": "delta", "n": 2}\n')
+            release.wait(5)
+
+    server = threading.Thread(target=fake_server, daemon=True)
+    server.start()
+    client = GameClient(*listener.getsockname())
+    try:
+        client.join("s6", "Ana")
+        assert client.wait_for(("welcome", "error"), timeout=2)["player"] == 0
+
+        start = time.perf_counter()
+        assert client.poll() == [{"op": "delta", "n": 1}]
+        assert client.poll() == []
+        assert time.perf_counter() - start < 0.05
+
+        release.set()
+        assert client.poll(timeout=2) == [{"op": "delta", "n": 2}]
+    finally:
+        release.set()
+        client.close()
+        listener.close()
@@ -0,0 +1,141 @@
+import time
+from datetime import datetime
+from unittest import mock
+
+from src.infrastructure import score_columns
+from src.infrastructure.leaderboard import Leaderboards, RollingLeaderboard
+from src.infrastructure.repository import ScoreRepository
+
+HOUR = 3600
+
+
+def _entry(name, score, ts, difficulty="Fácil"):
+    return {
+        "name": name,
+        "score": score,
+        "theme": "Animais",
+        "difficulty": difficulty,
+        "date": "01/01 00:00",
+        "ts": ts,
+    }
+
+
+def test_rolling_window_expires_lazily():
+    """Garante que partidas saem do ranking quando deixam a janela."""
+    now = 1_000_000.0
+    board = RollingLeaderboard(24 * HOUR)
+    board.load([(_entry("Velha", 900, now - 30 * HOUR), now - 30 * HOUR)], now)
+    board.add(_entry("Ana", 300, now - 23 * HOUR), now - 23 * HOUR, now)
+    board.add(_entry("Bia", 500, now - 1 * HOUR), now - 1 * HOUR, now)
+
+    assert [e["name"] for e in board.top(now=now)] == ["Bia", "Ana"]
+    assert len(board) == 2
+
+    assert [e["name"] for e in board.top(now=now + 2 * HOUR)] == ["Bia"]
+    assert len(board) == 1
+
+
+def test_leaderboards_filter_by_period_and_difficulty():
+    """Garante os tops de 24h e 7 dias com filtros."""
+    now = time.time()
+    entries = [
+        _entry("Ana", 100, now - 2 * HOUR),
+        _entry("Bia", 800, now - 3 * 24 * HOUR, "Difícil"),
+        _entry("Caio", 400, now - 10 * 24 * HOUR),
+    ]
+    boards = Leaderboards(entries, now)
+    boards.add(_entry("Duda", 200, now), now)
+
+    assert [e["name"] for e in boards.top("day")] == ["Duda", "Ana"]
+    assert [e["name"] for e in boards.top("week")] == ["Bia", "Duda", "Ana"]
+    assert boards.top("week", difficulty="Difícil")[0]["name"] == "Bia"
+
+
+def test_legacy_dates_use_one_reference_time():
+    """Garante que registros antigos (só ``date``) usam o ``now`` da
+    montagem, sem consultar o relógio a cada registro."""
+    now = datetime(2026, 3, 10, 12, 0).timestamp()
+    legacy = [
+        dict(_entry(f"J{i}", i, None), date="10/03 09:00") for i in range(50)
+    ]
+    legacy.append(dict(_entry("Velho", 999, None), date="01/02 10:00"))
+    for entry in legacy:
+        del entry["ts"]
+
+    with mock.patch.object(score_columns, "datetime", wraps=datetime) as clock:
+        boards = Leaderboards(legacy, now)
+        boards.add(dict(legacy[0], name="Novo", score=100), now)
+    clock.now.assert_not_called()
+
+    assert len(boards.top("day", limit=None, now=now)) == 51
+    assert boards.top("week", now=now)[0]["name"] == "Novo"
+
+
+def test_repository_period_queries(tmp_path):
+    """Garante timestamps nas partidas novas e ranking por período."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    old = _entry("Antigo", 999, time.time() - 30 * 24 * HOUR)
+    repository._save_file([old])
+
+    repository.get_top_scores(period="day")  # Constrói os rankings
+    repository.save_score("Ana", 300, "Animais", "Fácil")
+
+    top = repository.get_top_scores(period="day")
+    assert [e["name"] for e in top] == ["Ana"]
+    assert abs(top[0]["ts"] - time.time()) < 60
+    assert [e["name"] for e in repository.get_top_scores()] == ["Antigo", "Ana"]
+
+
+def test_switching_periods_is_fast_on_large_history(tmp_path):
+    """Garante consultas rápidas a qualquer período em históricos grandes."""
+    now = time.time()
+    n = 100_000
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    repository._save_file(
+        [_entry(f"J{i}", i % 5000, now - (i % 30) * 24 * HOUR) for i in range(n)]
+    )
+    for period in ("day", "week", None):
+        repository.get_top_scores(period=period)  # Aquece os caches
+
+    start = time.perf_counter()
+    for period in ("day", "week", None) * 10:
+        repository.get_top_scores(10, difficulty_filter="Fácil", period=period)
+    assert (time.perf_counter() - start) / 30 < 0.01
+
+
+def test_scores_page_covers_hot_file_and_archive(tmp_path):
+    """Garante páginas do ranking completo, com segmentos e filtros."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    now = time.time()
+    old = [_entry(f"Velho{i}", 1000 + i, now - 90 * 24 * HOUR) for i in range(5)]
+    recent = [
+        _entry(f"Novo{i}", i * 10, now - HOUR, "Difícil" if i % 2 else "Fácil")
+        for i in range(20)
+    ]
+    repository._save_file(old + recent)
+    assert repository.compact(keep_months=1) == 5
+
+    page, total = repository.get_scores_page(0, 7)
+    assert total == 25
+    assert [e["score"] for e in page[:6]] == [1004, 1003, 1002, 1001, 1000, 190]
+
+    page, total = repository.get_scores_page(20, 10)
+    assert (len(page), page[-1]["score"]) == (5, 0)
+
+    page, total = repository.get_scores_page(0, 3, difficulty_filter="Difícil")
+    assert total == 10
+    assert [e["score"] for e in page] == [190, 170, 150]
+
+    _, total = repository.get_scores_page(0, 3, period="day")
+    assert total == 20
+
+    # Sem mudanças no arquivo, a mesma lista atende as próximas páginas
+    view = repository._view
+    repository.get_scores_page(3, 3, period="day")
+    assert repository._view is view
+    repository.save_score("Eva", 5000, "Animais", "Fácil")
+    page, total = repository.get_scores_page(0, 1, period="day")
+    assert (page[0]["name"], total) == ("Eva", 21)
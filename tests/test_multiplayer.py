@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.strategies import MathStrategy
+from src.services.multiplayer_service import MultiPlayerGameService
+
+
+def _pairs(board):
+    """Agrupa as posições do tabuleiro por match_id."""
+    positions = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            positions.setdefault(board.get_card(r, c).match_id, []).append((r, c))
+    return list(positions.values())
+
+
+def test_turn_rotates_through_all_players():
+    """Garante que cada erro passa a vez ao próximo, voltando ao primeiro."""
+    board = Board(4, 4, seed=1)
+    service = MultiPlayerGameService(board, ["A", "B", "C"])
+    pairs = _pairs(board)
+
+    for expected_next in (1, 2, 0):
+        service.pick_card(*pairs[0][0])
+        assert service.pick_card(*pairs[1][0]) == "NO_MATCH"
+        service.hide_cards(pairs[0][0], pairs[1][0])
+        assert service.current_player == expected_next
+
+    assert list(service.player_moves) == [1, 1, 1]
+    assert service.total_moves == 3
+
+
+def test_invalid_pick_keeps_turn_and_counters():
+    """Garante que jogadas inválidas não mexem no turno nem nos contadores."""
+    board = Board(4, 4, seed=1)
+    service = MultiPlayerGameService(board, ["A", "B"])
+    first = _pairs(board)[0][0]
+    service.pick_card(*first)
+    assert service.pick_card(*first) == "INVALID"
+    assert service.current_player == 0
+    assert service.total_moves == 0
+
+
+def test_thirty_players_on_large_board():
+    """Garante uma sala de 30 jogadores num tabuleiro 20x20 até o fim."""
+    board = Board(20, 20, strategy=MathStrategy(), seed=9)
+    players = [f"Aluno {i}" for i in range(30)]
+    service = MultiPlayerGameService(board, players, difficulty_multiplier=1.5)
+    rng = random.Random(4)
+
+    hidden = [(r, c) for r in range(20) for c in range(20)]
+    while not board.all_matched:
+        first, second = rng.sample(hidden, 2)
+        service.pick_card(*first)
+        if service.pick_card(*second) == "MATCH":
+            hidden.remove(first)
+            hidden.remove(second)
+        else:
+            service.hide_cards(first, second)
+
+    assert sum(service.pairs_found) == 200
+    assert service.scores.itemsize * len(service.scores) <= 4 * 30
+    ranking = service.standings()
+    assert sorted(ranking) == list(range(30))
+    assert service.scores[ranking[0]] == max(service.scores)
+
+
+def test_requires_players():
+    """Garante que a partida sem jogadores é rejeitada."""
+    with pytest.raises(ValueError):
+        MultiPlayerGameService(Board(4, 4, seed=1), [])
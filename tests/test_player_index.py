@@ -0,0 +1,105 @@
+from datetime import datetime
+from unittest import mock
+
+from src.infrastructure import player_index
+from src.infrastructure.player_index import PlayerIndex, player_id
+from src.infrastructure.repository import ScoreRepository
+
+TODAY = datetime(2026, 6, 30)
+
+
+def _entry(name, score, date, difficulty="Fácil"):
+    return {
+        "name": name,
+        "score": score,
+        "theme": "Animais",
+        "difficulty": difficulty,
+        "date": date,
+    }
+
+
+ENTRIES = [
+    _entry("Ana", 300, "01/06 10:00"),
+    _entry(" ána ", 500, "02/06 10:00", "Difícil"),
+    _entry("Bia", 400, "03/06 10:00"),
+    _entry("ANA", 100, "04/06 10:00"),
+    _entry("Caio", 200, "05/06 10:00"),
+]
+
+
+def test_player_id_normalizes_names():
+    """Garante que acentos, caixa e espaços não separam jogadores."""
+    assert player_id("  Ána  Maria ") == player_id("ana maria")
+    assert player_id("Bia") != player_id("Ana")
+
+
+def test_personal_best_and_recent_games():
+    """Garante recordes por dificuldade e partidas em ordem cronológica."""
+    index = PlayerIndex(ENTRIES, today=TODAY)
+
+    assert index.total_players == 3
+    assert index.personal_best("ana")["score"] == 500
+    assert index.personal_best("Ana", "Fácil")["score"] == 300
+    assert [g["score"] for g in index.recent_games("Ana", 2)] == [100, 500]
+    assert index.get("Ana").name == "ANA"
+    assert index.personal_best("Ninguém") is None
+
+
+def test_ranks_and_incremental_add():
+    """Garante posições por busca binária, mantidas ao adicionar partidas."""
+    index = PlayerIndex(ENTRIES, today=TODAY)
+
+    assert index.rank_of_score(600) == 1
+    assert index.rank_of_score(400) == 2
+    assert index.rank_of_score(400, "Fácil") == 1
+    assert index.rank_of_player("Bia") == 2
+
+    index.add(_entry("Bia", 900, "06/06 10:00"))
+
+    assert index.rank_of_player("Bia") == 1
+    assert index.rank_of_player("Ana") == 2
+    assert index.rank_of_score(500) == 2
+    assert index.recent_games("Bia", 1)[0]["score"] == 900
+    rebuilt = PlayerIndex(ENTRIES + [_entry("Bia", 900, "06/06 10:00")], TODAY)
+    assert rebuilt._scores == index._scores
+    assert rebuilt._bests == index._bests
+
+
+def test_bulk_build_sorts_once(tmp_path):
+    """Garante que a montagem (inclusive após uma importação) ordena uma vez
+    só, sem inserção binária partida a partida."""
+    entries = [
+        _entry(f"J{i % 300}", i * 7919 % 10_000, f"{i % 28 + 1:02d}/05 10:00")
+        for i in range(20_000)
+    ]
+    with mock.patch.object(player_index, "insort", side_effect=AssertionError):
+        index = PlayerIndex(entries, today=TODAY)
+        assert index.total_players == 300
+
+        repository = ScoreRepository()
+        repository.FILE_PATH = str(tmp_path / "scores.json")
+        repository.save_score("Ana", 1, "Animais", "Fácil")
+        repository.player_index()
+        repository.import_scores(entries[:500])
+        assert repository.player_index().total_players == 301
+
+    ordered = sorted(e["score"] for e in entries)
+    assert index._scores[None] == ordered
+
+
+def test_repository_profile_updates_after_save(tmp_path):
+    """Garante que o perfil inclui partidas novas sem reconstruir o índice."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    repository.save_score("Ana", 100, "Animais", "Fácil")
+    index = repository.player_index()
+
+    repository.save_score("ana", 300, "Animais", "Médio")
+    profile = repository.get_player_profile("ANA")
+
+    assert repository.player_index() is index
+    assert profile["games"] == 2
+    assert profile["best"]["score"] == 300
+    assert profile["rank"] == 1
+    assert repository.get_rank(200) == 2
+    assert repository.get_player_profile("Bia") == {}
@@ -0,0 +1,102 @@
+import pytest
+
+from src.domain.board import Board
+from src.domain.strategies import ChemistryStrategy
+from src.services.event_log import HIDE, MATCH, NO_MATCH, PICK, GameEventLog
+from src.services.game_service import GameService
+from src.services.replay import GameReplay, ReplayError
+
+
+def _positions_by_pair(board):
+    pairs = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            pairs.setdefault(board.grid[r][c].match_id, []).append((r, c))
+    return list(pairs.values())
+
+
+@pytest.fixture
+def recorded_game():
+    """Partida 4x4 completa com um erro no começo."""
+    board = Board(4, 4, strategy=ChemistryStrategy(), seed=123)
+    log = GameEventLog.for_board(board, difficulty_multiplier=1.5)
+    service = GameService(board, difficulty_multiplier=1.5, event_log=log)
+
+    pairs = _positions_by_pair(board)
+    service.pick_card(*pairs[0][0])
+    service.pick_card(*pairs[1][0])
+    service.hide_cards(pairs[0][0], pairs[1][0])
+    for first, second in pairs:
+        service.pick_card(*first)
+        service.pick_card(*second)
+
+    log.metadata["score"] = service.score
+    return service, log
+
+
+def test_same_seed_deals_same_board():
+    """Garante que a semente reproduz a mesma distribuição de cartas."""
+    a = Board(6, 6, strategy=ChemistryStrategy(), seed=7)
+    b = Board(6, 6, strategy=ChemistryStrategy(), seed=7)
+
+    assert [c.match_id for row in a.grid for c in row] == [
+        c.match_id for row in b.grid for c in row
+    ]
+
+
+def test_event_log_records_picks_results_and_hides(recorded_game):
+    """Garante que cada jogada válida e cada ocultação viram eventos."""
+    service, log = recorded_game
+    kinds = [event.kind for event in log.events]
+
+    assert kinds[:4] == [PICK, NO_MATCH, HIDE, HIDE]
+    assert kinds.count(MATCH) == 8
+    assert service.pick_card(0, 0) == "INVALID"
+    assert len(log.events) == 20
+
+
+def test_replay_reconstructs_final_state(recorded_game, tmp_path):
+    """Garante que o replay (após salvar/carregar) chega ao mesmo estado."""
+    service, log = recorded_game
+    path = tmp_path / "replay.json"
+    log.save(str(path))
+
+    replayed = GameReplay(GameEventLog.load(str(path))).verify()
+
+    assert replayed.score == service.score
+    assert replayed.moves == service.moves
+    assert replayed.board.all_matched
+
+
+def test_seek_backwards_rebuilds_intermediate_state(recorded_game):
+    """Garante que é possível voltar a um ponto anterior da partida."""
+    _, log = recorded_game
+    replay = GameReplay(log)
+    replay.seek(len(log.events))
+
+    state = replay.seek(2)
+    assert state.moves == 1
+    assert state.combo_streak == 0
+    assert not state.board.all_matched
+
+
+def test_tampered_log_is_rejected(recorded_game):
+    """Garante que um registro adulterado não passa na auditoria."""
+    _, log = recorded_game
+    log.metadata["score"] += 100
+
+    with pytest.raises(ReplayError):
+        GameReplay(log).verify()
+
+
+def test_play_waits_scaled_by_speed(recorded_game):
+    """Garante que a velocidade de reprodução divide as esperas."""
+    _, log = recorded_game
+    for i, event in enumerate(log.events):
+        log.events[i] = event._replace(t_ms=i * 100)
+
+    waits = []
+    events = list(GameReplay(log).play(speed=4.0, sleep=waits.append))
+
+    assert len(events) == len(log.events)
+    assert waits == [pytest.approx(0.025)] * (len(log.events) - 1)
@@ -0,0 +1,148 @@
+import json
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.strategies import ChemistryStrategy
+from src.infrastructure.replay_store import (
+    ReplayArchive,
+    ReplayWriter,
+    decode_log,
+    encode_log,
+    read_replay,
+    stream_events,
+)
+from src.services.event_log import GameEventLog
+from src.services.game_service import GameService
+from src.services.replay import GameReplay, ReplayError
+
+
+def _play(seed, sink_path=None):
+    """Joga uma partida 6x6 completa (com alguns erros) e devolve o registro."""
+    board = Board(6, 6, strategy=ChemistryStrategy(), seed=seed)
+    log = GameEventLog.for_board(board)
+    writer = ReplayWriter(sink_path, log) if sink_path else None
+    log.sink = writer
+    service = GameService(board, event_log=log)
+
+    pairs = {}
+    for r in range(6):
+        for c in range(6):
+            pairs.setdefault(board.grid[r][c].match_id, []).append((r, c))
+    pairs = list(pairs.values())
+
+    for i, (first, second) in enumerate(pairs):
+        if i + 1 < len(pairs):
+            service.pick_card(*first)
+            service.pick_card(*pairs[i + 1][0])
+            service.hide_cards(first, pairs[i + 1][0])
+        service.pick_card(*first)
+        service.pick_card(*second)
+
+    # Tempos realistas e com variação, independentes do relógio do teste
+    for i, event in enumerate(log.events):
+        log.events[i] = event._replace(t_ms=i * 731)
+    if writer:
+        writer.close({"score": service.score})
+    return log
+
+
+def test_binary_roundtrip_preserves_events():
+    """Garante que codificar e decodificar devolve os mesmos eventos."""
+    log = _play(seed=1)
+    decoded = decode_log(encode_log(log))
+
+    assert decoded.events == log.events
+    assert decoded.layout == log.layout
+    assert decoded.seed == log.seed
+
+
+def test_events_are_much_smaller_than_json():
+    """Garante que os eventos ocupam poucos bytes cada."""
+    log = _play(seed=2)
+    header_only = GameEventLog.from_header(log.header())
+
+    binary_events = len(encode_log(log)) - len(encode_log(header_only))
+    json_events = len(json.dumps([list(e) for e in log.events]))
+
+    assert binary_events / len(log.events) <= 4
+    assert binary_events * 4 < json_events
+
+
+def test_incremental_writer_can_be_streamed(tmp_path):
+    """Garante que o arquivo escrito durante a partida é lido em stream."""
+    path = tmp_path / "game.mgr"
+    log = _play(seed=3, sink_path=str(path))
+
+    streamed = list(stream_events(str(path), chunk_size=7))
+
+    assert [(e.kind, e.row, e.col) for e in streamed] == [
+        (e.kind, e.row, e.col) for e in log.events
+    ]
+    assert read_replay(str(path)).layout == log.layout
+
+
+def test_game_in_progress_is_readable(tmp_path):
+    """Garante que o arquivo de uma partida em andamento já é legível."""
+    path = tmp_path / "game.mgr"
+    path.write_bytes(b"MG")  # Criado, assinatura ainda pela metade
+    assert list(stream_events(str(path))) == []
+
+    log = _play(seed=6)
+    live = GameEventLog.from_header(log.header())
+    live.sink = writer = ReplayWriter(str(path), live)
+    assert list(stream_events(str(path))) == []
+    for event in log.events[:5]:
+        live.append(*event)
+    # Sem fechar o arquivo: os eventos já estão no disco
+    assert list(stream_events(str(path))) == log.events[:5]
+    writer.close()
+
+
+def test_trailer_score_is_verified(tmp_path):
+    """Garante que a pontuação final gravada no fim do replay é auditada."""
+    path = tmp_path / "game.mgr"
+    log = _play(seed=5, sink_path=str(path))
+    score = GameReplay(log).verify().score
+
+    loaded = read_replay(str(path))
+    assert loaded.metadata["score"] == score
+    GameReplay(loaded).verify()
+
+    streamed = {}
+    assert len(list(stream_events(str(path), 5, streamed))) == len(log.events)
+    assert streamed == {"score": score}
+
+    # Arquivo gravado com outra pontuação no trailer
+    ReplayWriter(str(path), log).close({"score": score + 100})
+    with pytest.raises(ReplayError):
+        GameReplay(read_replay(str(path))).verify()
+
+
+def test_stream_ignores_truncated_last_event(tmp_path):
+    """Garante que um arquivo cortado no meio de um evento ainda é legível."""
+    path = tmp_path / "game.mgr"
+    data = encode_log(_play(seed=4))
+    path.write_bytes(data[:-1])
+
+    assert len(list(stream_events(str(path)))) > 0
+
+
+def test_archive_random_access_by_index(tmp_path):
+    """Garante acesso direto a qualquer partida e evento do arquivo."""
+    archive = ReplayArchive(str(tmp_path / "venue.mga"))
+    logs = [_play(seed=s) for s in range(5)]
+    for log in logs:
+        archive.append(log)
+
+    reopened = ReplayArchive(str(tmp_path / "venue.mga"))
+    assert len(reopened) == 5
+    assert reopened.get(3).events == logs[3].events
+    assert reopened.event_at(4, 10) == logs[4].events[10]
+    assert [reopened.event_at(2, i) for i in range(len(logs[2].events))] == (
+        logs[2].events
+    )
+    with pytest.raises(IndexError):
+        reopened.event_at(2, len(logs[2].events))
+    with pytest.raises(IndexError):
+        reopened.get(5)
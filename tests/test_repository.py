@@ -0,0 +1,342 @@
+import json
+import multiprocessing
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure import repository as repository_module
+from src.infrastructure.repository import ScoreRepository, salvage_records
+
+
+def _repository(tmp_path):
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    return repository
+
+
+def _save_many(path, worker, count):
+    """Processo do teste de concorrência: grava ``count`` partidas."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = path
+    for i in range(count):
+        repository.save_score(f"P{worker}-{i}", i, "Animais", "Fácil")
+
+
+def test_save_is_atomic_and_rotates_backups(tmp_path):
+    """Garante gravação sem temporário sobrando e backups das versões."""
+    repository = _repository(tmp_path)
+    for i in range(5):
+        assert repository.save_score(f"J{i}", i * 10, "Animais", "Fácil")
+
+    path = repository.FILE_PATH
+    assert not os.path.exists(path + ".tmp")
+    with open(path + ".1", encoding="utf-8") as f:
+        assert len(json.load(f)) == 4
+    with open(path + ".3", encoding="utf-8") as f:
+        assert len(json.load(f)) == 2
+    assert not os.path.exists(path + ".4")
+
+
+def test_salvage_records_from_truncated_text():
+    """Garante que os registros completos antes do corte são recuperados."""
+    entries = [
+        {"name": f"J{i}", "score": i, "theme": "Animais", "difficulty": "Fácil"}
+        for i in range(3)
+    ]
+    text = json.dumps(entries, indent=4)
+    cut = text.rfind('"name"')
+
+    assert salvage_records(text[:cut]) == entries[:2]
+    assert salvage_records(text) == entries
+    assert salvage_records("lixo") == []
+
+
+def test_truncated_file_is_recovered_with_backup(tmp_path):
+    """Garante que um arquivo cortado não apaga o histórico."""
+    repository = _repository(tmp_path)
+    for i in range(6):
+        repository.save_score(f"J{i}", i * 10, "Animais", "Fácil")
+
+    path = repository.FILE_PATH
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text[: len(text) // 2])
+
+    # J5 (o maior score) só existe no começo do arquivo cortado; o resto
+    # vem do backup
+    names = [d["name"] for d in repository.get_top_scores(limit=100)]
+    assert names == [f"J{i}" for i in reversed(range(6))]
+    # Consultas não gravam nem imprimem: o problema vai para diagnostics
+    assert not os.path.exists(path + ".corrupt")
+    assert repository.diagnostics() == [
+        f"{path} corrompido: 6 registros recuperados"
+    ]
+
+    # A próxima gravação preserva o corrompido e persiste o recuperado
+    repository.save_score("Novo", 1, "Animais", "Fácil")
+    assert os.path.exists(path + ".corrupt")
+    assert repository.diagnostics() == []
+    with open(path, encoding="utf-8") as f:
+        assert len(json.load(f)) == 7
+
+
+def test_non_list_json_is_treated_as_corrupt(tmp_path, capsys):
+    """Garante que JSON válido mas sem formato de histórico não quebra as
+    consultas e só é regravado pelo reparo."""
+    from src.infrastructure import scores_cli
+
+    repository = _repository(tmp_path)
+    for name, score in (("Ana", 10), ("Bia", 20), ("Caio", 30)):
+        repository.save_score(name, score, "Animais", "Fácil")
+    path = repository.FILE_PATH
+    # O reparo usa o backup mais recente (Ana e Bia)
+
+    for text in ("{}", "[1, 2]", '[{"score": "10"}, {"score": 5}]'):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        assert [d["name"] for d in repository.get_top_scores()] == ["Bia", "Ana"]
+        assert repository.get_statistics()["total_games"] == 2
+        assert len(repository.diagnostics()) == 1
+    with open(repository.summary_path, "w", encoding="utf-8") as f:
+        f.write("[]")
+    assert len(repository.diagnostics()) == 2
+    assert capsys.readouterr().out == ""
+
+    assert scores_cli.main(["--file", path, "repair"]) == 0
+    assert "Histórico reparado" in capsys.readouterr().out
+    assert repository.diagnostics() == []
+    with open(path, encoding="utf-8") as f:
+        assert [d["name"] for d in json.load(f)] == ["Bia", "Ana"]
+    with open(path + ".corrupt", encoding="utf-8") as f:
+        assert f.read() == '[{"score": "10"}, {"score": 5}]'
+    with open(repository.summary_path, encoding="utf-8") as f:
+        assert json.load(f) == {}
+
+
+def test_save_stays_fast(tmp_path):
+    """Garante que a gravação segura custa poucos milissegundos."""
+    repository = _repository(tmp_path)
+    runs = 20
+    start = time.perf_counter()
+    for i in range(runs):
+        repository.save_score("Ana", i, "Animais", "Fácil")
+    assert (time.perf_counter() - start) / runs < 0.05
+
+
+def _entry(name, score, date, theme="Animais", difficulty="Fácil"):
+    return {
+        "name": name,
+        "score": score,
+        "theme": theme,
+        "difficulty": difficulty,
+        "date": date,
+    }
+
+
+def test_compaction_keeps_rankings_and_statistics(tmp_path):
+    """Garante que arquivar meses antigos não muda ranking nem estatísticas."""
+    repository = _repository(tmp_path)
+    combos = [("Animais", "Fácil"), ("Química", "Médio"), ("Espaço", "Difícil")]
+    entries = [
+        _entry(f"J{i}", i * 7 % 50, f"10/{i % 6 + 1:02d} 12:00", theme=t, difficulty=d)
+        for i, (t, d) in enumerate(combos * 20 + combos[:1])
+    ]
+    repository._save_file(entries)
+    before = repository.get_statistics()
+    tops = {
+        (d, t): repository.get_top_scores(10, difficulty_filter=d, theme_filter=t)
+        for d in (None, "Fácil", "Médio")
+        for t in (None, "Animais", "Química")
+    }
+
+    archived = repository.compact(keep_months=2, today=datetime(2026, 6, 15))
+
+    assert archived > 0
+    assert len(repository._load_file()) == len(entries) - archived
+    assert sorted(os.listdir(repository.archive_dir)) == [
+        "2026-01.json",
+        "2026-02.json",
+        "2026-03.json",
+        "2026-04.json",
+    ]
+    assert repository.get_statistics() == before
+    for (d, t), top in tops.items():
+        after = repository.get_top_scores(10, difficulty_filter=d, theme_filter=t)
+        assert [e["score"] for e in after] == [e["score"] for e in top]
+
+
+def test_compaction_is_idempotent_and_summary_rebuilds(tmp_path):
+    """Garante que repetir a compactação ou perder o resumo não altera nada."""
+    repository = _repository(tmp_path)
+    repository._save_file([_entry("Ana", 10, "01/01 10:00")])
+    today = datetime(2026, 5, 1)
+
+    assert repository.compact(today=today) == 1
+    # Simula queda antes de regravar o arquivo principal
+    repository._save_file([_entry("Ana", 10, "01/01 10:00")])
+    assert repository.compact(today=today) == 1
+    assert repository.get_statistics()["total_games"] == 1
+
+    with open(repository.summary_path, "w", encoding="utf-8") as f:
+        f.write("{")
+    assert repository.get_statistics()["total_games"] == 1
+    # Consultas não gravam: o resumo só é refeito pela compactação
+    with open(repository.summary_path, encoding="utf-8") as f:
+        assert f.read() == "{"
+    assert repository.compact(today=today) == 0
+    with open(repository.summary_path, encoding="utf-8") as f:
+        assert json.load(f)["2026-01"]["games"] == 1
+
+
+@pytest.mark.skipif(repository_module.fcntl is None, reason="requer fcntl")
+def test_concurrent_processes_do_not_lose_scores(tmp_path):
+    """Garante que vários processos gravando juntos não perdem partidas."""
+    path = str(tmp_path / "scores.json")
+    workers, per_worker = 6, 15
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_save_many, args=(path, w, per_worker))
+        for w in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    repository = ScoreRepository()
+    repository.FILE_PATH = path
+    names = {d["name"] for d in repository.get_top_scores(limit=1000)}
+    assert len(names) == workers * per_worker
+
+
+def test_reader_reparses_only_after_change(tmp_path):
+    """Garante que leituras repetidas não relêem o arquivo inalterado."""
+    reader = _repository(tmp_path)
+    writer = _repository(tmp_path)
+    writer.save_score("Ana", 10, "Animais", "Fácil")
+
+    calls = []
+    parse = reader._parse_file
+    reader._parse_file = lambda: calls.append(1) or parse()
+
+    # Gravações do próprio processo já atualizam o cache
+    for _ in range(5):
+        reader.get_top_scores()
+        reader.get_statistics()
+    writer.save_score("Bia", 20, "Animais", "Fácil")
+    assert reader.get_top_scores()[0]["name"] == "Bia"
+    assert calls == []
+
+    # Mudança feita por fora (outro processo) é detectada pelo stat
+    entries = [{"name": "Caio", "score": 5, "theme": "T", "difficulty": "D"}]
+    with open(reader.FILE_PATH, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+    assert reader.get_top_scores() == entries
+    assert reader.get_top_scores() == entries
+    assert len(calls) == 1
+
+
+def test_cached_reads_are_fast(tmp_path):
+    """Garante que consultas repetidas não pagam o parse do JSON."""
+    repository = _repository(tmp_path)
+    repository._save_file(
+        [
+            {"name": f"J{i}", "score": i, "theme": "T", "difficulty": "D"}
+            for i in range(5000)
+        ]
+    )
+    repository.get_statistics()
+    runs = 50
+    start = time.perf_counter()
+    for _ in range(runs):
+        repository._load_file()
+    assert (time.perf_counter() - start) / runs < 0.002
+
+
+def test_iter_records_streams_json_and_jsonl(tmp_path):
+    """Garante leitura em blocos pequenos de lista JSON, JSONL e truncados."""
+    entries = [
+        {"name": f"Ana {i}", "score": i, "theme": "Química", "difficulty": "Fácil"}
+        for i in range(50)
+    ]
+    as_list = tmp_path / "scores.json"
+    as_list.write_text(json.dumps(entries, indent=4), encoding="utf-8")
+    as_lines = tmp_path / "scores.jsonl"
+    as_lines.write_text(
+        "\n".join(json.dumps(e, ensure_ascii=False) for e in entries),
+        encoding="utf-8",
+    )
+    truncated = tmp_path / "cortado.json"
+    truncated.write_text(json.dumps(entries)[:-40], encoding="utf-8")
+
+    assert list(repository_module.iter_records(str(as_list), 7)) == entries
+    assert list(repository_module.iter_records(str(as_lines), 7)) == entries
+    assert list(repository_module.iter_records(str(truncated), 7)) == entries[:-1]
+
+
+def test_import_deduplicates_across_machines(tmp_path):
+    """Garante que partidas repetidas (aqui, no arquivo morto ou entre
+    máquinas) não são importadas de novo."""
+    central = _repository(tmp_path)
+    old = {"name": "Velho", "score": 50, "theme": "Animais", "difficulty": "Fácil"}
+    central._save_file([dict(old, date="10/01 10:00", ts=1.0)])
+    assert central.compact(keep_months=1, today=datetime(1970, 3, 1)) == 1
+    central.save_score("Ana", 100, "Animais", "Fácil")
+    mine = central._load_file()[0]
+
+    machine = tmp_path / "maquina01.json"
+    games = [
+        mine,  # Já está no arquivo central
+        dict(old, date="10/01 10:00", ts=1.0),  # Já arquivada
+        dict(mine, name="Bia", ts=2.0),
+        dict(mine, name="Bia", ts=3.0),
+        {
+            "name": "Caio",
+            "score": 10,
+            "theme": "Espaço",
+            "difficulty": "Médio",
+            "date": "01/01 00:00",
+        },
+        # Inválidos: contados e ignorados, sem interromper a importação
+        dict(mine, name="Duda", score="900"),
+        dict(mine, name=["Eva"]),
+        dict(mine, name="Fábio", score=True),
+        42,
+    ]
+    machine.write_text(json.dumps(games), encoding="utf-8")
+
+    def read():
+        return repository_module.iter_records(str(machine), records_only=False)
+
+    assert central.import_scores(read()) == (3, 2, 4)
+    assert central.import_scores(read()) == (0, 5, 4)
+    assert sum(1 for _ in central.iter_entries()) == 5
+    assert len(list(repository_module.iter_records(str(machine)))) == 5
+
+
+def test_cli_export_and_import_round_trip(tmp_path, capsys):
+    """Garante que a exportação JSONL reimporta sem duplicar."""
+    from src.infrastructure import scores_cli
+
+    source = _repository(tmp_path)
+    for i in range(3):
+        source.save_score(f"J{i}", i, "Animais", "Fácil")
+    path = source.FILE_PATH
+    out = tmp_path / "export.jsonl"
+    csv_out = tmp_path / "export.csv"
+
+    assert scores_cli.main(["--file", path, "export", str(out)]) == 0
+    assert scores_cli.main(["--file", path, "export", str(csv_out)]) == 0
+    assert csv_out.read_text(encoding="utf-8").splitlines()[0] == (
+        "name,score,theme,difficulty,date,ts"
+    )
+
+    central = str(tmp_path / "central.json")
+    assert scores_cli.main(["--file", central, "import", str(out), path]) == 0
+    assert "3 partidas importadas, 3 repetidas" in capsys.readouterr().out
+    with open(central, encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
@@ -0,0 +1,139 @@
+import math
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure import score_columns
+from src.infrastructure.repository import ScoreRepository
+from src.infrastructure.score_columns import CATEGORIES, ScoreColumns, entry_timestamp
+
+
+def _entry(name, score, theme, difficulty, date):
+    return {
+        "name": name,
+        "score": score,
+        "theme": theme,
+        "difficulty": difficulty,
+        "date": date,
+    }
+
+
+ENTRIES = [
+    _entry("Ana", 100, "Animais", "Fácil", "05/03 10:00"),
+    _entry("Bia", 300, "Química", "Médio", "20/12 22:15"),
+    _entry("Ana", 200, "Animais", "Médio", "xx"),
+]
+
+
+def _synthetic(n):
+    """Colunas NumPy com ``n`` partidas aleatórias."""
+    np = score_columns.np
+    labels = {k: [f"{k}{i}" for i in range(7)] for k in CATEGORIES}
+    rng = np.random.default_rng(1)
+    codes = {k: rng.integers(0, 7, n, dtype=np.int32) for k in CATEGORIES}
+    return ScoreColumns(rng.integers(0, 2000, n), np.zeros(n), codes, labels)
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    """Roda o teste com NumPy (se instalado) e com o fallback ``array``."""
+    if request.param == "numpy" and score_columns.np is None:
+        pytest.skip("NumPy não instalado")
+    if request.param == "array":
+        monkeypatch.setattr(score_columns, "np", None)
+    return request.param
+
+
+def test_aggregations_match_entries(backend):
+    """Garante contagens, melhor score, percentis e médias corretas."""
+    columns = ScoreColumns.from_entries(ENTRIES)
+
+    assert len(columns) == 3
+    assert columns.best_score() == 300
+    assert columns.counts("theme") == {"Animais": 2, "Química": 1}
+    assert columns.counts("difficulty") == {"Fácil": 1, "Médio": 2}
+    assert columns.percentile(50) == 200
+    assert columns.percentile(75) == 250
+    assert columns.player_averages() == {"Ana": 150.0, "Bia": 300.0}
+    assert columns.statistics()["favorite_theme"] == "Animais"
+    assert ScoreColumns.from_entries([]).statistics() == {}
+
+
+def test_timestamps_infer_year():
+    """Garante que datas ainda não alcançadas no ano caem no ano anterior."""
+    today = datetime(2026, 6, 1)
+    march = datetime(2026, 3, 5, 10, 0).timestamp()
+    december = datetime(2025, 12, 20, 22, 15).timestamp()
+
+    assert entry_timestamp(ENTRIES[0], today) == march
+    assert entry_timestamp(ENTRIES[1], today) == december
+    assert math.isnan(entry_timestamp(ENTRIES[2], today))
+
+
+@pytest.mark.skipif(
+    score_columns.np is None, reason="NumPy não instalado (grupo dev/extra analytics)"
+)
+def test_large_history_aggregates():
+    """Garante agregações corretas em históricos grandes (o tempo de 10M
+    linhas é medido em benchmarks/domain_bench.py)."""
+    n = 200_000
+    columns = _synthetic(n)
+
+    stats = columns.statistics()
+    averages = columns.player_averages()
+
+    assert stats["total_games"] == n
+    assert sum(stats["themes_count"].values()) == n
+    assert set(averages) == set(columns.labels["player"])
+
+
+def test_from_entries_mixes_timestamps_and_legacy_dates(backend):
+    """Garante colunas iguais às de ``add`` com ``ts``, datas antigas
+    repetidas e registros vindos de um gerador."""
+    today = datetime(2026, 6, 1)
+    entries = ENTRIES + [dict(ENTRIES[0], ts=123.0), dict(ENTRIES[1])]
+
+    columns = ScoreColumns.from_entries(iter(entries), today)
+    added = ScoreColumns.from_entries([], today)
+    for entry in entries:
+        added.add(entry, today)
+
+    assert list(columns.scores) == [e["score"] for e in entries]
+    stamps = [entry_timestamp(e, today) for e in entries]
+    assert math.isnan(columns.timestamps[2])
+    for got, expected in zip(columns.timestamps, stamps):
+        assert got == expected or math.isnan(expected)
+    assert columns.labels == added.labels
+    for name in CATEGORIES:
+        assert list(columns.codes[name]) == list(added.codes[name])
+
+
+def test_repository_statistics_use_cached_columns(tmp_path):
+    """Garante o mesmo Dashboard e colunas reaproveitadas entre chamadas."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    repository._save_file(ENTRIES)
+
+    stats = repository.get_statistics()
+
+    assert stats["total_games"] == 3
+    assert stats["themes_count"] == {"Animais": 2, "Química": 1}
+    assert repository.load_columns() is repository.load_columns()
+
+
+def test_saved_scores_update_cached_columns(tmp_path, backend):
+    """Garante que gravações acrescentam às colunas em vez de remontá-las."""
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    repository._save_file(list(ENTRIES))
+    columns = repository.load_columns()
+
+    for i in range(20):
+        repository.save_score("Caio" if i % 2 else "Ana", i, "Espaço", "Difícil")
+
+    assert repository.load_columns() is columns
+    rebuilt = ScoreColumns.from_entries(repository._load_file())
+    assert len(columns) == 23
+    assert columns.statistics() == rebuilt.statistics()
+    assert columns.player_averages() == rebuilt.player_averages()
+    assert columns.percentile(90) == rebuilt.percentile(90)
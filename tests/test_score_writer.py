@@ -0,0 +1,72 @@
+import threading
+
+from src.infrastructure.repository import ScoreRepository
+from src.infrastructure.score_writer import ScoreWriter
+
+
+def _repository(tmp_path):
+    repository = ScoreRepository()
+    repository.FILE_PATH = str(tmp_path / "scores.json")
+    return repository
+
+
+def test_writer_saves_in_background_and_acks(tmp_path):
+    """Garante que a pontuação é gravada e o callback confirma."""
+    repository = _repository(tmp_path)
+    writer = ScoreWriter(repository)
+    acks = []
+
+    writer.submit("Ana", 500, "Animais", "Fácil", on_saved=acks.append)
+    assert writer.flush(timeout=5)
+
+    assert acks == [True]
+    assert repository.get_top_scores()[0]["name"] == "Ana"
+    writer.close()
+
+
+def test_writer_does_not_block_caller(tmp_path):
+    """Garante que ``submit`` retorna antes de a gravação terminar."""
+    repository = _repository(tmp_path)
+    release = threading.Event()
+    original = repository.save_score
+
+    def slow_save(*args):
+        release.wait(5)
+        return original(*args)
+
+    repository.save_score = slow_save
+    writer = ScoreWriter(repository)
+    writer.submit("Ana", 100, "Animais", "Fácil")
+
+    assert not writer.flush(timeout=0.05)
+    assert writer.pending == 1
+    release.set()
+    assert writer.flush(timeout=5)
+    writer.close()
+
+
+def test_close_drains_queue(tmp_path):
+    """Garante que fechar o jogo grava tudo o que estava na fila."""
+    repository = _repository(tmp_path)
+    writer = ScoreWriter(repository, max_pending=4)
+
+    for i in range(10):  # Mais que a fila: o excedente grava na hora
+        writer.submit(f"J{i}", i * 10, "Animais", "Fácil")
+    writer.close()
+
+    assert len(repository.get_top_scores(limit=100)) == 10
+
+
+def test_failed_save_acks_false(tmp_path):
+    """Garante que erros de gravação chegam ao callback sem matar a thread."""
+    repository = _repository(tmp_path)
+    repository.FILE_PATH = str(tmp_path / "sem_pasta" / "scores.json")
+    writer = ScoreWriter(repository)
+    acks = []
+
+    writer.submit("Ana", 1, "Animais", "Fácil", on_saved=acks.append)
+    writer.submit("Bia", 2, "Animais", "Fácil", on_saved=acks.append)
+    assert writer.flush(timeout=5)
+
+    assert acks == [False, False]
+    writer.close()
@@ -0,0 +1,119 @@
+import time
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.strategies import ChemistryStrategy
+from src.infrastructure.snapshot import (
+    apply_delta,
+    capture_state,
+    decode_snapshot,
+    encode_delta,
+    encode_snapshot,
+)
+from src.services.game_service import GameService
+from src.services.multiplayer_service import MultiPlayerGameService
+
+
+def _pairs(board):
+    """Agrupa as posições do tabuleiro por match_id."""
+    positions = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            positions.setdefault(board.get_card(r, c).match_id, []).append((r, c))
+    return list(positions.values())
+
+
+def _layout(service):
+    return [
+        (card.match_id, card.display_content, card.is_revealed, card.is_matched)
+        for row in service.board.grid
+        for card in row
+    ]
+
+
+def test_snapshot_round_trip_mid_game():
+    """Garante que o retrato reconstrói tabuleiro, contadores e 1ª carta."""
+    board = Board(6, 6, strategy=ChemistryStrategy(), seed=11)
+    service = GameService(board, difficulty_multiplier=2.7)
+    pairs = _pairs(board)
+    service.pick_card(*pairs[0][0])
+    service.pick_card(*pairs[0][1])
+    service.pick_card(*pairs[1][0])
+
+    restored = decode_snapshot(encode_snapshot(service))
+
+    assert _layout(restored) == _layout(service)
+    assert restored.board.seed == 11
+    assert restored.difficulty_multiplier == 2.7
+    assert (restored.score, restored.moves, restored.combo_streak) == (270, 1, 1)
+    assert restored.first_selected_pos == pairs[1][0]
+    # A partida continua normalmente a partir do retrato
+    assert restored.pick_card(*pairs[1][1]) == "MATCH"
+
+
+def test_multiplayer_snapshot_round_trip():
+    """Garante que nomes, contadores por jogador e vez são preservados."""
+    board = Board(4, 4, seed=2)
+    service = MultiPlayerGameService(board, ["Ana", "Bia", "Caio"])
+    pairs = _pairs(board)
+    service.pick_card(*pairs[0][0])
+    service.pick_card(*pairs[1][0])
+
+    restored = decode_snapshot(encode_snapshot(service))
+
+    assert isinstance(restored, MultiPlayerGameService)
+    assert restored.players == ["Ana", "Bia", "Caio"]
+    assert list(restored.player_moves) == [1, 0, 0]
+    assert restored.current_player == 1
+    assert capture_state(restored) == capture_state(service)
+
+
+def test_delta_replays_game_on_mirror():
+    """Garante que aplicar os deltas mantém uma cópia idêntica à original."""
+    board = Board(4, 4, seed=5)
+    service = MultiPlayerGameService(board, ["Ana", "Bia"])
+    mirror = decode_snapshot(encode_snapshot(service))
+    pairs = _pairs(board)
+
+    sizes = []
+    picks = [pairs[0][0], pairs[0][1], pairs[1][0], pairs[2][0]]
+    for pos in picks:
+        before = capture_state(service)
+        service.pick_card(*pos)
+        delta = encode_delta(before, capture_state(service))
+        sizes.append(len(delta))
+        apply_delta(mirror, delta)
+
+    before = capture_state(service)
+    service.hide_cards(pairs[1][0], pairs[2][0])
+    apply_delta(mirror, encode_delta(before, capture_state(service)))
+
+    assert capture_state(mirror) == capture_state(service)
+    assert max(sizes) <= 12
+    assert encode_delta(before, before) == b"\x00"
+
+
+def test_single_pick_delta_is_a_few_bytes():
+    """Garante que virar a primeira carta custa poucos bytes."""
+    service = GameService(Board(6, 6, seed=1))
+    before = capture_state(service)
+    service.pick_card(5, 5)
+    assert len(encode_delta(before, capture_state(service))) <= 6
+
+
+def test_invalid_snapshot_is_rejected():
+    """Garante que dados sem a assinatura são recusados."""
+    with pytest.raises(ValueError):
+        decode_snapshot(b"nada")
+
+
+def test_snapshot_is_fast():
+    """Garante retratos de 6x6 na casa dos microssegundos."""
+    service = GameService(Board(6, 6, seed=3))
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        encode_snapshot(service)
+    per_call = (time.perf_counter() - start) / runs
+    assert per_call < 0.001
@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.solver import (
+    LEGACY_MULTIPLIERS,
+    fair_difficulty_multiplier,
+    rate_board,
+    score_multiplier,
+    solve,
+)
+from src.services.game_service import GameService
+
+
+def _play_perfect_memory(service: GameService, rng: random.Random) -> None:
+    """Joga uma partida lembrando de todas as cartas vistas."""
+    board = service.board
+    cells = [(r, c) for r in range(board.rows) for c in range(board.cols)]
+    unseen = set(cells)
+    memory = {}  # match_id -> posição da carta vista e ainda sem par
+
+    def flip(pos):
+        unseen.discard(pos)
+        return service.pick_card(*pos)
+
+    while not board.all_matched:
+        # Par já conhecido por inteiro: acerta direto
+        known_pair = next(
+            (pos for pos in memory.values() if isinstance(pos, list)), None
+        )
+        if known_pair:
+            memory.pop(board.get_card(*known_pair[0]).match_id)
+            flip(known_pair[0])
+            flip(known_pair[1])
+            continue
+
+        first = rng.choice(sorted(unseen))
+        flip(first)
+        match_id = board.get_card(*first).match_id
+        if match_id in memory:
+            flip(memory.pop(match_id))
+            continue
+
+        second = rng.choice(sorted(unseen))
+        result = flip(second)
+        if result == "MATCH":
+            continue
+        service.hide_cards(first, second)
+        memory[match_id] = first
+        other = board.get_card(*second).match_id
+        if other in memory:
+            memory[other] = [memory[other], second]
+        else:
+            memory[other] = second
+
+
+def test_small_boards_closed_form():
+    """Garante os valores exatos para 1 e 2 pares com memória perfeita."""
+    assert solve(1).expected_moves == 1.0
+    assert solve(1).expected_score == 100.0
+    assert solve(2).expected_moves == pytest.approx(8 / 3)
+    assert solve(2).expected_mismatches == pytest.approx(2 / 3)
+
+
+def test_matches_simulated_games():
+    """Garante que o modelo prevê jogadas e pontos de partidas simuladas."""
+    rng = random.Random(7)
+    moves, scores = [], []
+    for seed in range(400):
+        service = GameService(Board(4, 4, seed=seed), difficulty_multiplier=1.0)
+        _play_perfect_memory(service, rng)
+        moves.append(service.moves)
+        scores.append(service.score)
+
+    rating = solve(8)
+    assert sum(moves) / len(moves) == pytest.approx(rating.expected_moves, rel=0.05)
+    assert sum(scores) / len(scores) == pytest.approx(rating.expected_score, rel=0.1)
+
+
+def test_bounded_memory_is_harder():
+    """Garante que menos memória significa mais jogadas esperadas."""
+    perfect = solve(18).expected_moves
+    assert solve(18, memory=7).expected_moves > perfect
+    assert solve(18, memory=2).expected_moves > solve(18, memory=7).expected_moves
+
+
+def test_rate_board_counts_revealed_cards_as_known():
+    """Garante que cartas reveladas sem par reduzem as jogadas esperadas."""
+    board = Board(4, 4, seed=1)
+    fresh = rate_board(board)
+    board.get_card(0, 0).reveal()
+    board.get_card(0, 1).reveal()
+    assert rate_board(board).expected_moves < fresh.expected_moves
+
+
+def test_fair_multiplier_and_large_boards():
+    """Garante multiplicador crescente e avaliação de tabuleiros 20x20."""
+    easy = fair_difficulty_multiplier(4, 4)
+    medium = fair_difficulty_multiplier(4, 6)
+    hard = fair_difficulty_multiplier(6, 6)
+    assert easy == 1.0 and easy < medium < hard
+
+    rating = solve(200, memory=7)
+    assert rating.pairs == 200 and rating.expected_moves > 200
+
+
+def test_menu_difficulties_keep_ranking_multipliers():
+    """Garante que as dificuldades do menu não mudam de multiplicador (o
+    histórico do ranking continua comparável)."""
+    assert score_multiplier(4, 4) == 1.0
+    assert score_multiplier(6, 4) == 1.5
+    assert score_multiplier(6, 6) == 2.0
+    assert score_multiplier(8, 8) == fair_difficulty_multiplier(8, 8)
+    assert (8, 8) not in LEGACY_MULTIPLIERS
@@ -0,0 +1,74 @@
+import csv
+from types import SimpleNamespace
+
+from src.infrastructure import telemetry
+from src.infrastructure.telemetry import FrameProfiler
+
+
+def _record(profiler, **phases_ms):
+    # Injeta tempos conhecidos sem depender do relógio
+    profiler.begin_frame()
+    profiler._current = dict(phases_ms)
+    profiler.frames.append(profiler._current)
+    profiler.frame_count += 1
+
+
+def test_phase_accumulates_within_frame():
+    """Garante que a mesma fase medida duas vezes no frame é somada."""
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    with profiler.phase("board"):
+        pass
+    first = profiler._current["board"]
+    with profiler.phase("board"):
+        pass
+    profiler.end_frame()
+
+    assert profiler.frames[-1]["board"] >= first
+    assert "total" in profiler.frames[-1]
+
+
+def test_percentiles_over_rolling_window():
+    """Garante que os percentis usam apenas os últimos frames da janela."""
+    profiler = FrameProfiler(window=100)
+    for _ in range(50):
+        _record(profiler, board=1000.0)
+    for i in range(100):
+        _record(profiler, board=float(i + 1))
+
+    p50, p95, p99 = profiler.percentiles("board")
+    assert (p50, p95, p99) == (51.0, 95.0, 99.0)
+    assert profiler.percentiles("flip") == (0.0, 0.0, 0.0)
+
+
+def test_dump_csv_writes_one_row_per_frame(tmp_path):
+    """Garante que o CSV tem cabeçalho ordenado e uma linha por frame."""
+    profiler = FrameProfiler()
+    for _ in range(3):
+        _record(profiler, flip=1.0, events=2.0, total=3.0)
+
+    path = profiler.dump_csv(str(tmp_path / "frames.csv"))
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ["frame", "events_ms", "flip_ms", "total_ms"]
+    assert len(rows) == 4
+
+
+def test_fps_uses_time_between_frames(monkeypatch):
+    """Garante FPS pelo intervalo entre frames, não pelo trabalho: 2 ms de
+    trabalho a cada 20 ms dão 50 FPS."""
+    clock = iter(range(0, 10_000, 2))
+    fake_time = SimpleNamespace(perf_counter=lambda: next(clock) / 1000)
+    monkeypatch.setattr(telemetry, "time", fake_time)
+    profiler = FrameProfiler()
+    assert profiler.fps() == 0.0
+
+    for _ in range(10):
+        profiler.begin_frame()
+        profiler.end_frame()  # 2 ms de trabalho
+        for _ in range(8):  # Espera do clock.tick até completar 20 ms
+            next(clock)
+
+    assert round(profiler.percentiles("total")[0], 6) == 2.0
+    assert round(profiler.fps()) == 50
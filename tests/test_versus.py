@@ -0,0 +1,78 @@
+from src.domain.board import Board
+from src.services.ai_player import AIController, AIPlayer, AIProfile
+from src.services.versus_service import VersusGameService
+
+
+def _pairs(board):
+    """Agrupa as posições do tabuleiro por match_id."""
+    positions = {}
+    for r in range(board.rows):
+        for c in range(board.cols):
+            positions.setdefault(board.get_card(r, c).match_id, []).append((r, c))
+    return list(positions.values())
+
+
+def test_turn_passes_only_on_mismatch():
+    """Garante que quem acerta continua e quem erra passa a vez."""
+    board = Board(4, 4, seed=3)
+    service = VersusGameService(board, players=("Ana", "PC"))
+    pairs = _pairs(board)
+
+    service.pick_card(*pairs[0][0])
+    assert service.pick_card(*pairs[0][1]) == "MATCH"
+    assert service.current_player == 0
+    assert list(service.scores) == [100, 0]
+
+    service.pick_card(*pairs[1][0])
+    assert service.pick_card(*pairs[2][0]) == "NO_MATCH"
+    service.hide_cards(pairs[1][0], pairs[2][0])
+    assert service.current_player == 1
+    assert list(service.player_moves) == [2, 0]
+
+    service.pick_card(*pairs[1][0])
+    service.pick_card(*pairs[1][1])
+    assert list(service.scores) == [80, 100]
+    assert list(service.combos) == [0, 1]
+    assert service.winner() == 1
+
+
+def test_perfect_memory_ai_uses_what_it_saw():
+    """Garante que a IA sem esquecimento acerta um par que já viu."""
+    board = Board(4, 4, seed=5)
+    ai = AIPlayer(AIProfile("Teste", memory_decay=0.0, latency_ms=0), seed=1)
+    first, second = _pairs(board)[0]
+    ai.observe(*first, board.get_card(*first).match_id)
+    ai.observe(*second, board.get_card(*second).match_id)
+
+    pick = ai.choose(board)
+    assert pick in (first, second)
+    board.get_card(*pick).reveal()
+    assert ai.choose(board, first_pos=pick) == (second if pick == first else first)
+
+
+def test_ai_forgets_with_strong_decay():
+    """Garante que lembranças antigas somem com esquecimento alto."""
+    board = Board(4, 4, seed=5)
+    ai = AIPlayer(AIProfile("Teste", memory_decay=50.0, latency_ms=0), seed=1)
+    ai.observe(0, 0, board.get_card(0, 0).match_id)
+    for _ in range(4):
+        ai.observe(3, 3, board.get_card(3, 3).match_id)
+
+    ai.choose(board)
+    assert (0, 0) not in ai.memory
+
+
+def test_controller_waits_for_reaction_time():
+    """Garante que o computador só joga na sua vez e após o tempo de reação."""
+    board = Board(4, 4, seed=2)
+    service = VersusGameService(board)
+    ai = AIPlayer(AIProfile("Teste", memory_decay=0.0, latency_ms=500), seed=1)
+    controller = AIController(ai, service)
+
+    assert controller.update(0) is None  # vez do humano
+    service.current_player = 1
+    assert controller.update(1000) is None  # agenda a jogada
+    assert controller.update(1499) is None
+    assert controller.update(1200, busy=True) is None
+    assert controller.update(2000) is None  # reagenda após ficar ocupado
+    assert controller.update(2500) is not None